@@ -0,0 +1,159 @@
+"""
+Local cache for remote page assets (Lottie animations).
+
+Pages never wait on the network: ``get`` answers from the in-process copy,
+then the on-disk cache, then the copy bundled under ``assets/``. Missing or
+stale entries (older than ``ttl``) are refreshed in a background thread with
+a conditional request (ETag / Last-Modified), so a slow CDN or an air-gapped
+deployment only ever means "serve what we already have".
+"""
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+CACHE_DIR = os.path.join(".cache", "assets")
+TTL = 24 * 60 * 60
+FETCH_TIMEOUT = 5
+RETRY_AFTER = 60  # seconds to wait after a failed refresh before trying the network again
+
+
+@dataclass(frozen=True)
+class Asset:
+    url: str
+    kind: str = "json"          # "json" or "text"
+    bundled: str = None         # fallback shipped with the repo
+
+
+ASSETS = {
+    "wonder_things": Asset(
+        "https://lottie.host/b2fc68c4-c4ec-4c44-86f9-5ae6b6e59359/JHQbN7Vvq5.json",
+        bundled=os.path.join("assets", "lottie", "wonder_things.json"),
+    ),
+}
+
+
+class AssetCache:
+    def __init__(self, assets=ASSETS, cache_dir=CACHE_DIR, ttl=TTL, timeout=FETCH_TIMEOUT):
+        self.assets = assets
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.timeout = timeout
+        self._memory = {}          # name -> (content, fetched_at)
+        self._refreshing = set()
+        self._failed_at = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """Cached content for ``name`` (parsed JSON or text), or None if nothing is available yet."""
+        entry = self._memory.get(name)
+        if entry is None:
+            entry = self._load_local(name)
+        if entry is None or time.time() - entry[1] > self.ttl:
+            self.refresh_async(name)
+        return entry[0] if entry else None
+
+    # -----------------------------
+    # LOCAL TIERS
+    # -----------------------------
+    def _paths(self, name):
+        base = os.path.join(self.cache_dir, name)
+        return base + ".body", base + ".meta.json"
+
+    def _parse(self, name, raw):
+        return json.loads(raw) if self.assets[name].kind == "json" else raw.decode("utf-8")
+
+    def _load_local(self, name):
+        body_path, meta_path = self._paths(name)
+        entry = None
+        try:
+            with open(body_path, "rb") as fh:
+                content = self._parse(name, fh.read())
+            with open(meta_path) as fh:
+                entry = (content, json.load(fh).get("fetched_at", 0))
+        except (OSError, ValueError):
+            bundled = self.assets[name].bundled
+            if bundled and os.path.exists(bundled):
+                with open(bundled, "rb") as fh:
+                    # fetched_at=0 -> always considered stale, so a real copy is fetched in the background
+                    entry = (self._parse(name, fh.read()), 0)
+        if entry is not None:
+            self._memory[name] = entry
+        return entry
+
+    # -----------------------------
+    # BACKGROUND REFRESH
+    # -----------------------------
+    def refresh_async(self, name):
+        with self._lock:
+            if name in self._refreshing or time.time() - self._failed_at.get(name, 0) < RETRY_AFTER:
+                return
+            self._refreshing.add(name)
+        threading.Thread(target=self._refresh, args=(name,), name=f"asset-refresh-{name}", daemon=True).start()
+
+    def _refresh(self, name):
+        try:
+            self.refresh(name)
+        except Exception as e:
+            self._failed_at[name] = time.time()
+            print(f"⚠️ Could not refresh asset '{name}': {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(name)
+
+    def refresh(self, name):
+        """Revalidate one asset against its URL (blocking; normally run via ``refresh_async``)."""
+        import requests
+
+        asset = self.assets[name]
+        body_path, meta_path = self._paths(name)
+        meta = {}
+        if os.path.exists(meta_path) and os.path.exists(body_path):
+            with open(meta_path) as fh:
+                meta = json.load(fh)
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        r = requests.get(asset.url, headers=headers, timeout=self.timeout)
+        now = time.time()
+        if r.status_code == 304:
+            meta["fetched_at"] = now
+            content = self._memory.get(name, (None,))[0]
+        elif r.status_code == 200:
+            content = self._parse(name, r.content)  # validate before replacing the cached copy
+            os.makedirs(self.cache_dir, exist_ok=True)
+            _write_atomic(body_path, r.content)
+            meta = {"url": asset.url, "etag": r.headers.get("ETag"),
+                    "last_modified": r.headers.get("Last-Modified"), "fetched_at": now}
+        else:
+            raise RuntimeError(f"HTTP {r.status_code} from {asset.url}")
+
+        _write_atomic(meta_path, json.dumps(meta).encode())
+        if content is None:
+            content = self._load_local(name)[0]
+        self._memory[name] = (content, now)
+        return content
+
+
+def _write_atomic(path, data):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_asset_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AssetCache()
+    return _cache
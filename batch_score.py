@@ -0,0 +1,203 @@
+"""
+Score a spreadsheet of quiz results from the command line.
+
+Reads a CSV or XLSX of category scores in chunks, maps its columns onto the
+model's features once, predicts each chunk in one vectorized call (optionally
+across a process pool) and streams the rows plus a ``Predicted Career`` column
+to the output file. Uses the same model, label encoder and lookup table as
+``app.py`` via the model registry.
+
+    python batch_score.py students.xlsx scored.csv --chunk-size 20000 --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from model_registry import CATEGORY_FEATURES, ENCODER_PATH, MODEL_PATH, ModelRegistry
+
+CHUNK_SIZE = 10000
+PREDICTION_COLUMN = "Predicted Career"
+
+
+# -----------------------------
+# INPUT
+# -----------------------------
+def iter_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield DataFrames of at most ``chunk_size`` rows without loading the whole file."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    elif ext in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(h) if h is not None else "" for h in next(rows)]
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == chunk_size:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
+        workbook.close()
+    else:
+        raise ValueError(f"Unsupported input type '{ext}'. Use .csv or .xlsx.")
+
+
+def column_mapping(columns, feature_names):
+    """Input column to read for each model feature (None if absent).
+
+    Accepts either the model's own feature names or the quiz category names
+    used in ``user_results.csv`` ("Communication Skills", "Emotional Range", ...).
+    """
+    by_lower = {str(c).strip().lower(): c for c in columns}
+    category_for = {feature: category for category, feature in CATEGORY_FEATURES.items()}
+    mapping = {}
+    for feature in feature_names:
+        candidates = [feature, category_for.get(feature, feature)]
+        mapping[feature] = next((by_lower[c.lower()] for c in candidates if c.lower() in by_lower), None)
+    return mapping
+
+
+def to_matrix(chunk, mapping):
+    """(N, n_features) float array; missing columns and blank cells score 0 like the app does."""
+    X = np.zeros((len(chunk), len(mapping)), dtype=np.float32)
+    for j, column in enumerate(mapping.values()):
+        if column is not None:
+            X[:, j] = pd.to_numeric(chunk[column], errors="coerce").fillna(0).to_numpy()
+    return X
+
+
+# -----------------------------
+# PREDICTION
+# -----------------------------
+_worker_handle = None
+
+
+def _init_worker(model_path, encoder_path):
+    global _worker_handle
+    _worker_handle = ModelRegistry(model_path, encoder_path).handle()
+
+
+def _predict_matrix(X):
+    return _worker_handle.predict_batch(X)
+
+
+# -----------------------------
+# OUTPUT
+# -----------------------------
+class CsvSink:
+    def __init__(self, path):
+        self.path = path
+        self.header_written = False
+
+    def write(self, chunk):
+        chunk.to_csv(self.path, mode="a" if self.header_written else "w", header=not self.header_written, index=False)
+        self.header_written = True
+
+    def close(self):
+        pass
+
+
+class XlsxSink:
+    def __init__(self, path):
+        from openpyxl import Workbook
+
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Predictions")
+        self.header_written = False
+
+    def write(self, chunk):
+        if not self.header_written:
+            self.sheet.append(list(chunk.columns))
+            self.header_written = True
+        for row in chunk.itertuples(index=False):
+            self.sheet.append([None if pd.isna(v) else v.item() if hasattr(v, "item") else v for v in row])
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+def open_sink(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return CsvSink(path)
+    if ext == ".xlsx":
+        return XlsxSink(path)
+    raise ValueError(f"Unsupported output type '{ext}'. Use .csv or .xlsx.")
+
+
+def score_file(input_path, output_path, model_path=MODEL_PATH, encoder_path=ENCODER_PATH,
+               chunk_size=CHUNK_SIZE, workers=0):
+    """Stream ``input_path`` through the model into ``output_path``; returns (rows, seconds)."""
+    handle = ModelRegistry(model_path, encoder_path).handle()
+    if handle is None:
+        raise FileNotFoundError(f"Could not load '{model_path}' / '{encoder_path}'.")
+
+    started = time.perf_counter()
+    chunks = iter_chunks(input_path, chunk_size)
+    sink = open_sink(output_path)
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_path, encoder_path)) if workers > 1 else None
+    mapping, rows = None, 0
+    try:
+        pending = []
+        for chunk in chunks:
+            if mapping is None:
+                # Align columns once, from the header of the first chunk
+                mapping = column_mapping(chunk.columns, handle.feature_names)
+                missing = [f for f, c in mapping.items() if c is None]
+                if missing:
+                    print(f"⚠️ Missing score columns (scored as 0): {', '.join(missing)}", file=sys.stderr)
+
+            X = to_matrix(chunk, mapping)
+            if pool is None:
+                chunk[PREDICTION_COLUMN] = handle.predict_batch(X)
+                sink.write(chunk)
+                rows += len(chunk)
+                continue
+
+            # Keep at most 2x workers chunks in flight so memory stays bounded
+            pending.append((chunk, pool.submit(_predict_matrix, X)))
+            while len(pending) >= 2 * workers:
+                done_chunk, future = pending.pop(0)
+                done_chunk[PREDICTION_COLUMN] = future.result()
+                sink.write(done_chunk)
+                rows += len(done_chunk)
+
+        for done_chunk, future in pending:
+            done_chunk[PREDICTION_COLUMN] = future.result()
+            sink.write(done_chunk)
+            rows += len(done_chunk)
+    finally:
+        sink.close()
+        if pool is not None:
+            pool.shutdown()
+    return rows, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Predict careers for a CSV/XLSX of quiz category scores.")
+    parser.add_argument("input", help="input .csv or .xlsx with one row per student")
+    parser.add_argument("output", help="output .csv or .xlsx (input columns + Predicted Career)")
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--encoder", default=ENCODER_PATH)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=0, help="process pool size (default: score in-process)")
+    args = parser.parse_args(argv)
+
+    rows, seconds = score_file(args.input, args.output, args.model, args.encoder, args.chunk_size, args.workers)
+    rate = rows / seconds if seconds else float("inf")
+    print(f"✅ Scored {rows:,} rows in {seconds:.2f}s ({rate:,.0f} rows/sec) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,301 @@
+"""
+Headless benchmark of the Streamlit pages, built on ``AppTest``.
+
+Runs app.py in a scratch copy of the repo, with the network and model fixed:
+OpenRouter is answered by ``mock_openrouter``, the Lottie animation comes
+from the bundled copy (no background refresh), and if the repo has no
+``career_model_main.pkl`` a small seeded forest is trained for the run. Every
+phase is sampled ``--runs`` times and reported as p50/p95 plus the process
+memory high-water mark after it; results go to a JSON file that ``compare``
+diffs against an earlier run.
+
+Phases: cold start (fresh interpreter -> first Home render), first render of
+each page, one quiz radio click, the predict click, PDF generation through
+the report service (career report and a 20-message transcript) and one chat
+turn.
+
+    python bench_pages.py run --runs 10 --out bench_pages.json
+    python bench_pages.py compare before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+
+MODEL_PATH = "career_model_main.pkl"
+COPY_IGNORE = shutil.ignore_patterns(".git", ".cache", "__pycache__", "*.db", "*.db-wal", "*.db-shm", "bench_*.json")
+USER_INFO = {"name": "Bench Student", "age": 20, "city": "Pune", "state": "Maharashtra", "country": "India",
+             "goal": "Work in AI", "hobbies": "Chess, reading", "email": "bench@example.com", "cgpa": "8.1",
+             "college": "Savitribai Phule Pune University"}
+
+
+def max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def summarize(samples_ms, rss_mb):
+    ordered = sorted(samples_ms)
+    return {
+        "n": len(ordered),
+        "p50_ms": statistics.median(ordered),
+        "p95_ms": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        "mean_ms": statistics.fmean(ordered),
+        "max_ms": ordered[-1],
+        "max_rss_mb": rss_mb,
+    }
+
+
+# -----------------------------
+# FIXTURES
+# -----------------------------
+def prepare_workdir(repo):
+    """Scratch copy of the repo (the app writes its databases and caches next to app.py)."""
+    workdir = tempfile.mkdtemp(prefix="pathpilot-bench-")
+    shutil.copytree(repo, workdir, ignore=COPY_IGNORE, dirs_exist_ok=True)
+    if not os.path.exists(os.path.join(workdir, MODEL_PATH)):
+        train_fixture_model(workdir)
+    return workdir
+
+
+def train_fixture_model(workdir):
+    """Seeded stand-in for the trained forest, with the same features and labels."""
+    import joblib
+    import numpy as np
+    import pandas as pd
+    from sklearn.ensemble import RandomForestClassifier
+
+    from model_registry import CATEGORY_FEATURES
+
+    rng = np.random.default_rng(0)
+    labels = len(joblib.load(os.path.join(workdir, "label_encoder.pkl")).classes_)
+    X = rng.choice([1, 4, 7, 10], size=(6000, len(CATEGORY_FEATURES)))
+    y = np.argmax(X @ rng.normal(size=(X.shape[1], labels)) + rng.normal(scale=8, size=(len(X), labels)), axis=1)
+    model = RandomForestClassifier(n_estimators=100, max_depth=12, random_state=0)
+    model.fit(pd.DataFrame(X, columns=list(CATEGORY_FEATURES.values())), y)
+    joblib.dump(model, os.path.join(workdir, MODEL_PATH))
+
+
+def enter_workdir(workdir):
+    os.chdir(workdir)
+    sys.path.insert(0, workdir)
+    warnings.filterwarnings("ignore")
+
+    import streamlit.logger
+    import streamlit_option_menu
+    from asset_cache import get_asset_cache
+
+    streamlit.logger.set_log_level("error")  # bare-mode context warnings on every AppTest run
+    # The sidebar menu is a custom component AppTest cannot click; pages are picked through this instead
+    streamlit_option_menu.option_menu = lambda title, options, **kwargs: os.environ.get("PATHPILOT_BENCH_PAGE",
+                                                                                        options[0])
+    get_asset_cache().ttl = float("inf")  # serve the bundled Lottie copy without refreshing it
+
+
+def app_test(page, state=None):
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["PATHPILOT_BENCH_PAGE"] = page
+    # from_file resolves relative paths against this file, not the working directory
+    at = AppTest.from_file(os.path.abspath("app.py"), default_timeout=120)
+    at.secrets["OPENROUTER_API_KEY"] = "bench-key"
+    for key, value in (state or {}).items():
+        at.session_state[key] = value
+    return at
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - started) * 1000, result
+
+
+def check(at, phase):
+    if at.exception:
+        raise SystemExit(f"❌ {phase}: {at.exception[0].value}")
+    return at
+
+
+# -----------------------------
+# PHASES
+# -----------------------------
+def bench_cold(workdir, runs):
+    samples, rss = [], 0.0
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "_cold", workdir],
+                             capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        samples.append(result["ms"])
+        rss = max(rss, result["max_rss_mb"])
+    return summarize(samples, rss)
+
+
+def cold_child(workdir):
+    started = time.perf_counter()
+    enter_workdir(workdir)
+    check(app_test("Home").run(), "cold start")
+    print(json.dumps({"ms": (time.perf_counter() - started) * 1000, "max_rss_mb": max_rss_mb()}))
+
+
+def bench_home(runs):
+    samples = [timed(lambda: check(app_test("Home").run(), "home"))[0] for _ in range(runs)]
+    return {"first_render_home": summarize(samples, max_rss_mb())}
+
+
+def bench_quiz(runs):
+    first, click, predict, state = [], [], [], None
+    for _ in range(runs):
+        at = app_test("Quiz", {"user_info": dict(USER_INFO)})
+        first.append(timed(lambda: check(at.run(), "quiz first render"))[0])
+
+        at.radio[0].set_value(at.radio[0].options[0])
+        click.append(timed(lambda: check(at.run(), "quiz radio click"))[0])
+
+        for radio in list(at.radio)[1:]:  # elements from the latest run
+            radio.set_value(radio.options[0])
+        check(at.run(), "quiz answers")
+        button = next(b for b in at.button if "Predict" in b.label)
+        button.click()
+        predict.append(timed(lambda: check(at.run(), "predict click"))[0])
+        state = {key: at.session_state[key] for key in ("predicted_career", "career_path", "user_data", "user_info")}
+    rss = max_rss_mb()
+    return {"first_render_quiz": summarize(first, rss), "quiz_radio_click": summarize(click, rss),
+            "predict_click": summarize(predict, rss)}, state
+
+
+def bench_pdf(runs, quiz_state):
+    from career_catalog import get_career_catalog
+    from career_report import render_report, report_key
+    from chat_export import render_transcript
+    from report_service import DONE, PENDING, RUNNING, get_report_service
+
+    service = get_report_service()
+
+    def render(key, fn, *args):
+        job_id = service.submit(key, fn, *args)
+        while service.status(job_id).state in (PENDING, RUNNING):
+            time.sleep(0.005)
+        if service.status(job_id).state != DONE:
+            raise SystemExit(f"❌ pdf: {service.status(job_id).error}")
+        return service.result(job_id)
+
+    career = get_career_catalog()[quiz_state["predicted_career"]]
+    scores = list(quiz_state["user_data"].iloc[0].items())
+    history = [{"role": "user" if i % 2 == 0 else "assistant", "content": f"Message {i}: " + "lorem ipsum " * 40}
+               for i in range(20)]
+    report, transcript = [], []
+    for i in range(runs):
+        info = dict(USER_INFO, name=f"Bench Student {i} {time.time_ns()}")  # distinct keys: no deduplication
+        report.append(timed(lambda: render(report_key(info, scores, career), render_report, info, scores, career))[0])
+        transcript.append(timed(lambda: render(f"bench-{time.time_ns()}", render_transcript, f"bench-{i}",
+                                               info["name"], history))[0])
+    rss = max_rss_mb()
+    return {"pdf_report": summarize(report, rss), "pdf_transcript": summarize(transcript, rss)}
+
+
+def bench_chat(runs, quiz_state):
+    first, turn = [], []
+    for i in range(runs):
+        at = app_test("Chatbot", dict(quiz_state, warning_acknowledged=True))
+        first.append(timed(lambda: check(at.run(), "chat first render"))[0])
+        at.chat_input[0].set_value(f"What should I learn first? ({i} {time.time_ns()})")  # not in the answer cache
+        turn.append(timed(lambda: check(at.run(), "chat turn"))[0])
+    rss = max_rss_mb()
+    return {"first_render_chatbot": summarize(first, rss), "chat_turn": summarize(turn, rss)}
+
+
+def run(args):
+    repo = os.path.dirname(os.path.abspath(__file__))
+    out = os.path.abspath(args.out)
+    warnings.filterwarnings("ignore")
+    workdir = prepare_workdir(repo)
+    try:
+        from mock_openrouter import start_mock_server
+
+        server, url = start_mock_server(delay=args.chunk_delay)
+        os.environ["OPENROUTER_URL"] = url
+
+        phases = {"cold_start": bench_cold(workdir, args.cold_runs)}
+        enter_workdir(workdir)
+        phases.update(bench_home(args.runs))
+        quiz, quiz_state = bench_quiz(args.runs)
+        phases.update(quiz)
+        phases.update(bench_pdf(args.runs, quiz_state))
+        phases.update(bench_chat(args.runs, quiz_state))
+        server.shutdown()
+    finally:
+        os.chdir(repo)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "runs": args.runs,
+        "cold_runs": args.cold_runs,
+        "phases": phases,
+    }
+    with open(out, "w", encoding="utf-8") as fh:
+        json.dump(result, fh, indent=2)
+    print_table(phases)
+    print(f"💾 {out}")
+    return 0
+
+
+# -----------------------------
+# REPORTING
+# -----------------------------
+def print_table(phases):
+    print(f"{'phase':22} {'p50 ms':>9} {'p95 ms':>9} {'max RSS MB':>11}")
+    for name, p in phases.items():
+        print(f"{name:22} {p['p50_ms']:9.1f} {p['p95_ms']:9.1f} {p['max_rss_mb']:11.1f}")
+
+
+def compare(args):
+    with open(args.before, encoding="utf-8") as fh:
+        before = json.load(fh)["phases"]
+    with open(args.after, encoding="utf-8") as fh:
+        after = json.load(fh)["phases"]
+    print(f"{'phase':22} {'p50 before':>11} {'p50 after':>10} {'change':>8} {'p95 change':>11}")
+    for name in [*before, *(n for n in after if n not in before)]:
+        if name not in before or name not in after:
+            print(f"{name:22} {'(only in ' + ('before' if name in before else 'after') + ')':>31}")
+            continue
+        b, a = before[name], after[name]
+        print(f"{name:22} {b['p50_ms']:11.1f} {a['p50_ms']:10.1f} {a['p50_ms'] / b['p50_ms'] - 1:+8.0%} "
+              f"{a['p95_ms'] / b['p95_ms'] - 1:+11.0%}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Home, Quiz and Chatbot reruns headlessly.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_run = sub.add_parser("run")
+    p_run.add_argument("--runs", type=int, default=10, help="samples per phase")
+    p_run.add_argument("--cold-runs", type=int, default=3, help="fresh interpreters for the cold start")
+    p_run.add_argument("--chunk-delay", type=float, default=0.0, help="seconds between mock SSE chunks")
+    p_run.add_argument("--out", default="bench_pages.json")
+    p_cmp = sub.add_parser("compare")
+    p_cmp.add_argument("before")
+    p_cmp.add_argument("after")
+    p_cold = sub.add_parser("_cold")  # one cold-start sample, run in a fresh interpreter
+    p_cold.add_argument("workdir")
+    args = parser.parse_args(argv)
+
+    if args.command == "_cold":
+        cold_child(args.workdir)
+        return 0
+    return run(args) if args.command == "run" else compare(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,177 @@
+"""
+Career catalog: the description shown for each predicted career.
+
+``careers.json`` holds one entry per label id (description, responsibilities,
+skills, salary bands, growth path, why-it-fits). It is parsed and validated
+once per process into a tuple indexed by label id; each entry's result-page
+markdown is rendered at load time, and the PDF report draws its sections from
+the same entries.
+
+    python career_catalog.py check
+"""
+import json
+import sys
+import threading
+from dataclasses import dataclass, replace
+
+CATALOG_PATH = "careers.json"
+
+# fpdf's core fonts are latin-1 only; keep the PDF readable instead of dropping these
+_PDF_CHARS = str.maketrans({"’": "'", "‘": "'", "“": '"', "”": '"', "–": "-", "—": "-", "→": "->", "₹": "Rs. ",
+                            "…": "..."})
+
+
+class CatalogError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Career:
+    id: int
+    name: str            # label shown to the user and passed to the mentor
+    title: str
+    icon: str
+    description: str
+    responsibilities: tuple
+    skills: tuple
+    salary_bands: tuple
+    salary_note: str
+    growth_path: str
+    why_heading: str
+    why_text: str
+    why_points: tuple
+    markdown: str = ""
+
+    def sections(self):
+        """(heading, text) pairs in display order, shared by the result page and the PDF."""
+        why = "\n".join(filter(None, [self.why_text, *(f"- {p}" for p in self.why_points)]))
+        return [
+            ("Key Responsibilities", _bullets(self.responsibilities)),
+            ("Required Skills", _bullets(self.skills)),
+            ("Salary in India", "\n".join(filter(None, [_bullets(self.salary_bands), self.salary_note]))),
+            ("Career Growth Path", self.growth_path),
+            (self.why_heading, why),
+        ]
+
+    def pdf_sections(self):
+        """Overview plus ``sections()``, with typographic characters mapped to latin-1 friendly ones."""
+        sections = [("Role Overview", self.description)] + self.sections()
+        return [(h.translate(_PDF_CHARS), t.replace("*", "").translate(_PDF_CHARS)) for h, t in sections]
+
+
+def _bullets(items):
+    return "\n".join(f"- {item}" for item in items)
+
+
+def render_markdown(career):
+    parts = [f"**{career.title}** {career.icon}".rstrip(), career.description]
+    parts += [f"**{heading}:**\n{text}" for heading, text in career.sections()]
+    return "\n\n".join(parts)
+
+
+def _text(entry, key, where, required=True):
+    value = entry.get(key, "")
+    if not isinstance(value, str) or (required and not value.strip()):
+        raise CatalogError(f"{where}: '{key}' must be a non-empty string")
+    return value.strip()
+
+
+def _items(entry, key, where, required=True):
+    value = entry.get(key, [])
+    if not isinstance(value, list) or not all(isinstance(v, str) and v.strip() for v in value):
+        raise CatalogError(f"{where}: '{key}' must be a list of non-empty strings")
+    if required and not value:
+        raise CatalogError(f"{where}: '{key}' must not be empty")
+    return tuple(v.strip() for v in value)
+
+
+def parse_entry(entry):
+    """Validate one catalog entry and build its ``Career``."""
+    if not isinstance(entry, dict) or not isinstance(entry.get("id"), int):
+        raise CatalogError(f"Every career needs an integer 'id' (got {entry!r:.60})")
+    where = f"career {entry['id']}"
+    salary = entry.get("salary") or {}
+    why = entry.get("why") or {}
+    career = Career(
+        id=entry["id"],
+        name=_text(entry, "name", where),
+        title=_text(entry, "title", where),
+        icon=_text(entry, "icon", where, required=False),
+        description=_text(entry, "description", where),
+        responsibilities=_items(entry, "responsibilities", where),
+        skills=_items(entry, "skills", where),
+        salary_bands=_items(salary, "bands", f"{where} salary"),
+        salary_note=_text(salary, "note", f"{where} salary", required=False),
+        growth_path=_text(entry, "growth_path", where),
+        why_heading=_text(why, "heading", f"{where} why"),
+        why_text=_text(why, "text", f"{where} why", required=False),
+        why_points=_items(why, "points", f"{where} why", required=False),
+    )
+    if not career.why_text and not career.why_points:
+        raise CatalogError(f"{where}: 'why' needs a 'text' or 'points'")
+    return career
+
+
+class CareerCatalog:
+    def __init__(self, careers):
+        ordered = sorted(careers, key=lambda c: c.id)
+        ids = [c.id for c in ordered]
+        if ids != list(range(len(ordered))):
+            raise CatalogError(f"Career ids must be 0..{len(ordered) - 1} with no gaps or duplicates, got {ids}")
+        self._careers = tuple(ordered)
+        self._by_name = {c.name.lower(): c for c in ordered}
+
+    def __len__(self):
+        return len(self._careers)
+
+    def __iter__(self):
+        return iter(self._careers)
+
+    def __getitem__(self, label_id):
+        """Career for a decoded model label (0-based id)."""
+        label_id = int(label_id)
+        if label_id < 0:
+            raise KeyError(label_id)
+        try:
+            return self._careers[label_id]
+        except IndexError:
+            raise KeyError(label_id) from None
+
+    def by_name(self, name):
+        return self._by_name.get(str(name).strip().lower())
+
+
+def load_catalog(path=CATALOG_PATH):
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    entries = data.get("careers") if isinstance(data, dict) else None
+    if not isinstance(entries, list) or not entries:
+        raise CatalogError(f"{path}: expected a non-empty 'careers' list")
+    careers = []
+    for entry in entries:
+        career = parse_entry(entry)
+        careers.append(replace(career, markdown=render_markdown(career)))
+    return CareerCatalog(careers)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_career_catalog(path=CATALOG_PATH):
+    """Process-wide catalog, loaded and validated on first use."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = load_catalog(path)
+    return _catalog
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["check"]:
+        raise SystemExit("usage: python career_catalog.py check")
+    try:
+        catalog = load_catalog()
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"❌ {e}")
+    print(f"✅ {len(catalog)} careers in {CATALOG_PATH}")
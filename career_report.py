@@ -0,0 +1,334 @@
+"""
+PDF career report for the Quiz page.
+
+``build_report`` renders the report (profile, per-category scores with what
+they mean, and the predicted career's catalog entry) with fpdf2. Almost all
+of it is the same for everyone with the same career, so ``render_report``
+lays that out once per (template version, career, score columns) as a
+``ReportTemplate`` with the user info and score lines left blank, and each
+request only fills those blanks on a copy. It runs in a ``report_service``
+worker process; ``report_key`` hashes everything that ends up in the report
+(user info, scores, career, ``TEMPLATE_VERSION``) so identical requests share
+one render and one cached result.
+
+    python career_report.py bench
+"""
+import argparse
+import copy
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+TEMPLATE_VERSION = 1   # bump whenever the report layout or wording changes
+WORKER_TEMPLATES = 32  # templates kept per worker process
+
+INFO_FIELDS = ("name", "age", "city", "state", "country", "goal", "hobbies")
+
+SECTION_MEANINGS = {
+    "Computer Architecture": (
+        "Understanding of how computers function at the hardware level — CPU, memory, I/O, and data flow.",
+        "Helps you excel in roles like embedded systems, AI infrastructure, or low-level optimization.",
+    ),
+    "Programming Skills": (
+        "Ability to write efficient, logical, and maintainable code in Python, Java, or C++.",
+        "Essential for developers, ML engineers, and backend specialists where logic and clarity rule.",
+    ),
+    "Project Management": (
+        "Skill in planning, scheduling, and delivering projects effectively.",
+        "Critical for roles like Project Manager, Product Lead, and Team Coordinator.",
+    ),
+    "Communication skills": (
+        "Clarity, confidence, and active listening when sharing or presenting ideas.",
+        "Strong communication enables collaboration, leadership, and smooth teamwork.",
+    ),
+    "Openness": (
+        "Curiosity, creativity, and willingness to explore new concepts.",
+        "Encourages innovation — vital in research, design, and AI fields.",
+    ),
+    "Conscientiousness": (
+        "Responsibility, organization, and consistency.",
+        "Predicts reliability and success in structured tech environments.",
+    ),
+    "Extraversion": (
+        "Confidence and sociability in group or leadership settings.",
+        "Useful for leadership, sales engineering, and team collaboration.",
+    ),
+    "Agreeableness": (
+        "Empathy, kindness, and teamwork orientation.",
+        "Enhances collaboration, ideal for customer support or HR-linked roles.",
+    ),
+    "Emotional_Range": (
+        "Emotional control and ability to handle stress.",
+        "Calmness and clarity during challenges help in management and cybersecurity roles.",
+    ),
+    "Conversation": (
+        "Engagement and communication fluency in discussions.",
+        "Strong conversationalists thrive in interviews, consulting, and teamwork.",
+    ),
+    "Openness to Change": (
+        "Adaptability to new tools, ideas, or challenges.",
+        "A must for AI, DevOps, and product innovation roles.",
+    ),
+    "Hedonism": (
+        "Drive for enjoyment and satisfaction in work.",
+        "Inspires creativity — valuable in design, startups, and creative tech sectors.",
+    ),
+    "Self-enhancement": (
+        "Ambition, recognition-seeking, and personal growth.",
+        "Fuels leadership and continuous learning — perfect for entrepreneurs.",
+    ),
+    "Self-transcendence": (
+        "Ethical awareness and community-focused mindset.",
+        "Ideal for AI ethics, healthcare tech, and sustainability-oriented careers.",
+    ),
+}
+
+
+def safe_text(text):
+    """Ensure all text is safe for FPDF and properly encoded."""
+    text = str(text) if text is not None else ""
+    try:
+        return text.encode("latin-1").decode("latin-1")
+    except UnicodeEncodeError:
+        return re.sub(r'[^\x00-\x7F]+', '', text)
+
+
+def section_meaning(column):
+    measures, matters = SECTION_MEANINGS.get(column, (None, None))
+    if measures is None:
+        return "No description available."
+    return f"What it measures:\n{measures}\n\nWhy it matters:\n{matters}"
+
+
+def _pdf_class():
+    from fpdf import FPDF
+    from fpdf.enums import XPos, YPos
+
+    class ReportPDF(FPDF):
+        def header(self):
+            # Header shown on each page
+            self.set_font("Helvetica", "B", 14)
+            self.set_text_color(56, 142, 60)
+            self.cell(0, 10, safe_text("PathPilot – AI Career Insight Report"), new_x=XPos.LMARGIN, new_y=YPos.NEXT,
+                      align="C")
+            self.ln(5)
+
+        def footer(self):
+            # Page footer
+            self.set_y(-15)
+            self.set_font("Helvetica", "I", 8)
+            self.set_text_color(100, 100, 100)
+            self.cell(0, 10, f"Page {self.page_no()}", align="C")
+
+        def section_title(self, title):
+            self.set_font("Helvetica", "B", 12)
+            self.set_text_color(76, 175, 80)
+            self.cell(0, 8, safe_text(title), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.ln(3)
+
+        def section_body(self, body):
+            self.set_font("Helvetica", "", 11)
+            self.set_text_color(33, 33, 33)
+            self.multi_cell(0, 7, safe_text(body))
+            self.ln(3)
+
+    return ReportPDF
+
+
+def info_lines(user_info):
+    return [
+        f"Name: {user_info.get('name', 'N/A')}",
+        f"Age: {user_info.get('age', 'N/A')}",
+        f"Location: {user_info.get('city', '')}, {user_info.get('state', '')}, {user_info.get('country', '')}",
+        f"Career Goal: {user_info.get('goal', 'N/A')}",
+        f"Hobbies: {user_info.get('hobbies', 'N/A')}",
+    ]
+
+
+def score_line(column, value):
+    return f"{column}: {value}/10"
+
+
+def _lay_out(pdf, career, info_body, scores):
+    """Lay out the report; ``scores`` is (column, line) pairs. Returns where the info body and each score line went."""
+    from fpdf.enums import XPos, YPos
+
+    pdf.add_page()
+    pdf.set_auto_page_break(auto=True, margin=15)
+
+    # --- USER INFO ---
+    pdf.section_title("User Information")
+    info_at = (pdf.page, pdf.get_y())
+    pdf.section_body(info_body)
+
+    # --- SCORES ---
+    pdf.section_title("Section Scores & Insights")
+    score_at = []
+    for col, line in scores:
+        pdf.set_font("Helvetica", "B", 11)
+        pdf.set_text_color(46, 125, 50)
+        pdf.cell(0, 7, safe_text(line), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        score_at.append((pdf.page, pdf.get_y() - 7))  # after the cell, which may have started a new page
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_text_color(70, 70, 70)
+        pdf.multi_cell(0, 6, safe_text(section_meaning(col)))
+        pdf.ln(4)
+
+    # --- PREDICTED CAREER ---
+    pdf.section_title("Predicted Career Path")
+    pdf.set_font("Helvetica", "B", 13)
+    pdf.set_text_color(0, 100, 0)
+    pdf.multi_cell(0, 8, safe_text(career.name))
+    pdf.ln(5)
+    for heading, text in career.pdf_sections():
+        pdf.section_title(heading)
+        pdf.section_body(text)
+    pdf.set_font("Helvetica", "", 11)
+    pdf.set_text_color(30, 30, 30)
+    pdf.multi_cell(
+        0, 7,
+        safe_text("This career path aligns closely with your technical and psychological profile. "
+                  "Refer to the app for roadmap, certifications, and real-world project ideas.")
+    )
+    return info_at, score_at
+
+
+def _stamp(pdf):
+    """Generation date below the last line, then the finished document."""
+    pdf.set_y(-20)
+    pdf.set_font("Helvetica", "I", 9)
+    pdf.set_text_color(100, 100, 100)
+    pdf.cell(0, 10, safe_text(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"), align="C")
+    return bytes(pdf.output())
+
+
+def build_report(user_info, scores, career):
+    """Render the career report from scratch; ``scores`` is a sequence of (column, value) pairs."""
+    pdf = _pdf_class()()
+    _lay_out(pdf, career, "\n".join(info_lines(user_info)) + "\n",
+             [(col, score_line(col, val)) for col, val in scores])
+    return _stamp(pdf)
+
+
+class ReportTemplate:
+    """A career's report laid out once with the user info and score lines left blank."""
+
+    def __init__(self, career, columns):
+        self.career = career
+        self.columns = tuple(columns)
+        self._pdf = _pdf_class()()
+        # blank lines take the same height as the real ones, so everything below lands where it would
+        blank_info = "\n".join(" " for _ in info_lines({})) + "\n"
+        self._info_at, self._score_at = _lay_out(self._pdf, career, blank_info, [(col, "") for col in self.columns])
+
+    def fits(self, user_info):
+        """Whether every info line fits on one line (longer ones would push the rest of the report down)."""
+        width = self._pdf.epw - 2 * self._pdf.c_margin
+        self._pdf.set_font("Helvetica", "", 11)
+        return all(self._pdf.get_string_width(safe_text(line)) <= width for line in info_lines(user_info))
+
+    def render(self, user_info, scores):
+        """The filled-in report as bytes; callers check ``fits`` first."""
+        pdf = copy.deepcopy(self._pdf)  # output() finalizes the document, keep the template open
+        pdf.set_auto_page_break(False)
+
+        page, y = self._info_at
+        self._goto(pdf, page)
+        pdf.set_font("Helvetica", "", 11)
+        pdf.set_text_color(33, 33, 33)
+        for i, line in enumerate(info_lines(user_info)):
+            pdf.set_xy(pdf.l_margin, y + 7 * i)
+            pdf.cell(0, 7, safe_text(line))
+
+        pdf.set_font("Helvetica", "B", 11)
+        pdf.set_text_color(46, 125, 50)
+        for (page, y), (col, val) in zip(self._score_at, scores):
+            self._goto(pdf, page)
+            pdf.set_xy(pdf.l_margin, y)
+            pdf.cell(0, 7, safe_text(score_line(col, val)))
+
+        self._goto(pdf, len(pdf.pages))
+        pdf.set_auto_page_break(True, margin=15)
+        return _stamp(pdf)
+
+    @staticmethod
+    def _goto(pdf, page):
+        if pdf.page != page:
+            pdf.page = page
+            pdf.current_font_is_set_on_page = False  # the font is chosen per page content stream
+
+
+_templates = OrderedDict()
+
+
+def render_report(user_info, scores, career):
+    """Career report bytes (report-service job), filled into this worker's template for the career."""
+    scores = list(scores)
+    key = (TEMPLATE_VERSION, career.id, tuple(col for col, _ in scores))
+    template = _templates.pop(key, None) or ReportTemplate(career, key[2])
+    _templates[key] = template
+    while len(_templates) > WORKER_TEMPLATES:
+        _templates.popitem(last=False)
+    if not template.fits(user_info):
+        return build_report(user_info, scores, career)
+    return template.render(user_info, scores)
+
+
+def report_key(user_info, scores, career):
+    """Stable hash of everything that shows up in the report."""
+    payload = {
+        "template": TEMPLATE_VERSION,
+        "info": {field: str(user_info.get(field, "")) for field in INFO_FIELDS},
+        "scores": [[str(col), float(val)] for col, val in scores],
+        "career": career.id,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _sample_profiles(count):
+    columns = list(SECTION_MEANINGS)
+    for i in range(count):
+        user_info = {"name": f"Student {i}", "age": 18 + i % 10, "city": "Pune", "state": "Maharashtra",
+                     "country": "India", "goal": "Find a career I enjoy", "hobbies": "Chess, reading"}
+        yield user_info, [(col, (i + j) % 10 + 1) for j, col in enumerate(columns)]
+
+
+def main(argv=None):
+    from career_catalog import get_career_catalog
+
+    parser = argparse.ArgumentParser(description="Benchmark full report renders against template fills.")
+    parser.add_argument("command", choices=["bench"])
+    parser.add_argument("--reports", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    catalog = get_career_catalog()
+    profiles = list(_sample_profiles(args.reports))
+    careers = [catalog[i % len(catalog)] for i in range(args.reports)]
+
+    started = time.process_time()
+    full = [build_report(info, scores, career) for (info, scores), career in zip(profiles, careers)]
+    full_s = time.process_time() - started
+
+    _templates.clear()
+    started = time.process_time()
+    filled = [render_report(info, scores, career) for (info, scores), career in zip(profiles, careers)]
+    cold_s = time.process_time() - started
+    started = time.process_time()
+    filled = [render_report(info, scores, career) for (info, scores), career in zip(profiles, careers)]
+    warm_s = time.process_time() - started
+
+    pages = [(a.count(b"/Type /Page\n"), b.count(b"/Type /Page\n")) for a, b in zip(full, filled)]
+    if any(a != b for a, b in pages):
+        raise SystemExit(f"❌ page counts differ between full and template renders: {pages}")
+    print(f"{args.reports} reports, {len(_templates)} templates")
+    print(f"full render     {1000 * full_s / args.reports:7.1f} ms CPU/report")
+    print(f"template (cold) {1000 * cold_s / args.reports:7.1f} ms CPU/report")
+    print(f"template (warm) {1000 * warm_s / args.reports:7.1f} ms CPU/report  ({warm_s / full_s:.0%} of full)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
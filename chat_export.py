@@ -0,0 +1,179 @@
+"""
+Chat transcript exports for the AI Career Mentor page.
+
+PDF transcripts are rendered by ``render_transcript`` in a ``report_service``
+worker process; the chat page submits them with the session as affinity, so a
+session's exports always reach the same worker. Each worker keeps a
+``TranscriptExporter`` per chat session: the exporter holds the laid-out
+document for the messages it has already rendered (identified by a digest of
+those messages), so a later export only lays out the new turns and then
+finalizes a copy (text layout is what costs time in fpdf2). Memory is bounded:
+at most ``WORKER_SESSIONS`` layouts per worker, and a transcript longer than
+``CACHE_CHARS`` is laid out once for that export and not kept (large results
+reach the page through the service's temporary file). Markdown / JSONL exports
+are cheap and produced by generators.
+"""
+import copy
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+WORKER_SESSIONS = 16  # exporters kept per worker process
+CACHE_CHARS = 200_000  # longer transcripts are not kept laid out between exports
+
+
+def safe_text(text):
+    """Removes or replaces unsupported characters for compatibility."""
+    try:
+        return text.encode("latin-1").decode("latin-1")
+    except UnicodeEncodeError:
+        # fallback: remove emojis and exotic Unicode characters
+        return re.sub(r'[^\x00-\x7F]+', '', text)
+
+
+def role_label(role):
+    return "You" if role == "user" else "Mentor"
+
+
+# -----------------------------
+# TEXT EXPORTS
+# -----------------------------
+def iter_markdown(history, user_bio=""):
+    """Transcript as Markdown, one chunk per message."""
+    yield "# AI Career Mentor - Chat Summary\n\n"
+    if user_bio:
+        yield "## User Information\n\n" + "\n".join(f"{line}  " for line in user_bio.strip().splitlines()) + "\n\n"
+    yield "## Chat History\n\n"
+    for msg in history:
+        yield f"**{role_label(msg['role'])}:**\n\n{msg['content'].strip()}\n\n"
+    yield f"_Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}_\n"
+
+
+def iter_jsonl(history):
+    """Transcript as JSON Lines, one message per line."""
+    for turn, msg in enumerate(history):
+        yield json.dumps({"turn": turn, "role": msg["role"], "content": msg["content"]}, ensure_ascii=False) + "\n"
+
+
+# -----------------------------
+# PDF EXPORT
+# -----------------------------
+def _pdf_class():
+    from fpdf import FPDF
+    from fpdf.enums import XPos, YPos
+
+    class TranscriptPDF(FPDF):
+        def header(self):
+            self.set_font("Helvetica", "B", 14)
+            self.set_text_color(102, 187, 106)
+            self.cell(0, 10, safe_text("AI Career Mentor - Chat Summary"), new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+            self.ln(5)
+
+        def section_title(self, title):
+            self.set_font("Helvetica", "B", 12)
+            self.set_text_color(76, 175, 80)
+            self.cell(0, 8, safe_text(title), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.ln(3)
+
+        def section_body(self, text):
+            self.set_font("Helvetica", "", 11)
+            self.set_text_color(0, 0, 0)
+            self.multi_cell(0, 7, safe_text(text))
+            self.ln(4)
+
+        def message(self, role, content):
+            self.set_text_color(102, 187, 106) if role == "assistant" else self.set_text_color(33, 33, 33)
+            self.set_font("Helvetica", "B", 11)
+            self.cell(0, 7, safe_text(f"{role_label(role)}:"), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.set_font("Helvetica", "", 11)
+            self.set_text_color(0, 0, 0)
+            self.multi_cell(0, 6, safe_text(content))
+            self.ln(3)
+
+    return TranscriptPDF
+
+
+class TranscriptExporter:
+    """Per-session PDF exporter that lays out each message once."""
+
+    def __init__(self, user_bio):
+        self.user_bio = user_bio
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pdf = None       # laid-out prefix, never finalized
+        self._rendered = 0     # messages already in self._pdf
+        self._digest = None    # history_digest() of those messages
+
+    def _prefix(self):
+        pdf = _pdf_class()()
+        pdf.add_page()
+        pdf.section_title("User Information")
+        pdf.section_body(self.user_bio)
+        pdf.section_title("Chat History")
+        return pdf
+
+    def pdf(self, history):
+        """The transcript PDF as bytes."""
+        with self._lock:
+            if self._pdf is not None and (len(history) < self._rendered
+                                          or history_digest(history[:self._rendered]) != self._digest):
+                self._reset()  # history was cleared or replaced
+            if sum(len(msg["content"]) for msg in history) > CACHE_CHARS:
+                self._reset()
+                pdf = self._prefix()
+                for msg in history:
+                    pdf.message(msg["role"], msg["content"])
+                return _finalize(pdf)
+
+            if self._pdf is None:
+                self._pdf = self._prefix()
+            for msg in history[self._rendered:]:
+                self._pdf.message(msg["role"], msg["content"])
+            self._rendered = len(history)
+            self._digest = history_digest(history)
+
+            # output() finalizes the document, so export a copy and keep the prefix open for new turns
+            return _finalize(copy.deepcopy(self._pdf))
+
+
+def _finalize(pdf):
+    pdf.set_text_color(100, 100, 100)
+    pdf.set_font("Helvetica", "I", 9)
+    pdf.cell(0, 10, safe_text(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"), align="C")
+    return bytes(pdf.output())
+
+
+def history_digest(history):
+    h = hashlib.sha256()
+    for msg in history:
+        h.update(f"{msg['role']}\0{msg['content']}\0".encode())
+    return h.hexdigest()
+
+
+_exporters = OrderedDict()
+
+
+def render_transcript(session_id, user_bio, history):
+    """Transcript PDF bytes (report-service job); reuses this worker's layout for the session if it has one."""
+    exporter = _exporters.pop(session_id, None)
+    if exporter is None or exporter.user_bio != user_bio:
+        exporter = TranscriptExporter(user_bio)
+    _exporters[session_id] = exporter
+    while len(_exporters) > WORKER_SESSIONS:
+        _exporters.popitem(last=False)
+    return exporter.pdf(history)
+
+
+def markdown_getter(history, user_bio=""):
+    history = list(history)
+    return lambda: "".join(iter_markdown(history, user_bio))
+
+
+def jsonl_getter(history):
+    history = list(history)
+    return lambda: "".join(iter_jsonl(history))
@@ -0,0 +1,246 @@
+"""
+Partial-evidence decisions for the career forest: can the rest of the quiz
+still change the prediction?
+
+Every category score is one of 1, 4, 7 or 10 (``lookup_table.LEVELS``), so a
+category that has not been answered yet is one of four values, and each split
+of the forest either lets a level through to the left, to the right, or not
+at all. ``SettledCheck.decide`` takes a score vector in model feature order
+with ``None`` for the unanswered categories and decides exactly whether every
+way of finishing the quiz leads to the same career:
+
+* For every tree, walk only the branches the known scores (and the allowed
+  levels of the unknown ones) can reach. The smallest ``p_k - p_c`` over a
+  tree's reachable leaves, summed over the trees, is a lower bound on how far
+  class ``k`` leads class ``c`` for any completion; if it is positive for
+  every ``c``, ``k`` is settled.
+* Before any of that, a handful of random completions are evaluated: two
+  different careers among them settle "open" without a search, which is the
+  common case early in the quiz.
+* Otherwise split on the unanswered category the ambiguous splits use most
+  (four branches, one per level) and bound each branch again. Branches with
+  at most ``ENUMERATE_LIMIT`` completions are simply evaluated. Two branches
+  settling on different careers prove the answer is still open.
+
+The search visits at most ``MAX_NODES`` branches; past that the answer is
+"unknown", which callers treat like "open".
+
+    python forest_bounds.py bench [--model career_model_main.pkl] [--sessions 200]
+"""
+import argparse
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from lookup_table import LEVELS, decode_indices
+
+SETTLED, OPEN, UNKNOWN = "settled", "open", "unknown"
+MAX_NODES = 256
+ENUMERATE_LIMIT = 256     # completions a branch may have to be evaluated directly (4 unanswered categories)
+WITNESS_SAMPLES = 64      # random completions tried first; disagreement proves "open"
+CACHE_SIZE = 1024
+MARGIN_TOLERANCE = 1e-9   # bounds closer than this to a tie are not trusted to settle it
+ALL_LEVELS = (1 << len(LEVELS)) - 1
+LEVEL_BIT = {level: 1 << i for i, level in enumerate(LEVELS)}
+BIT_LEVEL = np.zeros(ALL_LEVELS + 1, dtype=np.float32)
+BIT_LEVEL[list(LEVEL_BIT.values())] = LEVELS
+
+
+def left_levels(threshold):
+    """Per node, bit l set where level l goes left (x <= threshold); leaves send every level "left" to themselves."""
+    levels = np.asarray(LEVELS, dtype=np.float32)
+    bits = 1 << np.arange(len(LEVELS))
+    return ((levels[np.newaxis, :] <= threshold[:, np.newaxis]) @ bits).astype(np.uint8)
+
+
+@dataclass(frozen=True)
+class Decision:
+    state: str            # SETTLED, OPEN or UNKNOWN
+    encoded: object       # the settled class (a value of ``model.classes_``), else None
+    nodes: int            # branches the search visited
+    seconds: float
+
+
+class SettledCheck:
+    def __init__(self, evaluator, max_nodes=MAX_NODES, enumerate_limit=ENUMERATE_LIMIT,
+                 witness_samples=WITNESS_SAMPLES, cache_size=CACHE_SIZE):
+        a = evaluator.arrays
+        self.evaluator = evaluator
+        self.arrays = a
+        self.max_nodes = max_nodes
+        self.enumerate_limit = enumerate_limit
+        self.witness_samples = witness_samples
+        self.cache_size = cache_size
+        self.left_levels = left_levels(a.threshold)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_model(cls, model, **kwargs):
+        from forest_eval import ForestEvaluator
+
+        return cls(ForestEvaluator.from_model(model), **kwargs)
+
+    def decide(self, values):
+        """Decision for a score vector in model feature order, ``None`` marking unanswered categories."""
+        key = tuple(values)
+        with self._lock:
+            decision = self._cache.get(key)
+            if decision is not None:
+                self._cache.move_to_end(key)
+                return decision
+        decision = self._decide(key)
+        with self._lock:
+            self._cache[key] = decision
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return decision
+
+    # -----------------------------
+    # SEARCH
+    # -----------------------------
+    def _decide(self, values):
+        started = time.perf_counter()
+        masks = np.empty(len(values), dtype=np.uint8)
+        for i, value in enumerate(values):
+            bit = ALL_LEVELS if value is None else LEVEL_BIT.get(value)
+            if bit is None:  # off the 1/4/7/10 lattice: the bounds do not apply
+                return Decision(UNKNOWN, None, 0, time.perf_counter() - started)
+            masks[i] = bit
+
+        unknown = np.flatnonzero(masks == ALL_LEVELS)
+        if len(LEVELS) ** len(unknown) > self.enumerate_limit and len(self._witness(masks, unknown)) > 1:
+            return Decision(OPEN, None, 0, time.perf_counter() - started)
+
+        settled, nodes, stack = None, 0, [masks]
+        while stack:
+            nodes += 1
+            if nodes > self.max_nodes:
+                return Decision(UNKNOWN, None, nodes - 1, time.perf_counter() - started)
+            masks = stack.pop()
+            unknown = np.flatnonzero(masks == ALL_LEVELS)
+            if len(LEVELS) ** len(unknown) <= self.enumerate_limit:
+                outcomes = self._enumerate(masks, unknown)
+                leader = outcomes[0] if len(outcomes) == 1 else None
+                if leader is None:
+                    return Decision(OPEN, None, nodes, time.perf_counter() - started)
+            else:
+                leader, split = self._bound(masks)
+            if leader is not None:
+                if settled is not None and leader != settled:
+                    return Decision(OPEN, None, nodes, time.perf_counter() - started)
+                settled = leader
+                continue
+            for bit in LEVEL_BIT.values():
+                branch = masks.copy()
+                branch[split] = bit
+                stack.append(branch)
+        encoded = self.arrays.classes[settled]
+        return Decision(SETTLED, encoded, nodes, time.perf_counter() - started)
+
+    def _witness(self, masks, unknown):
+        """Distinct class indices over ``witness_samples`` random completions (seeded, so repeatable)."""
+        rng = np.random.default_rng(0)
+        X = np.empty((self.witness_samples, len(masks)), dtype=np.float32)
+        X[:] = BIT_LEVEL[masks]
+        X[:, unknown] = rng.choice(np.asarray(LEVELS, dtype=np.float32), size=(len(X), len(unknown)))
+        return np.unique(np.argmax(self.evaluator.predict_proba(X), axis=1))
+
+    def _enumerate(self, masks, unknown):
+        """Distinct class indices over every completion of the unknown features."""
+        X = np.empty((len(LEVELS) ** len(unknown), len(masks)), dtype=np.float32)
+        X[:] = BIT_LEVEL[masks]
+        X[:, unknown] = decode_indices(np.arange(len(X), dtype=np.int64), len(unknown))
+        proba = self.evaluator.predict_proba(X)
+        return np.unique(np.argmax(proba, axis=1))
+
+    def _bound(self, masks):
+        """(class index settled by the per-tree bounds or None, feature to split on next)."""
+        a = self.arrays
+        # Trees may share subtrees (see forest_compact), so each frontier node carries its tree
+        frontier, trees, ambiguous = a.roots, np.arange(a.n_trees), []
+        for _ in range(a.max_depth):
+            allowed = masks[a.feature[frontier]]
+            goes_left = self.left_levels[frontier]
+            left_ok = (allowed & goes_left) != 0
+            right_ok = (allowed & ~goes_left) != 0
+            both = left_ok & right_ok
+            if both.any():
+                ambiguous.append(a.feature[frontier[both]])
+            frontier = np.concatenate((a.left[frontier[left_ok]], a.right[frontier[right_ok]]))
+            trees = np.concatenate((trees[left_ok], trees[right_ok]))
+
+        order = np.argsort(trees, kind="stable")
+        value = a.value[frontier[order]]
+        if not ambiguous:  # one leaf per tree: the prediction itself
+            return int(np.argmax(value.sum(axis=0))), None
+        starts = np.flatnonzero(np.diff(trees[order], prepend=-1))
+        low = np.minimum.reduceat(value, starts, axis=0).sum(axis=0)
+        high = np.maximum.reduceat(value, starts, axis=0).sum(axis=0)
+        leader = int(np.argmax(low + high))
+        margin = np.minimum.reduceat(value[:, [leader]] - value, starts, axis=0).sum(axis=0)
+        margin[leader] = np.inf
+        counts = np.bincount(np.concatenate(ambiguous), minlength=len(masks))
+        split = int(np.argmax(np.where(masks == ALL_LEVELS, counts, -1)))
+        return (leader if margin.min() > MARGIN_TOLERANCE else None), split
+
+
+# -----------------------------
+# BENCHMARK
+# -----------------------------
+def simulate(check, sessions=200, seed=0):
+    """Answer random quizzes one category at a time (quiz order) and decide after each.
+
+    Returns per-decision timings, the number of categories each session needed
+    and how many decisions disagreed with the full answers or were unknown.
+    """
+    rng = np.random.default_rng(seed)
+    n_features = len(check.arrays.feature_names)
+    answers = rng.choice(np.asarray(LEVELS), size=(sessions, n_features))
+    expected = check.evaluator.predict(answers)
+    timings, needed, wrong, unknown = [], [], 0, 0
+    for row, label in zip(answers, expected):
+        values = [None] * n_features
+        stop = n_features
+        for i in range(n_features - 1):
+            values[i] = int(row[i])
+            decision = check._decide(tuple(values))  # uncached: every timing is a real search
+            timings.append(decision.seconds)
+            unknown += decision.state == UNKNOWN
+            if decision.state == SETTLED:
+                wrong += decision.encoded != label
+                stop = i + 1
+                break
+        needed.append(stop)
+    return timings, needed, wrong, unknown
+
+
+def main(argv=None):
+    import joblib
+
+    parser = argparse.ArgumentParser(description="Benchmark the early-exit decision for the quiz.")
+    parser.add_argument("command", choices=["bench"])
+    parser.add_argument("--model", default="career_model_main.pkl")
+    parser.add_argument("--sessions", type=int, default=200, help="simulated quiz sessions")
+    parser.add_argument("--max-nodes", type=int, default=MAX_NODES)
+    parser.add_argument("--questions", type=int, default=3, help="questions per category")
+    args = parser.parse_args(argv)
+
+    check = SettledCheck.from_model(joblib.load(args.model), max_nodes=args.max_nodes)
+    timings, needed, wrong, unknown = simulate(check, args.sessions)
+    ms = np.asarray(timings) * 1000
+    n_features = len(check.arrays.feature_names)
+    print(f"{len(ms):,} decisions: p50 {np.percentile(ms, 50):.2f} ms, p95 {np.percentile(ms, 95):.2f} ms, "
+          f"max {ms.max():.2f} ms, {unknown} over the {args.max_nodes}-branch budget")
+    early = sum(n < n_features for n in needed)
+    print(f"{early}/{len(needed)} sessions settled early; categories needed: mean {np.mean(needed):.1f} "
+          f"of {n_features}, so {args.questions * (n_features - np.mean(needed)):.1f} fewer questions (and reruns)")
+    print(f"{wrong} settled decisions disagreed with the finished quiz")
+    return 1 if wrong else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,318 @@
+"""
+Compact, lattice-exact copy of the career forest.
+
+Quiz scores only take the values 1, 4, 7 and 10, so a split only matters
+through which of those four levels it sends left. ``compact_forest`` rebuilds
+every tree on that lattice:
+
+* thresholds become the largest level that goes left (1, 4 or 7);
+* splits whose outcome an ancestor already fixed are dropped;
+* identical subtrees (same split and children, or leaves with the same class
+  probabilities) are stored once, within and across trees, and a split whose
+  two sides turn out identical is replaced by that side.
+
+Leaves are numbered first, so only they carry probability rows. The arrays,
+the label classes and the model version go to ``career_model_compact.npz``.
+When it matches the model and encoder on disk, the model registry loads it
+instead of unpickling sklearn; the pickle is still loaded on demand for
+off-lattice scores (e.g. from ``batch_score.py``).
+
+``verify`` walks each original tree and its compact copy side by side over
+regions of the lattice, which covers all 4^14 cells, and checks that every
+region ends in leaves with identical probabilities. It also compares labels
+and probabilities with sklearn on random cells. ``report`` loads both forms
+in fresh interpreters and compares load time, memory and size on disk.
+
+    python forest_compact.py build [--model career_model_main.pkl] [--out career_model_compact.npz]
+    python forest_compact.py verify [--samples 100000]
+    python forest_compact.py report
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from forest_bounds import ALL_LEVELS, left_levels
+from forest_eval import ForestArrays, ForestEvaluator, export_forest
+from lookup_table import LEVELS
+
+COMPACT_PATH = "career_model_compact.npz"
+FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Labels:
+    """Stands in for the LabelEncoder; decoding only reads ``classes_``."""
+    classes_: np.ndarray
+
+
+@dataclass(frozen=True)
+class CompactModel:
+    arrays: ForestArrays
+    labels: Labels
+    version: str          # model registry version of the pickles it was built from
+
+
+# -----------------------------
+# OPTIMIZER
+# -----------------------------
+def compact_forest(arrays):
+    """Lattice-exact ForestArrays with canonical thresholds, no redundant splits and shared subtrees."""
+    goes_left = left_levels(arrays.threshold)
+    leaves, leaf_ids = [], {}          # probability row bytes -> leaf number
+    splits, split_ids = [], {}         # (feature, level, left, right) -> split number
+    # Children are ("leaf", i) / ("split", j) until the final numbering puts leaves first
+
+    def build(node, masks):
+        if arrays.left[node] == node:
+            row = arrays.value[node]
+            key = row.tobytes()
+            if key not in leaf_ids:
+                leaf_ids[key] = len(leaves)
+                leaves.append(row)
+            return ("leaf", leaf_ids[key]), 0
+        feature = int(arrays.feature[node])
+        allowed = masks[feature]
+        left_bits = allowed & goes_left[node]
+        right_bits = allowed & ~goes_left[node] & ALL_LEVELS
+        if not right_bits:
+            return build(arrays.left[node], masks)
+        if not left_bits:
+            return build(arrays.right[node], masks)
+        left, left_depth = build(arrays.left[node], masks[:feature] + (left_bits,) + masks[feature + 1:])
+        right, right_depth = build(arrays.right[node], masks[:feature] + (right_bits,) + masks[feature + 1:])
+        if left == right:
+            return left, left_depth
+        key = (feature, LEVELS[int(left_bits).bit_length() - 1], left, right)
+        if key not in split_ids:
+            split_ids[key] = len(splits)
+            splits.append(key)
+        return ("split", split_ids[key]), 1 + max(left_depth, right_depth)
+
+    full = (ALL_LEVELS,) * len(arrays.feature_names)
+    built = [build(root, full) for root in arrays.roots]
+
+    n_leaves = len(leaves)
+    n_nodes = n_leaves + len(splits)
+
+    def node_id(ref):
+        return ref[1] if ref[0] == "leaf" else n_leaves + ref[1]
+
+    feature = np.zeros(n_nodes, dtype=np.int32)
+    threshold = np.full(n_nodes, np.inf)
+    left = np.arange(n_nodes, dtype=np.int32)
+    right = np.arange(n_nodes, dtype=np.int32)
+    for j, (f, level, l, r) in enumerate(splits):
+        i = n_leaves + j
+        feature[i], threshold[i], left[i], right[i] = f, level, node_id(l), node_id(r)
+    value = np.asarray(leaves, dtype=np.float64).reshape(n_leaves, -1)
+    roots = np.asarray([node_id(ref) for ref, _ in built], dtype=np.int32)
+    return ForestArrays(feature, threshold, left, right, value, roots, arrays.classes, arrays.feature_names,
+                        max(depth for _, depth in built))
+
+
+# -----------------------------
+# ARTIFACT
+# -----------------------------
+def save_compact(compact, path=COMPACT_PATH):
+    a = compact.arrays
+    index = np.int32 if a.n_nodes > np.iinfo(np.uint16).max else np.uint16
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(
+        tmp, format=FORMAT_VERSION, version=compact.version, feature=a.feature.astype(np.uint8),
+        threshold=a.threshold.astype(np.float32), left=a.left.astype(index), right=a.right.astype(index),
+        value=a.value, roots=a.roots.astype(index), classes=a.classes, feature_names=np.asarray(a.feature_names),
+        max_depth=a.max_depth, labels=compact.labels.classes_,
+    )
+    os.replace(tmp, path)
+
+
+def load_compact(path=COMPACT_PATH):
+    with np.load(path, allow_pickle=False) as data:
+        if int(data["format"]) != FORMAT_VERSION:
+            raise ValueError(f"format {int(data['format'])}, expected {FORMAT_VERSION}")
+        arrays = ForestArrays(
+            data["feature"].astype(np.int32), data["threshold"].astype(np.float64), data["left"].astype(np.int32),
+            data["right"].astype(np.int32), data["value"], data["roots"].astype(np.int32), data["classes"],
+            tuple(str(name) for name in data["feature_names"]), int(data["max_depth"]),
+        )
+        return CompactModel(arrays, Labels(data["labels"]), str(data["version"]))
+
+
+def open_compact(version, path=COMPACT_PATH):
+    """The compact forest if it exists and was built from model ``version``; otherwise None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        compact = load_compact(path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Ignoring compact forest {path}: {e}")
+        return None
+    if compact.version != version:
+        print(f"⚠️ Ignoring stale compact forest {path} (built for model {compact.version}).")
+        return None
+    return compact
+
+
+def build_compact(model_path, encoder_path, path=COMPACT_PATH):
+    import joblib
+
+    from model_registry import model_version
+
+    started = time.perf_counter()
+    original = export_forest(joblib.load(model_path))
+    compact = CompactModel(compact_forest(original), Labels(np.asarray(joblib.load(encoder_path).classes_)),
+                           model_version(model_path, encoder_path))
+    save_compact(compact, path)
+    a = compact.arrays
+    print(f"✅ {original.n_nodes:,} nodes ({original.value.shape[0]:,} probability rows, depth {original.max_depth}) -> "
+          f"{a.n_nodes:,} nodes ({len(a.value):,} rows, depth {a.max_depth}) in {time.perf_counter() - started:.1f}s")
+    print(f"💾 {path}: {os.path.getsize(path) / 1e6:.2f} MB")
+    return compact
+
+
+# -----------------------------
+# PARITY
+# -----------------------------
+def verify_lattice(original, compact):
+    """Walk every tree and its compact copy together over lattice regions.
+
+    Each region is a set of allowed levels per feature; splits partition it,
+    so the regions reached cover every lattice cell exactly once. Returns
+    (regions checked, regions whose leaves disagree).
+    """
+    goes_left = (left_levels(original.threshold), left_levels(compact.threshold))
+    checked = mismatched = 0
+
+    def split(arrays, bits, node, masks):
+        """[(child, masks)] for the sides of ``node`` the region reaches."""
+        feature = int(arrays.feature[node])
+        sides = []
+        for child, side in ((arrays.left[node], masks[feature] & bits[node]),
+                            (arrays.right[node], masks[feature] & ~bits[node] & ALL_LEVELS)):
+            if side:
+                sides.append((child, masks[:feature] + (side,) + masks[feature + 1:]))
+        return sides
+
+    stack = [(a, b, (ALL_LEVELS,) * len(original.feature_names)) for a, b in zip(original.roots, compact.roots)]
+    while stack:
+        a, b, masks = stack.pop()
+        if original.left[a] != a:
+            stack.extend((child, b, side) for child, side in split(original, goes_left[0], a, masks))
+        elif compact.left[b] != b:
+            stack.extend((a, child, side) for child, side in split(compact, goes_left[1], b, masks))
+        else:
+            checked += 1
+            mismatched += not np.array_equal(original.value[a], compact.value[b])
+    return checked, mismatched
+
+
+def verify(model_path, path=COMPACT_PATH, samples=100000, seed=0):
+    """Lattice walk against the pickle's trees plus a sampled check against sklearn; returns problems found."""
+    import joblib
+    import pandas as pd
+
+    model = joblib.load(model_path)
+    compact = load_compact(path)
+    problems = 0
+    if compact.arrays.feature_names != tuple(str(name) for name in model.feature_names_in_):
+        print("❌ Feature order differs from the model.")
+        return 1
+
+    regions, mismatched = verify_lattice(export_forest(model), compact.arrays)
+    print(f"Lattice walk: {regions:,} regions covering all {len(LEVELS) ** model.n_features_in_:,} cells, "
+          f"{mismatched} with different leaf probabilities")
+    problems += mismatched
+
+    rng = np.random.default_rng(seed)
+    X = rng.choice(np.asarray(LEVELS), size=(samples, model.n_features_in_))
+    frame = pd.DataFrame(X, columns=model.feature_names_in_)
+    proba = ForestEvaluator(compact.arrays).predict_proba(X)
+    labels = compact.arrays.classes.take(np.argmax(proba, axis=1))
+    wrong = int(np.count_nonzero(labels != model.predict(frame)))
+    diff = float(np.max(np.abs(proba - model.predict_proba(frame))))
+    print(f"sklearn on {samples:,} random cells: {wrong} label mismatches, max |Δproba| = {diff:.3g}")
+    return problems + wrong + (diff > 1e-9)
+
+
+# -----------------------------
+# LOAD REPORT
+# -----------------------------
+def _resident_mb():
+    with open("/proc/self/statm") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def load_child(kind, model_path, encoder_path, path):
+    """Load one form the way the model registry does and report time and memory (run in a fresh interpreter)."""
+    before = _resident_mb()
+    started = time.perf_counter()
+    if kind == "pickle":
+        import joblib
+
+        model = joblib.load(model_path)
+        joblib.load(encoder_path)
+        evaluator = ForestEvaluator.from_model(model)
+    else:
+        evaluator = ForestEvaluator(load_compact(path).arrays)
+    seconds = time.perf_counter() - started
+    row = np.asarray([4] * len(evaluator.arrays.feature_names))
+    evaluator.predict(row)
+    predict_started = time.perf_counter()
+    for _ in range(1000):
+        evaluator.predict(row)
+    print(json.dumps({"load_s": seconds, "resident_mb": _resident_mb() - before,
+                      "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                      "predict_us": (time.perf_counter() - predict_started) * 1000}))
+
+
+def report(model_path, encoder_path, path=COMPACT_PATH, runs=3):
+    results = {}
+    for kind in ("pickle", "compact"):
+        samples = []
+        for _ in range(runs):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "_load", kind, "--model", model_path,
+                                  "--encoder", encoder_path, "--out", path], capture_output=True, text=True, check=True)
+            samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        results[kind] = {key: float(np.median([s[key] for s in samples])) for key in samples[0]}
+    results["pickle"]["disk_mb"] = (os.path.getsize(model_path) + os.path.getsize(encoder_path)) / 1e6
+    results["compact"]["disk_mb"] = os.path.getsize(path) / 1e6
+
+    print(f"{'':22} {'pickle':>10} {'compact':>10}")
+    for key, label in (("load_s", "load (s)"), ("resident_mb", "resident after load (MB)"),
+                       ("peak_mb", "peak RSS (MB)"), ("disk_mb", "on disk (MB)"), ("predict_us", "predict (µs)")):
+        print(f"{label:22} {results['pickle'][key]:10.3f} {results['compact'][key]:10.3f}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build, verify or measure the compact career forest.")
+    parser.add_argument("command", choices=["build", "verify", "report", "_load"])
+    parser.add_argument("kind", nargs="?", choices=["pickle", "compact"], help=argparse.SUPPRESS)
+    parser.add_argument("--model", default="career_model_main.pkl")
+    parser.add_argument("--encoder", default="label_encoder.pkl")
+    parser.add_argument("--out", default=COMPACT_PATH, help="compact artifact path")
+    parser.add_argument("--samples", type=int, default=100000, help="random cells compared with sklearn")
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters per form in report mode")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build_compact(args.model, args.encoder, args.out)
+        return 0
+    if args.command == "verify":
+        return 1 if verify(args.model, args.out, args.samples) else 0
+    if args.command == "report":
+        report(args.model, args.encoder, args.out, args.runs)
+        return 0
+    load_child(args.kind, args.model, args.encoder, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
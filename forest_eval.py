@@ -0,0 +1,240 @@
+"""
+Vectorized NumPy evaluator for the fitted RandomForest.
+
+``export_forest`` flattens every tree of the sklearn forest into shared arrays
+(split feature, threshold, left/right child, per-node class probabilities).
+``ForestEvaluator`` then walks all trees for a whole batch at once, one depth
+level per step, reusing per-thread work buffers, so predicting a score vector
+costs a handful of NumPy calls instead of a DataFrame build plus sklearn's
+input validation. Probabilities are accumulated tree by tree in the same order
+sklearn uses, so labels and probabilities match ``predict``/``predict_proba``.
+
+    python forest_eval.py export [--model career_model_main.pkl] [--out career_forest.npz]
+    python forest_eval.py check [--samples 100000]
+"""
+import argparse
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+FOREST_PATH = "career_forest.npz"
+BLOCK_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class ForestArrays:
+    feature: np.ndarray     # (n_nodes,) int32, 0 for leaves
+    threshold: np.ndarray   # (n_nodes,) float64, +inf for leaves so they route to themselves
+    left: np.ndarray        # (n_nodes,) int32 absolute node ids, leaves point at themselves
+    right: np.ndarray       # (n_nodes,) int32
+    value: np.ndarray       # (n_nodes, n_classes) float64 normalized class probabilities (leaves only, numbered
+                            # first, in forest_compact forests)
+    roots: np.ndarray       # (n_trees,) int32
+    classes: np.ndarray     # model.classes_
+    feature_names: tuple
+    max_depth: int
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    def save(self, path=FOREST_PATH):
+        np.savez(path, feature=self.feature, threshold=self.threshold, left=self.left, right=self.right,
+                 value=self.value, roots=self.roots, classes=self.classes,
+                 feature_names=np.asarray(self.feature_names), max_depth=self.max_depth)
+
+    @classmethod
+    def load(cls, path=FOREST_PATH):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["feature"], data["threshold"], data["left"], data["right"], data["value"],
+                       data["roots"], data["classes"], tuple(str(n) for n in data["feature_names"]),
+                       int(data["max_depth"]))
+
+
+def export_forest(model):
+    """Flatten a fitted RandomForestClassifier into one set of node arrays."""
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset, max_depth = 0, 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        is_leaf = tree.children_left < 0
+        node_ids = np.arange(tree.node_count, dtype=np.int32) + offset
+
+        features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+        lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset).astype(np.int32))
+        rights.append(np.where(is_leaf, node_ids, tree.children_right + offset).astype(np.int32))
+
+        # scikit-learn >= 1.4 stores class fractions and returns them untouched; older versions store
+        # counts and normalize in DecisionTreeClassifier.predict_proba. Dividing fractions again would
+        # change the last bit of some probabilities.
+        value = tree.value[:, 0, :model.n_classes_].astype(np.float64)
+        normalizer = value.sum(axis=1)[:, np.newaxis]
+        if not np.allclose(normalizer, 1.0, rtol=0, atol=1e-9):
+            normalizer[normalizer == 0.0] = 1.0
+            value = value / normalizer
+        values.append(value)
+
+        roots.append(offset)
+        offset += tree.node_count
+        max_depth = max(max_depth, tree.max_depth)
+
+    feature_names = getattr(model, "feature_names_in_", [f"x{i}" for i in range(model.n_features_in_)])
+    return ForestArrays(np.concatenate(features), np.concatenate(thresholds), np.concatenate(lefts),
+                        np.concatenate(rights), np.concatenate(values), np.asarray(roots, dtype=np.int32),
+                        np.asarray(model.classes_), tuple(str(n) for n in feature_names), int(max_depth))
+
+
+class _Buffers:
+    """Work arrays for one block of rows; sized once, reused on every call."""
+
+    def __init__(self, n_trees, rows, n_features, n_classes):
+        size = n_trees * rows
+        self.rows = rows
+        # Tree-major layout: node[t * rows + r] is row r's position in tree t
+        self.row_base = np.tile(np.arange(rows, dtype=np.int64) * n_features, n_trees)
+        self.node = np.empty(size, dtype=np.int32)
+        self.spare = np.empty(size, dtype=np.int32)
+        self.feat = np.empty(size, dtype=np.int32)
+        self.index = np.empty(size, dtype=np.int64)
+        self.x = np.empty(size, dtype=np.float32)
+        self.thr = np.empty(size, dtype=np.float64)
+        self.go_left = np.empty(size, dtype=bool)
+        self.leaves = np.empty((n_trees, rows, n_classes), dtype=np.float64)
+        self.total = np.empty((rows, n_classes), dtype=np.float64)
+
+
+class ForestEvaluator:
+    def __init__(self, arrays, block_size=BLOCK_SIZE):
+        self.arrays = arrays
+        self.block_size = block_size
+        self.n_features = len(arrays.feature_names)
+        self._local = threading.local()
+
+    @classmethod
+    def from_model(cls, model, **kwargs):
+        return cls(export_forest(model), **kwargs)
+
+    @property
+    def classes(self):
+        return self.arrays.classes
+
+    def predict_proba(self, X):
+        """Class probabilities for one score vector or an (N, n_features) array."""
+        X = self._as_matrix(X)
+        out = np.zeros((len(X), len(self.arrays.classes)), dtype=np.float64)
+        for start in range(0, len(X), self.block_size):
+            self._evaluate_block(X[start:start + self.block_size], out[start:start + self.block_size])
+        out /= self.arrays.n_trees
+        return out
+
+    def predict(self, X):
+        """Encoded labels (values of ``model.classes_``), same as ``model.predict``."""
+        return self.arrays.classes.take(np.argmax(self.predict_proba(X), axis=1))
+
+    def _as_matrix(self, X):
+        X = np.asarray(X, dtype=np.float32)  # sklearn trees compare float32 inputs
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} scores per row, got {X.shape[1]}.")
+        return np.ascontiguousarray(X)
+
+    def _buffers(self, rows):
+        buffers = getattr(self._local, "buffers", {})
+        self._local.buffers = buffers
+        if rows not in buffers:
+            # Keep the block-sized set plus small sizes (single predictions) around
+            if len(buffers) > 4:
+                buffers.clear()
+            buffers[rows] = _Buffers(self.arrays.n_trees, rows, self.n_features, len(self.arrays.classes))
+        return buffers[rows]
+
+    def _evaluate_block(self, X, out):
+        a = self.arrays
+        rows = len(X)
+        b = self._buffers(rows)
+        flat_x = X.ravel()
+
+        # Node ids are always in range, so mode="clip" skips numpy's bounds-check copy of ``out``
+        node, spare = b.node, b.spare
+        node.reshape(a.n_trees, rows)[:] = a.roots[:, np.newaxis]
+        for _ in range(a.max_depth):
+            np.take(a.feature, node, out=b.feat, mode="clip")
+            np.add(b.row_base, b.feat, out=b.index)
+            np.take(flat_x, b.index, out=b.x, mode="clip")
+            np.take(a.threshold, node, out=b.thr, mode="clip")
+            np.less_equal(b.x, b.thr, out=b.go_left)
+            # next = right + go_left * (left - right), branch-free and without a masked copy
+            np.take(a.right, node, out=spare, mode="clip")
+            np.take(a.left, node, out=b.feat, mode="clip")  # feat is free again; reuse it for left children
+            np.subtract(b.feat, spare, out=b.feat)
+            np.multiply(b.feat, b.go_left, out=b.feat)
+            np.add(spare, b.feat, out=spare)
+            node, spare = spare, node
+
+        # Reducing over the outer (tree) axis adds one tree at a time, in estimator
+        # order, which is exactly how sklearn accumulates the forest average
+        np.take(a.value, node, axis=0, out=b.leaves.reshape(-1, b.leaves.shape[-1]), mode="clip")
+        np.sum(b.leaves, axis=0, out=b.total)
+        out += b.total
+
+
+def check_parity(model, X=None, samples=100000, seed=0):
+    """Compare evaluator output against sklearn on random lattice points (or ``X``).
+
+    Returns (label mismatches, max absolute probability difference).
+    """
+    import pandas as pd
+
+    from lookup_table import LEVELS
+
+    evaluator = ForestEvaluator.from_model(model)
+    if X is None:
+        rng = np.random.default_rng(seed)
+        X = rng.choice(np.asarray(LEVELS), size=(samples, model.n_features_in_))
+    frame = pd.DataFrame(X, columns=model.feature_names_in_)
+
+    expected_proba = model.predict_proba(frame)
+    actual_proba = evaluator.predict_proba(X)
+    mismatches = int(np.count_nonzero(model.predict(frame) != evaluator.predict(X)))
+    return mismatches, float(np.max(np.abs(expected_proba - actual_proba)))
+
+
+def main(argv=None):
+    import joblib
+
+    parser = argparse.ArgumentParser(description="Export or parity-check the NumPy forest evaluator.")
+    parser.add_argument("command", choices=["export", "check"])
+    parser.add_argument("--model", default="career_model_main.pkl")
+    parser.add_argument("--out", default=FOREST_PATH)
+    parser.add_argument("--samples", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    model = joblib.load(args.model)
+    if args.command == "export":
+        arrays = export_forest(model)
+        arrays.save(args.out)
+        print(f"✅ Exported {arrays.n_trees} trees / {arrays.n_nodes:,} nodes to {args.out}")
+        return 0
+
+    mismatches, max_diff = check_parity(model, samples=args.samples)
+    evaluator = ForestEvaluator.from_model(model)
+    single = np.asarray([4] * model.n_features_in_)
+    started = time.perf_counter()
+    for _ in range(1000):
+        evaluator.predict(single)
+    per_call = (time.perf_counter() - started) / 1000
+    print(f"Checked {args.samples:,} rows: {mismatches} label mismatches, max |Δproba| = {max_diff:.3g}")
+    print(f"Single-row predict: {per_call * 1e6:.0f} µs")
+    return 1 if mismatches or max_diff > 1e-9 else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+"""
+Import-time report: what opening each page costs a fresh interpreter.
+
+Every sample is a new ``python -X importtime`` process that renders one page
+once through ``AppTest``, in the same scratch copy of the repo the page
+benchmark uses (bench_pages.py). Marker lines on stderr split the import log
+into stages:
+
+    harness     streamlit and AppTest (paid by ``streamlit run`` as well)
+    shell       app.py's own imports (page_assets, tracing, the sidebar menu)
+    render      the first render of the page: its views module and whatever
+                it imports on first use (the model unpickles sklearn on Quiz)
+    background  imports made by threads the page started, in the ``--settle``
+                seconds after the render returned
+
+Each stage is reported as the median import time over ``--repeat`` samples
+and the number of modules it imported. The report lists the heaviest imports
+of each page and fails if opening Home imports sklearn or fpdf.
+
+    python import_report.py --repeat 5 --out import_report.json
+    python import_report.py --repo ../pathpilot-old   # same report for another checkout
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+PAGES = ("Home", "Quiz", "Chatbot")
+STAGES = ("harness", "shell", "render", "background")
+# Session state for a page's first render (the Chatbot notice counts down for ten seconds otherwise)
+PAGE_STATE = {"Chatbot": {"warning_acknowledged": True}}
+HEAVY = ("sklearn", "scipy", "joblib", "pandas", "numpy", "fpdf", "requests", "streamlit_lottie")
+NEVER_ON_HOME = ("sklearn", "fpdf")
+MARKER = "@@ stage "
+
+
+# -----------------------------
+# CHILD: one page, one sample
+# -----------------------------
+def mark(stage):
+    sys.stderr.write(f"{MARKER}{stage}\n")
+    sys.stderr.flush()
+
+
+def render_child(workdir, page, settle):
+    mark("harness")
+    import streamlit.testing.v1  # noqa: F401
+    from bench_pages import app_test, check, enter_workdir
+
+    enter_workdir(workdir)
+    mark("shell")
+    import page_assets  # noqa: F401
+    import streamlit_option_menu  # noqa: F401
+    import tracing  # noqa: F401
+
+    mark("render")
+    check(app_test(page, PAGE_STATE.get(page)).run(), f"render {page}")
+    mark("background")
+    time.sleep(settle)
+    mark("end")
+
+
+# -----------------------------
+# PARSING
+# -----------------------------
+def parse(stderr):
+    """-X importtime log -> {stage: [(module, self_us, cumulative_us, depth)]}."""
+    stages, current = {}, None
+    for line in stderr.splitlines():
+        if line.startswith(MARKER):
+            current = line[len(MARKER):].strip()
+            stages.setdefault(current, [])
+            continue
+        if current is None or not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not own.strip().isdigit():  # the column header
+            continue
+        module = name.rstrip()
+        depth = (len(module) - len(module.lstrip())) // 2 - 1
+        stages[current].append((module.strip(), int(own), int(cumulative), depth))
+    return stages
+
+
+def sample(workdir, page, settle):
+    out = subprocess.run([sys.executable, "-X", "importtime", os.path.abspath(__file__), "_render", workdir, page,
+                          str(settle)], capture_output=True, text=True)
+    if out.returncode != 0:
+        raise SystemExit(f"❌ {page}: {out.stdout.strip()[-500:]}")
+    return parse(out.stderr)
+
+
+def is_package(module, package):
+    return module == package or module.startswith(package + ".")
+
+
+def summarize_page(samples):
+    """Median import ms and module count per stage, the slowest imports and the heavy packages loaded."""
+    first = samples[0]
+    stages = {}
+    for stage in STAGES:
+        ms = [sum(own for _, own, _, _ in s.get(stage, [])) / 1000 for s in samples]
+        stages[stage] = {"ms": statistics.median(ms), "modules": len(first.get(stage, []))}
+    app_modules = [m for stage in STAGES[1:] for m, _, _, _ in first.get(stage, [])]
+    top = sorted(((m, cum / 1000) for stage in STAGES[2:] for m, _, cum, depth in first.get(stage, []) if depth == 0),
+                 key=lambda item: item[1], reverse=True)[:8]
+    return {
+        "stages": stages,
+        "page_ms": sum(stages[stage]["ms"] for stage in STAGES[1:]),
+        "heavy": [p for p in HEAVY if any(is_package(m, p) for m in app_modules)],
+        "preloaded": [p for p in HEAVY if any(is_package(m, p) for m, _, _, _ in first.get("harness", []))],
+        "top": [[m, round(ms, 1)] for m, ms in top],
+    }
+
+
+# -----------------------------
+# REPORT
+# -----------------------------
+def run(args):
+    from bench_pages import prepare_workdir
+
+    repo = os.path.abspath(args.repo)
+    workdir = prepare_workdir(repo)
+    try:
+        pages = {}
+        for page in PAGES:
+            pages[page] = summarize_page([sample(workdir, page, args.settle) for _ in range(args.repeat)])
+            print(f"⏱️ {page}: {pages[page]['page_ms']:.0f} ms of imports")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "repo": repo,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "settle": args.settle,
+        "pages": pages,
+    }
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(result, fh, indent=2)
+    print_report(pages)
+    print(f"💾 {os.path.abspath(args.out)}")
+
+    leaked = [p for p in NEVER_ON_HOME if p in pages["Home"]["heavy"]]
+    if leaked:
+        print(f"❌ Opening Home imports {', '.join(leaked)}")
+        return 1
+    print(f"✅ Opening Home imports none of {', '.join(NEVER_ON_HOME)}")
+    return 0
+
+
+def print_report(pages):
+    print(f"\n{'page':8} " + " ".join(f"{stage + ' ms':>13} {'mods':>5}" for stage in STAGES) + f" {'page ms':>8}")
+    for page, p in pages.items():
+        cells = " ".join(f"{p['stages'][s]['ms']:13.1f} {p['stages'][s]['modules']:5}" for s in STAGES)
+        print(f"{page:8} {cells} {p['page_ms']:8.1f}")
+    for page, p in pages.items():
+        print(f"\n{page}: heavy packages {', '.join(p['heavy']) or 'none'}"
+              + (f" (already loaded by streamlit: {', '.join(p['preloaded'])})" if p["preloaded"] else ""))
+        for module, ms in p["top"]:
+            print(f"  {module:40} {ms:8.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure per-page import time with -X importtime.")
+    sub = parser.add_subparsers(dest="command")
+    p_render = sub.add_parser("_render")  # one sample, run under -X importtime
+    p_render.add_argument("workdir")
+    p_render.add_argument("page", choices=PAGES)
+    p_render.add_argument("settle", type=float)
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per page")
+    parser.add_argument("--settle", type=float, default=3.0, help="seconds to wait for imports in background threads")
+    parser.add_argument("--repo", default=os.path.dirname(os.path.abspath(__file__)), help="checkout to measure")
+    parser.add_argument("--out", default="import_report.json")
+    args = parser.parse_args(argv)
+
+    if args.command == "_render":
+        render_child(args.workdir, args.page, args.settle)
+        return 0
+    return run(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
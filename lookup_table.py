@@ -0,0 +1,214 @@
+"""
+Exhaustive prediction lookup table for the quantized quiz score space.
+
+``calculate_score`` only ever returns 1, 4, 7 or 10, so every possible model
+input is a point on a 4^14 lattice (~268M cells). The builder evaluates the
+RandomForest over the whole lattice once, offline, and writes one byte per
+cell (the index into ``model.classes_``). At serve time the file is
+memory-mapped, so a prediction is a single index computation and every worker
+process shares the same pages through the OS page cache.
+
+    python lookup_table.py build [--workers 4] [--chunk-size 1048576]
+    python lookup_table.py verify [--samples 20000]
+"""
+import argparse
+import json
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+LEVELS = (1, 4, 7, 10)
+LEVEL_INDEX = {level: i for i, level in enumerate(LEVELS)}
+TABLE_PATH = "career_lookup.bin"
+CHUNK_SIZE = 1 << 20
+
+
+def meta_path(table_path):
+    return os.path.splitext(table_path)[0] + ".json"
+
+
+def lattice_size(n_features):
+    return len(LEVELS) ** n_features
+
+
+def decode_indices(indices, n_features):
+    """Turn flat lattice indices into an (N, n_features) score matrix.
+
+    The first feature is the most significant base-4 digit, matching ``cell_index``.
+    """
+    shifts = 2 * np.arange(n_features - 1, -1, -1, dtype=np.int64)
+    digits = (indices[:, None] >> shifts) & 3
+    return np.asarray(LEVELS, dtype=np.float32)[digits]
+
+
+def cell_index(values):
+    """Flat lattice index for one score vector, or None if any score is off-lattice."""
+    index = 0
+    for value in values:
+        digit = LEVEL_INDEX.get(value)
+        if digit is None:
+            return None
+        index = (index << 2) | digit
+    return index
+
+
+def predict_class_indices(model, X):
+    import pandas as pd
+
+    frame = pd.DataFrame(X, columns=model.feature_names_in_)
+    return np.searchsorted(model.classes_, model.predict(frame)).astype(np.uint8)
+
+
+# -----------------------------
+# BUILDER (offline)
+# -----------------------------
+_worker_model = None
+
+
+def _init_worker(model_path):
+    import joblib
+
+    global _worker_model
+    _worker_model = joblib.load(model_path)
+    _worker_model.n_jobs = 1  # one core per worker process
+
+
+def _evaluate_chunk(bounds):
+    start, stop = bounds
+    indices = np.arange(start, stop, dtype=np.int64)
+    X = decode_indices(indices, _worker_model.n_features_in_)
+    return start, predict_class_indices(_worker_model, X)
+
+
+def build_table(model_path, table_path=TABLE_PATH, model_version=None, workers=None, chunk_size=CHUNK_SIZE):
+    """Evaluate the model over the full lattice and write the table plus its JSON metadata."""
+    import joblib
+    from model_registry import file_digest
+
+    model = joblib.load(model_path)
+    if len(model.classes_) > 256:
+        raise ValueError("Lookup table stores one byte per cell; model has more than 256 classes.")
+
+    n_features = model.n_features_in_
+    total = lattice_size(n_features)
+    chunks = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+
+    tmp_path = table_path + ".tmp"
+    table = np.memmap(tmp_path, dtype=np.uint8, mode="w+", shape=(total,))
+
+    started = time.perf_counter()
+    with Pool(processes=workers or os.cpu_count(), initializer=_init_worker, initargs=(model_path,)) as pool:
+        for done, (start, labels) in enumerate(pool.imap_unordered(_evaluate_chunk, chunks), 1):
+            table[start:start + len(labels)] = labels
+            if done % 16 == 0 or done == len(chunks):
+                print(f"  {done}/{len(chunks)} chunks ({time.perf_counter() - started:.0f}s)")
+    table.flush()
+    del table
+
+    meta = {
+        "model_version": model_version or file_digest(model_path)[:16],
+        "feature_names": [str(name) for name in model.feature_names_in_],
+        "levels": list(LEVELS),
+        "classes": [c.item() if hasattr(c, "item") else c for c in model.classes_],
+        "cells": total,
+        "built_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    # Publish table and metadata only once both are complete
+    os.replace(tmp_path, table_path)
+    with open(meta_path(table_path) + ".tmp", "w") as fh:
+        json.dump(meta, fh, indent=2)
+    os.replace(meta_path(table_path) + ".tmp", meta_path(table_path))
+    print(f"✅ Wrote {total:,} cells to {table_path} in {time.perf_counter() - started:.1f}s")
+    return meta
+
+
+# -----------------------------
+# LOOKUP (serving)
+# -----------------------------
+class LookupTable:
+    def __init__(self, table_path=TABLE_PATH):
+        with open(meta_path(table_path)) as fh:
+            self.meta = json.load(fh)
+        self.feature_names = self.meta["feature_names"]
+        self.classes = np.asarray(self.meta["classes"])
+        self.cells = np.memmap(table_path, dtype=np.uint8, mode="r")
+        if len(self.cells) != lattice_size(len(self.feature_names)):
+            raise ValueError(f"{table_path} has {len(self.cells)} cells, expected {lattice_size(len(self.feature_names))}.")
+
+    @property
+    def model_version(self):
+        return self.meta["model_version"]
+
+    def predict_one(self, values):
+        """Encoded class for one score vector in feature order, or None if it is off-lattice."""
+        index = cell_index(values)
+        if index is None:
+            return None
+        return self.classes[self.cells[index]]
+
+    def predict(self, X):
+        """Encoded classes for an (N, n_features) array of lattice scores."""
+        X = np.asarray(X)
+        digits = np.searchsorted(LEVELS, X)
+        if np.any(np.asarray(LEVELS)[np.minimum(digits, len(LEVELS) - 1)] != X):
+            raise ValueError("All scores must be one of 1, 4, 7 or 10.")
+        weights = 4 ** np.arange(X.shape[1] - 1, -1, -1, dtype=np.int64)
+        return self.classes[self.cells[digits.astype(np.int64) @ weights]]
+
+
+def open_lookup(model_version, table_path=TABLE_PATH):
+    """Open the table if it exists and was built from ``model_version``; otherwise None."""
+    if not os.path.exists(table_path) or not os.path.exists(meta_path(table_path)):
+        return None
+    try:
+        table = LookupTable(table_path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Ignoring lookup table {table_path}: {e}")
+        return None
+    if table.model_version != model_version:
+        print(f"⚠️ Ignoring stale lookup table {table_path} (built for model {table.model_version}).")
+        return None
+    return table
+
+
+def verify_table(model_path, table_path=TABLE_PATH, samples=20000, seed=0):
+    """Spot-check random lattice cells (plus both corners) against ``model.predict``."""
+    import joblib
+
+    model = joblib.load(model_path)
+    table = LookupTable(table_path)
+    if table.feature_names != [str(name) for name in model.feature_names_in_]:
+        raise ValueError("Feature order in the table does not match the model.")
+
+    total = lattice_size(len(table.feature_names))
+    rng = np.random.default_rng(seed)
+    indices = np.unique(np.concatenate([[0, total - 1], rng.integers(0, total, size=samples)]))
+    X = decode_indices(indices, len(table.feature_names))
+
+    expected = model.classes_[predict_class_indices(model, X)]
+    actual = table.predict(X)
+    mismatches = int(np.count_nonzero(expected != actual))
+    print(f"Checked {len(indices):,} cells: {mismatches} mismatches")
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or verify the career prediction lookup table.")
+    parser.add_argument("command", choices=["build", "verify"])
+    parser.add_argument("--model", default="career_model_main.pkl")
+    parser.add_argument("--table", default=TABLE_PATH)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--samples", type=int, default=20000, help="cells to spot-check in verify mode")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build_table(args.model, args.table, workers=args.workers, chunk_size=args.chunk_size)
+        return 0
+    return 1 if verify_table(args.model, args.table, samples=args.samples) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+"""
+Cache of mentor answers to opening questions.
+
+Students matched to the same career with a similar profile tend to open with
+the same questions ("what certifications should I do?"). Answers to a
+conversation's first question are cached under
+(career, bucketed skill profile, country, normalized question): an in-process
+LRU in front of a SQLite table shared by every session and worker. Entries
+expire after ``ttl`` seconds and the table is trimmed to ``max_rows`` by least
+recent use. Follow-up questions depend on the conversation so far and are
+never cached.
+
+A cached answer is shown to every student with the same key, so it must be
+written from the key's fields alone: ``mentor_context.shared_opening`` builds
+that prompt without the student's name, email, college or other bio details.
+
+    python mentor_cache.py stats
+    python mentor_cache.py clear
+"""
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+DB_PATH = "mentor_cache.db"
+MEMORY_SIZE = 256
+TTL = 7 * 24 * 60 * 60
+MAX_ROWS = 5000
+
+# Greetings and politeness that don't change the answer
+_FILLER = {"hi", "hello", "hey", "please", "pls", "kindly", "thanks", "thank", "mentor", "sir", "maam"}
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+LEVEL_NAMES = {"L": "low", "M": "medium", "H": "high"}
+
+
+def normalize_question(text):
+    """Lowercase alphanumeric words without greetings/politeness, e.g. "Hi! What certifications?" -> "what certifications"."""
+    words = _NON_ALNUM.sub(" ", str(text).lower()).split()
+    return " ".join(w for w in words if w not in _FILLER)
+
+
+def profile_bucket(scores):
+    """Skill profile as one low/mid/high letter per category (1-3 L, 4-6 M, 7-10 H), in column order.
+
+    Categories skipped by finishing the quiz early (None/NaN) are "-".
+    """
+    letters = []
+    for value in scores:
+        if value is None or value != value:
+            letters.append("-")
+            continue
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            value = 0.0
+        letters.append("L" if value < 4 else "M" if value < 7 else "H")
+    return "".join(letters)
+
+
+def profile_summary(columns, scores):
+    """The bucketed profile as prompt lines ("- Openness: high"); skipped categories are left out."""
+    return "\n".join(f"- {col}: {LEVEL_NAMES[letter]}"
+                     for col, letter in zip(columns, profile_bucket(scores)) if letter != "-")
+
+
+def cache_key(career, scores, question, country=""):
+    raw = "\x1f".join([str(career), profile_bucket(scores), str(country).strip().lower(), normalize_question(question)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class MentorCache:
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS answers (
+        key         TEXT PRIMARY KEY,
+        answer      TEXT NOT NULL,
+        created_at  REAL NOT NULL,
+        last_used   REAL NOT NULL,
+        hits        INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS answers_by_last_used ON answers (last_used);
+    """
+
+    def __init__(self, db_path=DB_PATH, memory_size=MEMORY_SIZE, ttl=TTL, max_rows=MAX_ROWS, busy_timeout_ms=5000):
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._memory = OrderedDict()   # key -> (answer, created_at)
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0, "stores": 0, "evictions": 0}
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._stats[name] += n
+
+    # -----------------------------
+    # LOOKUP
+    # -----------------------------
+    def get(self, key, bypass=False):
+        """Cached answer for ``key``, or None (always None when ``bypass`` is set)."""
+        if bypass:
+            self._count("bypassed")
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[1] <= self.ttl:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return entry[0]
+                del self._memory[key]
+
+        conn = self._connection()
+        row = conn.execute("SELECT answer, created_at FROM answers WHERE key = ? AND created_at >= ?",
+                           (key, now - self.ttl)).fetchone()
+        if row is None:
+            self._count("misses")
+            return None
+        conn.execute("UPDATE answers SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        self._remember(key, row[0], row[1])
+        self._count("disk_hits")
+        return row[0]
+
+    def put(self, key, answer):
+        now = time.time()
+        self._remember(key, answer, now)
+        conn = self._connection()
+        conn.execute(
+            "INSERT INTO answers (key, answer, created_at, last_used) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET answer = excluded.answer, created_at = excluded.created_at, "
+            "last_used = excluded.last_used",
+            (key, answer, now, now),
+        )
+        self._count("stores")
+        self._evict(conn, now)
+
+    def _remember(self, key, answer, created_at):
+        with self._lock:
+            self._memory[key] = (answer, created_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _evict(self, conn, now):
+        """Drop expired rows, then the least recently used ones beyond ``max_rows``."""
+        removed = conn.execute("DELETE FROM answers WHERE created_at < ?", (now - self.ttl,)).rowcount
+        excess = conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0] - self.max_rows
+        if excess > 0:
+            removed += conn.execute(
+                "DELETE FROM answers WHERE key IN (SELECT key FROM answers ORDER BY last_used LIMIT ?)", (excess,)
+            ).rowcount
+        if removed:
+            self._count("evictions", removed)
+
+    # -----------------------------
+    # MAINTENANCE & METRICS
+    # -----------------------------
+    def stats(self):
+        with self._lock:
+            s = dict(self._stats, memory_entries=len(self._memory))
+        s["disk_entries"] = self._connection().execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+        lookups = s["memory_hits"] + s["disk_hits"] + s["misses"]
+        s["hit_rate"] = (s["memory_hits"] + s["disk_hits"]) / lookups if lookups else 0.0
+        return s
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        self._connection().execute("DELETE FROM answers")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_mentor_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = MentorCache()
+    return _cache
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or clear the mentor answer cache.")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("--db", default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"No cache at {args.db}")
+        return 0
+    cache = MentorCache(args.db)
+    if args.command == "clear":
+        cache.clear()
+        print(f"🧹 Cleared {args.db}")
+    else:
+        print(f"{cache.stats()['disk_entries']} cached answer(s) in {args.db}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+"""
+Token-budgeted conversation context for the AI Career Mentor.
+
+Every request is laid out as
+
+    [system: stable mentor prompt] [system: summary of earlier turns] [last N turns verbatim]
+
+The first message only depends on the quiz result and profile, so it is
+byte-identical across turns (and prefix-cache friendly). Turns that fall out
+of the verbatim window are folded into a short extractive summary once and the
+summary is reused afterwards; if a request is still over ``budget_tokens``,
+more of the oldest verbatim turns are folded. Token counts are local estimates
+(no tokenizer download needed); ``build`` reports them together with the
+payload size in bytes.
+"""
+import json
+import math
+import re
+from textwrap import dedent
+
+from mentor_cache import cache_key, profile_summary
+from openrouter import DEFAULT_MODEL
+
+BUDGET_TOKENS = 3000
+KEEP_TURNS = 4              # user + mentor exchanges kept verbatim
+SUMMARY_TOKENS = 400
+SUMMARY_LINE_CHARS = 160
+MESSAGE_OVERHEAD_TOKENS = 4  # role/formatting tokens the chat template adds per message
+
+_WORDS = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text):
+    """Rough BPE token count: the larger of ~4 characters per token and one per word/punctuation mark."""
+    if not text:
+        return 0
+    return max(math.ceil(len(text) / 4), len(_WORDS.findall(text)))
+
+
+def message_tokens(messages):
+    return sum(estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def build_system_prompt(career, skill_summary, user_bio):
+    """The mentor's instructions and the user's profile; identical for every turn of a session."""
+    return dedent(f"""\
+        You are an AI Career Mentor.
+        The user's predicted career is: {career}.
+        Their skill profile is as follows:
+        {{skills}}
+        User info:
+        {{bio}}
+        Ensure your answers are relevant to the user's country's job market.
+        Give clear, actionable career guidance with learning paths, certifications, and project ideas.
+        Be concise, motivating, and friendly.""").format(skills=skill_summary.strip(), bio=user_bio.strip())
+
+
+def shared_opening(career, columns, scores, question, country=""):
+    """(mentor cache key, system prompt) for a conversation's first question.
+
+    The answer is cached for every student with the same key, so the prompt only holds what the key is built
+    from (career, bucketed scores, country) and never the student's bio.
+    """
+    prompt = build_system_prompt(career, profile_summary(columns, scores), f"Country: {country or 'Not provided'}")
+    return cache_key(career, scores, question, country), prompt
+
+
+def summarize_message(message, limit=SUMMARY_LINE_CHARS):
+    """One summary line: the first sentence of the message, clipped to ``limit`` characters."""
+    text = " ".join(message["content"].split())
+    first = _SENTENCE_END.split(text, maxsplit=1)[0]
+    if len(first) > limit:
+        first = first[:limit - 1].rstrip() + "…"
+    who = "User asked" if message["role"] == "user" else "Mentor said"
+    return f"- {who}: {first}"
+
+
+class ConversationContext:
+    def __init__(self, system_prompt, budget_tokens=BUDGET_TOKENS, keep_turns=KEEP_TURNS,
+                 summary_tokens=SUMMARY_TOKENS, model=DEFAULT_MODEL):
+        self.system_prompt = system_prompt
+        self.budget_tokens = budget_tokens
+        self.keep_turns = keep_turns
+        self.summary_tokens = summary_tokens
+        self.model = model
+        self._lines = []        # summary lines, oldest first
+        self._folded = 0        # history[:_folded] is represented by the summary
+
+    def _fold(self, history, upto):
+        """Summarize history[_folded:upto] (each message is summarized exactly once)."""
+        for message in history[self._folded:upto]:
+            self._lines.append(summarize_message(message))
+        self._folded = max(self._folded, upto)
+        # Keep the summary itself bounded: the oldest lines go first
+        while len(self._lines) > 1 and estimate_tokens(self.summary) > self.summary_tokens:
+            self._lines.pop(0)
+
+    @property
+    def summary(self):
+        if not self._lines:
+            return ""
+        return "Summary of the earlier conversation:\n" + "\n".join(self._lines)
+
+    def build(self, history):
+        """Messages for the next request plus a size report (payload bytes, estimated tokens)."""
+        if len(history) < self._folded:  # history was cleared or replaced
+            self._lines, self._folded = [], 0
+        self._fold(history, max(0, len(history) - 2 * self.keep_turns))
+
+        while True:
+            messages = [{"role": "system", "content": self.system_prompt}]
+            if self._lines:
+                messages.append({"role": "system", "content": self.summary})
+            messages += [{"role": m["role"], "content": m["content"]} for m in history[self._folded:]]
+            tokens = message_tokens(messages)
+            # Always keep the latest user message verbatim, even if it alone is over budget
+            if tokens <= self.budget_tokens or self._folded >= len(history) - 1:
+                break
+            self._fold(history, self._folded + 1)
+
+        payload = {"model": self.model, "messages": messages, "stream": True}
+        report = {
+            "payload_bytes": len(json.dumps(payload).encode()),
+            "est_tokens": tokens,
+            "verbatim_messages": len(history) - self._folded,
+            "summarized_messages": self._folded,
+        }
+        return messages, report
@@ -0,0 +1,132 @@
+"""
+Local stand-in for the OpenRouter chat completions endpoint.
+
+Answers ``POST /api/v1/chat/completions`` with a canned mentor reply, either as
+a JSON completion or, when the request has ``"stream": true``, as server-sent
+events split into small chunks with an optional per-chunk delay (``chunk_bytes``
+re-slices the stream into fixed-size writes, so events straddle reads). Failures can
+be scripted (``server.fail_with`` is a list of status codes returned to the
+next requests, ``server.rejected_keys`` get 401s) to exercise retries and key
+failover. Lets the Chatbot page, benchmarks and tests run fully offline:
+
+    python mock_openrouter.py --port 8787 --delay 0.02
+    OPENROUTER_URL=http://127.0.0.1:8787/api/v1/chat/completions streamlit run app.py
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PATH = "/api/v1/chat/completions"
+REPLY = (
+    "Great question! Start with a solid foundation: strengthen Python and SQL, then build two portfolio "
+    "projects that match your predicted career. Add one recognised certification, share your work on GitHub, "
+    "and apply for internships every week. Consistency beats intensity. 🚀"
+)
+
+
+class MockOpenRouterHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    reply = REPLY
+    delay = 0.0
+    chunk_words = 3
+    chunk_bytes = 0  # >0: write the event stream in pieces of this many bytes, ignoring event boundaries
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        if self.path.split("?")[0] != PATH:
+            self._send_json(404, {"error": {"code": 404, "message": "Not found"}})
+            return
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        server = self.server
+        with server.lock:
+            server.requests_seen += 1
+            fail = server.fail_with.pop(0) if server.fail_with else None
+        key = self.headers.get("Authorization", "").removeprefix("Bearer ")
+        if key in server.rejected_keys:
+            self._send_json(401, {"error": {"code": 401, "message": "User not found."}})
+            return
+        if fail is not None:
+            extra = {"Retry-After": "0"} if fail == 429 else {}
+            self._send_json(fail, {"error": {"code": fail, "message": "Scripted failure"}}, extra)
+            return
+        if not payload.get("stream"):
+            self._send_json(200, {"choices": [{"message": {"role": "assistant", "content": self.reply}}]})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events = [b": OPENROUTER PROCESSING\n\n"]
+        words = self.reply.split(" ")
+        for i in range(0, len(words), self.chunk_words):
+            piece = " ".join(words[i:i + self.chunk_words]) + (" " if i + self.chunk_words < len(words) else "")
+            event = {"choices": [{"index": 0, "delta": {"content": piece}}]}
+            events.append(f"data: {json.dumps(event)}\n\n".encode())
+        events.append(b"data: [DONE]\n\n")
+        if self.chunk_bytes:
+            body = b"".join(events)
+            events = [body[i:i + self.chunk_bytes] for i in range(0, len(body), self.chunk_bytes)]
+        for i, data in enumerate(events):
+            if self.delay and i:
+                time.sleep(self.delay)
+            self._write_chunk(data)
+        self._write_chunk(b"")
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_mock_server(port=0, delay=0.0, reply=REPLY, chunk_bytes=0):
+    """Start the stand-in in a daemon thread; returns (server, completions URL)."""
+    handler = type("Handler", (MockOpenRouterHandler,), {"delay": delay, "reply": reply, "chunk_bytes": chunk_bytes})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.requests_seen = 0
+    server.connections = 0
+    server.fail_with = []
+    server.rejected_keys = set()
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, name="mock-openrouter", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}{PATH}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local OpenRouter stand-in.")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--delay", type=float, default=0.02, help="seconds between streamed chunks")
+    args = parser.parse_args(argv)
+
+    server, url = start_mock_server(args.port, args.delay)
+    print(f"Mock OpenRouter listening on {url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,258 @@
+"""
+Process-wide registry for the career model and its label encoder.
+
+The pickles are loaded once, versioned by content hash and published as an
+immutable ``ModelHandle``. Pages ask for ``get_registry().handle()`` on every
+rerun; that call is a dictionary lookup unless the files changed on disk, in
+which case the new model is loaded, warmed up and swapped in atomically while
+the old handle keeps serving.
+
+When ``career_model_compact.npz`` was built from the same pickles
+(forest_compact.py), the handle serves from it and the sklearn pickle is only
+unpickled if a score off the 1/4/7/10 lattice comes in.
+"""
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import joblib
+import numpy as np
+
+from forest_bounds import SETTLED, SettledCheck
+from forest_compact import COMPACT_PATH, open_compact
+from forest_eval import ForestEvaluator
+from lookup_table import LEVELS, TABLE_PATH, open_lookup
+from tracing import span
+
+MODEL_PATH = "career_model_main.pkl"
+ENCODER_PATH = "label_encoder.pkl"
+CHECK_INTERVAL = 10.0
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def model_version(model_path, encoder_path):
+    return file_digest(model_path)[:16] + "-" + file_digest(encoder_path)[:16]
+
+
+# Quiz category -> column name the model was trained with
+CATEGORY_FEATURES = {
+    "Computer Architecture": "Computer Architecture",
+    "Programming Skills": "Programming Skills",
+    "Project Management": "Project Management",
+    "Communication Skills": "Communication skills",
+    "Openness": "Openness",
+    "Conscientiousness": "Conscientiousness",
+    "Extraversion": "Extraversion",
+    "Agreeableness": "Agreeableness",
+    "Emotional Range": "Emotional_Range",
+    "Conversational Skills": "Conversation",
+    "Openness to Change": "Openness to Change",
+    "Hedonism": "Hedonism",
+    "Self-enhancement": "Self-enhancement",
+    "Self-transcendence": "Self-transcendence",
+}
+
+
+@dataclass(frozen=True)
+class ModelHandle:
+    model: object  # None when serving from the compact forest
+    label_encoder: object
+    version: str
+    evaluator: object = None  # ForestEvaluator over the exported (or compact) tree arrays
+    lookup: object = None  # LookupTable for this exact model, when one has been built
+    settle: object = None  # SettledCheck: can the unanswered categories still change the prediction?
+    model_path: str = MODEL_PATH  # unpickled on demand when ``model`` is None
+    loaded_at: float = field(default_factory=time.time)
+
+    @property
+    def feature_names(self):
+        if self.model is None:
+            return list(self.evaluator.arrays.feature_names)
+        return list(self.model.feature_names_in_)
+
+    @property
+    def classes(self):
+        """Encoded labels in predict_proba column order (``model.classes_``)."""
+        return self.model.classes_ if self.model is not None else self.evaluator.classes
+
+    @cached_property
+    def full_evaluator(self):
+        """Evaluator over the pickled model; the compact forest only matches it on the lattice."""
+        if self.model is not None:
+            return self.evaluator
+        with span("model.load_full"):
+            return ForestEvaluator.from_model(joblib.load(self.model_path))
+
+    def _evaluator_for(self, X):
+        if self.model is None and not np.isin(X, LEVELS).all():
+            return self.full_evaluator
+        return self.evaluator
+
+    def align(self, user_data):
+        """Add any feature the model expects but the quiz did not produce, in model order."""
+        for col in self.feature_names:
+            if col not in user_data.columns:
+                user_data[col] = 0
+        return user_data[self.feature_names]
+
+    def vector(self, scores):
+        """Quiz scores keyed by category -> list in model feature order (missing features are 0)."""
+        by_feature = {CATEGORY_FEATURES.get(category, category): value for category, value in scores.items()}
+        return [by_feature.get(col, 0) for col in self.feature_names]
+
+    def decode(self, encoded):
+        """Same as ``label_encoder.inverse_transform([encoded])[0]`` without the validation overhead."""
+        return self.label_encoder.classes_[int(encoded)]
+
+    def predict_vector(self, values):
+        """Decoded career label for one score vector in model feature order."""
+        if self.lookup is not None:
+            encoded = self.lookup.predict_one(values)
+            if encoded is not None:
+                return self.decode(encoded)
+        if self.evaluator is not None:
+            return self.decode(self._evaluator_for(values).predict(values)[0])
+        import pandas as pd
+
+        return self.decode(self.model.predict(pd.DataFrame([values], columns=self.feature_names))[0])
+
+    def predict_scores(self, scores):
+        """Decoded career label straight from the quiz ``scores`` dict."""
+        return self.predict_vector(self.vector(scores))
+
+    def settled(self, scores):
+        """Career every way of finishing the quiz leads to, or None while the answers left can still change it.
+
+        ``scores`` is the quiz ``scores`` dict with None for unanswered categories (forest_bounds.py).
+        """
+        if self.settle is None:
+            return None
+        decision = self.settle.decide(self.vector(scores))
+        return self.decode(decision.encoded) if decision.state == SETTLED else None
+
+    def predict_batch(self, X):
+        """Decoded career labels for an (N, n_features) array in model feature order."""
+        encoded = None
+        if self.lookup is not None:
+            try:
+                encoded = self.lookup.predict(X)
+            except ValueError:
+                pass  # some rows are off the 1/4/7/10 lattice
+        if encoded is None:
+            encoded = self._evaluator_for(X).predict(X)
+        return self.label_encoder.classes_[np.asarray(encoded, dtype=np.int64)]
+
+    def predict(self, user_data):
+        """Predict the decoded career label for an aligned one-row DataFrame."""
+        return self.predict_vector(user_data.iloc[0].tolist())
+
+
+class ModelRegistry:
+    def __init__(self, model_path=MODEL_PATH, encoder_path=ENCODER_PATH, lookup_path=TABLE_PATH,
+                 compact_path=COMPACT_PATH, check_interval=CHECK_INTERVAL):
+        self.model_path = model_path
+        self.encoder_path = encoder_path
+        self.lookup_path = lookup_path
+        self.compact_path = compact_path
+        self.check_interval = check_interval
+        self.last_error = None
+        self.reloads = 0
+        self._handle = None
+        self._stat_signature = None
+        self._checked_at = 0.0
+        self._preload_thread = None
+        self._lock = threading.Lock()
+
+    def handle(self):
+        """Current ModelHandle, or None if the model files cannot be loaded.
+
+        Waits for a preload that is still loading the first model.
+        """
+        preload = self._preload_thread
+        if self._handle is None and preload is not None and preload is not threading.current_thread():
+            preload.join()
+        if self._checked_at == 0.0 or time.monotonic() - self._checked_at >= self.check_interval:
+            self.reload()
+        return self._handle
+
+    def reload(self, force=False):
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                signature = tuple((os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in (self.model_path, self.encoder_path))
+            except OSError as e:
+                self.last_error = e
+                return False
+            if not force and signature == self._stat_signature:
+                return False
+
+            # The signature is only recorded once these files have loaded, so a failed load is retried
+            try:
+                version = model_version(self.model_path, self.encoder_path)
+                model_digest = version.split("-")[0]
+                if not force and self._handle is not None and version == self._handle.version:
+                    self._stat_signature = signature  # touched, same content
+                    return False
+
+                with span("model.load"):
+                    compact = open_compact(version, self.compact_path)
+                    if compact is not None:
+                        model, label_encoder = None, compact.labels
+                        evaluator = ForestEvaluator(compact.arrays)
+                    else:
+                        model, label_encoder = joblib.load(self.model_path), joblib.load(self.encoder_path)
+                        evaluator = ForestEvaluator.from_model(model)
+                    candidate = ModelHandle(model, label_encoder, version,
+                                            evaluator=evaluator,
+                                            lookup=open_lookup(model_digest, self.lookup_path),
+                                            settle=SettledCheck(evaluator), model_path=self.model_path)
+                    warm_up(candidate)
+            except Exception as e:
+                # Keep serving the previous model if the new pickle is broken or half-written
+                self.last_error = e
+                print(f"⚠️ Model reload failed: {e}")
+                return False
+
+            self._handle = candidate
+            self._stat_signature = signature
+            self.last_error = None
+            self.reloads += 1
+            return True
+
+    def preload(self):
+        """Load in a background thread so the first Quiz rerun finds a warm model.
+
+        Safe to call on every rerun: only the first call starts a thread.
+        """
+        with self._lock:
+            if self._preload_thread is None:
+                self._preload_thread = threading.Thread(target=self.handle, name="model-preload", daemon=True)
+                self._preload_thread.start()
+        return self._preload_thread
+
+
+def warm_up(handle):
+    """Run one prediction so tree arrays and work buffers exist before a user is waiting."""
+    handle.predict_vector([1] * len(handle.feature_names))
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+    return _registry
@@ -0,0 +1,343 @@
+"""
+OpenRouter chat completions for the AI Career Mentor, with token streaming.
+
+``stream_chat`` posts with ``"stream": true`` and yields content deltas as
+the server-sent events arrive, so the page can render the reply while it is
+still being generated. Time-to-first-token and total time are written into
+the ``stats`` dict the caller passes in.
+
+``OpenRouterClient`` wraps this in a process-wide keep-alive connection pool,
+retries 429/5xx responses and connection errors with jittered exponential
+backoff, and fails over between the configured API keys: a key that is rate
+limited cools down for the server's ``Retry-After``, a key that is rejected
+(401/402/403) is parked for much longer. Retries only happen before the first
+token is yielded, so a reply is never duplicated.
+
+``OPENROUTER_URL`` overrides the endpoint (e.g. ``mock_openrouter.py`` for
+offline runs). ``python openrouter.py check`` runs the client against the
+mock server and verifies connection reuse, retries and key failover.
+"""
+import json
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+OPENROUTER_URL = os.environ.get("OPENROUTER_URL", "https://openrouter.ai/api/v1/chat/completions")
+DEFAULT_MODEL = "mistralai/voxtral-small-24b-2507"
+TIMEOUT = 60
+POOL_SIZE = 10
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+RATE_LIMIT_COOLDOWN = 20.0   # used when a 429 carries no Retry-After
+REJECTED_KEY_COOLDOWN = 600.0
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+KEY_STATUSES = {401, 402, 403, 429}  # the key itself is the problem -> try the next one
+
+
+class OpenRouterError(Exception):
+    def __init__(self, status_code, body):
+        super().__init__(f"API Error {status_code}: {body}")
+        self.status_code = status_code
+        self.body = body
+
+
+def build_headers(api_key):
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://PathPilot.streamlit.app",
+        "X-Title": "AI Career Mentor",
+    }
+
+
+def iter_sse_data(lines):
+    """Yield the ``data`` payload of each server-sent event from an iterable of text lines.
+
+    Follows the SSE framing rules: ``:`` lines are comments (OpenRouter sends
+    ``: OPENROUTER PROCESSING`` keep-alives), multi-line ``data`` fields are
+    joined with newlines, and a blank line ends an event.
+    """
+    data = []
+    for line in lines:
+        if line is None:
+            continue
+        line = line.rstrip("\r")
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        yield "\n".join(data)
+
+
+def iter_content(events):
+    """Content deltas from OpenRouter stream events, stopping at ``[DONE]``."""
+    for data in events:
+        if data.strip() == "[DONE]":
+            return
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            continue
+        if "error" in chunk:
+            error = chunk["error"]
+            raise OpenRouterError(error.get("code", 500), error.get("message", error))
+        for choice in chunk.get("choices", []):
+            delta = choice.get("delta", {}).get("content")
+            if delta:
+                yield delta
+
+
+def stream_chat(api_key, messages, model=DEFAULT_MODEL, url=None, timeout=TIMEOUT, session=None, stats=None):
+    """Yield the mentor's reply piece by piece.
+
+    Raises ``OpenRouterError`` for non-200 responses and lets ``requests``
+    exceptions through for network failures. ``stats`` (if given) receives
+    ``ttft_ms``, ``total_ms`` and ``chunks``.
+    """
+    stats = stats if stats is not None else {}
+    started = time.perf_counter()
+    post = session.post if session is not None else requests.post
+    response = post(
+        url or OPENROUTER_URL,
+        headers=build_headers(api_key),
+        json={"model": model, "messages": messages, "stream": True},
+        timeout=timeout,
+        stream=True,
+    )
+    if response.status_code != 200:
+        with response:
+            raise OpenRouterError(response.status_code, response.text)
+    yield from _iter_reply(response, started, stats)
+
+
+def _iter_reply(response, started, stats):
+    with response:
+        response.encoding = "utf-8"  # SSE is always UTF-8; requests would guess ISO-8859-1 for text/event-stream
+        stats["chunks"] = 0
+        lines = response.iter_lines(decode_unicode=True)
+        for delta in iter_content(iter_sse_data(lines)):
+            if stats["chunks"] == 0:
+                stats["ttft_ms"] = (time.perf_counter() - started) * 1000
+            stats["chunks"] += 1
+            yield delta
+        for _ in lines:
+            pass  # read past [DONE] to the end of the body so the connection goes back to the pool
+    stats["total_ms"] = (time.perf_counter() - started) * 1000
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """Full-jitter exponential backoff for retry number ``attempt`` (0-based)."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def _retry_after(response):
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        return None
+
+
+class OpenRouterClient:
+    def __init__(self, api_keys, url=None, pool_size=POOL_SIZE, max_retries=MAX_RETRIES, timeout=TIMEOUT,
+                 backoff_base=BACKOFF_BASE, backoff_cap=BACKOFF_CAP):
+        self.api_keys = [k for k in api_keys if k]
+        if not self.api_keys:
+            raise ValueError("At least one OpenRouter API key is required")
+        self.url = url or OPENROUTER_URL
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+        # One keep-alive pool per host; pool_block bounds open sockets under concurrent sessions
+        self.session = requests.Session()
+        self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True, max_retries=0)
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+
+        self._lock = threading.Lock()
+        self._cooldown_until = [0.0] * len(self.api_keys)
+        self._metrics = {"requests": 0, "attempts": 0, "retries": 0, "failovers": 0, "errors": 0,
+                         "key_errors": [0] * len(self.api_keys)}
+
+    # -----------------------------
+    # KEY SELECTION
+    # -----------------------------
+    def _pick_key(self, exclude=()):
+        """Index of the first usable key (primary first), else the one that recovers soonest."""
+        now = time.monotonic()
+        with self._lock:
+            order = [i for i in range(len(self.api_keys)) if i not in exclude] or list(range(len(self.api_keys)))
+            ready = [i for i in order if self._cooldown_until[i] <= now]
+            return ready[0] if ready else min(order, key=lambda i: self._cooldown_until[i])
+
+    def _penalize(self, index, seconds):
+        with self._lock:
+            self._cooldown_until[index] = max(self._cooldown_until[index], time.monotonic() + seconds)
+            self._metrics["key_errors"][index] += 1
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._metrics[name] += n
+
+    # -----------------------------
+    # REQUESTS
+    # -----------------------------
+    def _open(self, messages, model):
+        """POST a streaming completion, retrying and failing over until a 200 arrives."""
+        self._count("requests")
+        tried = set()
+        attempt = 0
+        while True:
+            index = self._pick_key(tried)
+            wait = self._cooldown_until[index] - time.monotonic()
+            if wait > 0:
+                time.sleep(min(wait, self.backoff_cap))
+            self._count("attempts")
+            try:
+                response = self.session.post(
+                    self.url,
+                    headers=build_headers(self.api_keys[index]),
+                    json={"model": model, "messages": messages, "stream": True},
+                    timeout=self.timeout,
+                    stream=True,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    self._count("errors")
+                    raise
+                time.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+                attempt += 1
+                self._count("retries")
+                continue
+
+            status = response.status_code
+            if status == 200:
+                return response
+            body = response.text  # read error bodies fully so the connection stays reusable
+            response.close()
+            if status not in RETRY_STATUSES and status not in KEY_STATUSES or attempt >= self.max_retries:
+                self._count("errors")
+                raise OpenRouterError(status, body)
+
+            retry_after = _retry_after(response)
+            if status in KEY_STATUSES:
+                self._penalize(index, REJECTED_KEY_COOLDOWN if status != 429 else retry_after or RATE_LIMIT_COOLDOWN)
+                tried.add(index)
+                if len(tried) < len(self.api_keys):
+                    self._count("failovers")  # switch keys straight away, no backoff
+                    attempt += 1
+                    self._count("retries")
+                    continue
+                tried = set()
+            if retry_after is None:
+                retry_after = backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+            time.sleep(min(retry_after, self.backoff_cap))
+            attempt += 1
+            self._count("retries")
+
+    def stream_chat(self, messages, model=DEFAULT_MODEL, stats=None):
+        """Like the module-level ``stream_chat``, over the pooled session with retries and key failover."""
+        stats = stats if stats is not None else {}
+        started = time.perf_counter()
+        response = self._open(messages, model)
+        yield from _iter_reply(response, started, stats)
+
+    # -----------------------------
+    # METRICS
+    # -----------------------------
+    def metrics(self):
+        """Request/retry counters plus connection reuse from the urllib3 pools."""
+        with self._lock:
+            m = dict(self._metrics, key_errors=list(self._metrics["key_errors"]))
+            m["keys_cooling"] = sum(1 for t in self._cooldown_until if t > time.monotonic())
+        opened = sent = 0
+        for key in list(self._adapter.poolmanager.pools.keys()):
+            pool = self._adapter.poolmanager.pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                sent += pool.num_requests
+        m["connections_opened"] = opened
+        m["connections_reused"] = max(0, sent - opened)
+        return m
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_openrouter_client(api_keys):
+    """Process-wide client for ``api_keys`` (rebuilt only if the configured keys change)."""
+    global _client
+    keys = [k for k in api_keys if k]
+    with _client_lock:
+        if _client is None or _client.api_keys != keys:
+            if _client is not None:
+                _client.close()
+            _client = OpenRouterClient(keys)
+    return _client
+
+
+def self_check():
+    """Exercise pooling, retries and key failover against ``mock_openrouter``; returns a list of failures."""
+    from mock_openrouter import start_mock_server
+
+    server, url = start_mock_server()
+    messages = [{"role": "user", "content": "How do I become a data scientist?"}]
+    failures = []
+    try:
+        client = OpenRouterClient(["key-1", "key-2"], url=url, backoff_base=0.01, backoff_cap=0.05)
+        for _ in range(5):
+            "".join(client.stream_chat(messages))
+        if server.connections != 1:
+            failures.append(f"keep-alive: {server.connections} connections for 5 requests")
+
+        server.fail_with = [503, 502]
+        if not "".join(client.stream_chat(messages)) or client.metrics()["retries"] != 2:
+            failures.append(f"5xx retry: {client.metrics()}")
+
+        server.rejected_keys = {"key-1"}
+        "".join(client.stream_chat(messages))
+        "".join(client.stream_chat(messages))
+        if client.metrics()["key_errors"] != [1, 0]:
+            failures.append(f"failover: key-1 should be parked after one 401, got {client.metrics()}")
+
+        server.fail_with = [400]
+        try:
+            "".join(client.stream_chat(messages))
+            failures.append("400 should not be retried")
+        except OpenRouterError as e:
+            if e.status_code != 400:
+                failures.append(f"expected 400, got {e.status_code}")
+        print(client.metrics())
+    finally:
+        server.shutdown()
+    return failures
+
+
+if __name__ == "__main__":
+    import sys
+
+    if sys.argv[1:] != ["check"]:
+        raise SystemExit("usage: python openrouter.py check")
+    problems = self_check()
+    for problem in problems:
+        print(f"❌ {problem}")
+    print("✅ OpenRouter client OK" if not problems else f"{len(problems)} check(s) failed")
+    raise SystemExit(1 if problems else 0)
@@ -0,0 +1,165 @@
+"""
+Static page assets: stylesheets and icons, and what each rerun sends.
+
+Stylesheets (``assets/css/*.css``) and SVG icons (``assets/icons/*.svg``) are
+read and minified once per process. Every rerun of a page goes through one
+``PageAssets``, which sends each stylesheet at most once per rerun, sends
+raw HTML through ``html`` and counts the bytes of markup the rerun sent. At
+the end of the run ``finish`` records the total in ``PayloadStats`` and checks
+it against the page's budget in ``PAYLOAD_BUDGETS``: going over prints a
+warning, or raises ``PayloadBudgetExceeded`` when ``PATHPILOT_PAYLOAD_STRICT``
+is set (the benchmarks run that way).
+
+    python page_assets.py report
+"""
+import argparse
+import glob
+import os
+import re
+import threading
+
+CSS_DIR = os.path.join("assets", "css")
+ICON_DIR = os.path.join("assets", "icons")
+
+# HTML/CSS bytes one rerun of a page may send through PageAssets
+PAYLOAD_BUDGETS = {
+    "Home": 8 * 1024,
+    "Quiz": 24 * 1024,
+    "Chatbot": 12 * 1024,  # the first visit re-sends the notice markup on each countdown tick
+}
+STRICT = os.environ.get("PATHPILOT_PAYLOAD_STRICT", "") not in ("", "0")
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_SPACE = re.compile(r"\s+")
+_PUNCT = re.compile(r"\s*([{};:,>])\s*")
+
+
+class PayloadBudgetExceeded(RuntimeError):
+    pass
+
+
+def minify_css(css):
+    css = _COMMENTS.sub("", css)
+    css = _PUNCT.sub(r"\1", _SPACE.sub(" ", css))
+    return css.replace(";}", "}").strip()
+
+
+def minify_svg(svg):
+    return re.sub(r">\s+<", "><", _SPACE.sub(" ", svg)).strip()
+
+
+def _load(directory, suffix, minify):
+    assets = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*" + suffix))):
+        with open(path, encoding="utf-8") as fh:
+            assets[os.path.basename(path)[:-len(suffix)]] = minify(fh.read())
+    return assets
+
+
+STYLES = _load(CSS_DIR, ".css", minify_css)
+ICONS = _load(ICON_DIR, ".svg", minify_svg)
+
+
+def icon(name):
+    """Inline SVG markup for ``name`` ("" if there is no such icon)."""
+    return ICONS.get(name, "")
+
+
+# -----------------------------
+# PER-RERUN EMITTER
+# -----------------------------
+class PageAssets:
+    """Sends a page's styles and HTML for one rerun and counts the bytes."""
+
+    def __init__(self, page, budget=None, emit=None):
+        self.page = page
+        self.budget = PAYLOAD_BUDGETS.get(page) if budget is None else budget
+        self.sent = 0
+        self._styles = set()
+        self._emit = emit
+
+    def _send(self, markup, target=None):
+        if target is not None:
+            target.markdown(markup, unsafe_allow_html=True)
+        elif self._emit is not None:
+            self._emit(markup, unsafe_allow_html=True)
+        else:
+            import streamlit as st
+            st.markdown(markup, unsafe_allow_html=True)
+        self.sent += len(markup.encode("utf-8"))
+
+    def style(self, *names):
+        """Send the named stylesheets, skipping any this rerun already sent."""
+        css = "".join(STYLES[name] for name in names if name not in self._styles)
+        self._styles.update(names)
+        if css:
+            self._send(f"<style>{css}</style>")
+
+    def html(self, markup, target=None):
+        """Send raw HTML, into ``target`` (e.g. an ``st.empty()``) if given."""
+        self._send(markup, target)
+
+    def finish(self):
+        """Record this rerun's payload and check it against the page budget."""
+        get_payload_stats().record(self.page, self.sent)
+        if self.budget is not None and self.sent > self.budget:
+            message = f"{self.page} sent {self.sent} bytes of HTML/CSS (budget {self.budget})"
+            if STRICT:
+                raise PayloadBudgetExceeded(message)
+            print(f"⚠️ {message}")
+        return self.sent
+
+
+class PayloadStats:
+    def __init__(self):
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def record(self, page, sent):
+        with self._lock:
+            runs, total, peak, _ = self._pages.get(page, (0, 0, 0, 0))
+            self._pages[page] = (runs + 1, total + sent, max(peak, sent), sent)
+
+    def snapshot(self):
+        """{page: {"runs", "last", "avg", "max", "budget"}} in bytes."""
+        with self._lock:
+            pages = dict(self._pages)
+        return {page: {"runs": runs, "last": last, "avg": total / runs, "max": peak,
+                       "budget": PAYLOAD_BUDGETS.get(page)}
+                for page, (runs, total, peak, last) in pages.items()}
+
+
+_stats = None
+_stats_lock = threading.Lock()
+
+
+def get_payload_stats():
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = PayloadStats()
+    return _stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show the size of the page stylesheets and icons.")
+    parser.add_argument("command", choices=["report"])
+    parser.parse_args(argv)
+
+    raw_total = min_total = 0
+    for name in STYLES:
+        with open(os.path.join(CSS_DIR, name + ".css"), encoding="utf-8") as fh:
+            raw = len(fh.read().encode("utf-8"))
+        size = len(STYLES[name].encode("utf-8"))
+        raw_total, min_total = raw_total + raw, min_total + size
+        print(f"{name + '.css':24} {raw:6} -> {size:6} bytes")
+    print(f"{'stylesheets':24} {raw_total:6} -> {min_total:6} bytes")
+    icons = sum(len(svg.encode("utf-8")) for svg in ICONS.values())
+    print(f"{len(ICONS)} icons, {icons} bytes")
+    for page, budget in PAYLOAD_BUDGETS.items():
+        print(f"budget {page:8} {budget:6} bytes per rerun")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+"""
+Compiled quiz bank shared by every Streamlit session in the process.
+
+The 14 category CSVs in ``quiz_data/`` are parsed and normalized once into
+plain tuples (questions, options, answers). Reruns only read the in-memory
+copy; the files are re-checked by mtime at most every ``check_interval``
+seconds and only re-parsed when their content hash actually changes.
+"""
+import glob
+import hashlib
+import io
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+
+from tracing import span
+
+QUIZ_FOLDER = "quiz_data"
+CHECK_INTERVAL = 5.0
+
+
+@dataclass(frozen=True)
+class QuizCategory:
+    name: str
+    path: str
+    questions: tuple
+    options: tuple      # one tuple of de-duplicated choices per question (answer included)
+    answers: tuple
+
+    def __len__(self):
+        return len(self.questions)
+
+
+def category_key(category):
+    """Map a display name ("Openness to Change") to its file stem ("openness_to_change")."""
+    return category.lower().replace(" ", "_")
+
+
+def compile_category(path, data=None):
+    """Read one quiz CSV (or its already-read bytes) and normalize it the same way the Quiz page always has."""
+    df = pd.read_csv(path if data is None else io.BytesIO(data), dtype=str)
+    df = df.dropna(how="all")  # remove empty rows
+    df = df.fillna("")  # replace nan with empty string
+    df = df[df["question"].str.strip() != ""]  # only rows with valid questions
+    df = df[df["answer"].str.strip() != ""]  # only rows with valid answers
+
+    questions, options, answers = [], [], []
+    for _, row in df.iterrows():
+        choices = [opt.strip() for opt in [row.get("option1", ""), row.get("option2", ""), row.get("option3", ""), row.get("answer", "")]
+                   if opt and opt.lower() != "nan"]
+        questions.append(row["question"].strip())
+        options.append(tuple(dict.fromkeys(choices)))
+        answers.append(row["answer"].strip())
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return QuizCategory(stem, path, tuple(questions), tuple(options), tuple(answers))
+
+
+class QuizBank:
+    def __init__(self, folder=QUIZ_FOLDER, check_interval=CHECK_INTERVAL):
+        self.folder = folder
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._loaded = (None, {})  # (content hash, {stem: QuizCategory}) from one load
+        self._stat_signature = None
+        self._checked_at = 0.0
+        self.reloads = 0
+
+    @property
+    def version(self):
+        return self.snapshot()[0]
+
+    def snapshot(self):
+        """(version, {file stem: QuizCategory}) from the same load, so a rerun never mixes two banks."""
+        self._refresh_if_due()
+        return self._loaded
+
+    def get(self, category):
+        """Return the compiled QuizCategory for a display name, or None if its CSV is missing."""
+        return self.snapshot()[1].get(category_key(category))
+
+    def categories(self):
+        return dict(self.snapshot()[1])
+
+    def refresh(self, force=False):
+        with self._lock:
+            self._checked_at = time.monotonic()
+            # Files can be replaced or deleted between the glob, the stat and the read (that is what a hot
+            # reload looks like); keep serving the previous bank and look again on the next check
+            stats, contents, missed = {}, {}, False
+            for p in sorted(glob.glob(os.path.join(self.folder, "*.csv"))):
+                try:
+                    info = os.stat(p)
+                except OSError:
+                    missed = True
+                    continue
+                stats[p] = (info.st_mtime_ns, info.st_size)
+            signature = tuple(stats.items())
+            if not force and signature == self._stat_signature:
+                return False
+
+            digest = hashlib.sha256()
+            for p in stats:
+                try:
+                    with open(p, "rb") as fh:
+                        contents[p] = fh.read()
+                except OSError as e:
+                    print(f"⚠️ Error reading {p}: {e}")
+                    missed = True
+                    continue
+                digest.update(p.encode())
+                digest.update(contents[p])
+            previous_hash = self._loaded[0]
+            if missed and previous_hash is not None:
+                self._stat_signature = None
+                return False
+            self._stat_signature = None if missed else signature
+            content_hash = digest.hexdigest()
+            if not force and content_hash == previous_hash:
+                # Touched but unchanged (e.g. a checkout) - keep the compiled copy
+                return False
+
+            compiled = {}
+            with span("quiz.parse"):
+                for p, data in contents.items():
+                    try:
+                        quiz = compile_category(p, data)
+                    except Exception as e:
+                        print(f"⚠️ Error loading {p}: {e}")
+                        continue
+                    compiled[quiz.name] = quiz
+
+            # Swap in one assignment so readers never see a half-built bank
+            self._loaded = (content_hash, compiled)
+            self.reloads += 1
+            return True
+
+    def _refresh_if_due(self):
+        if self._checked_at == 0.0 or time.monotonic() - self._checked_at >= self.check_interval:
+            self.refresh()
+
+
+_banks = {}
+_banks_lock = threading.Lock()
+
+
+def get_quiz_bank(folder=QUIZ_FOLDER):
+    """Process-wide QuizBank for ``folder`` (one instance shared by all sessions)."""
+    with _banks_lock:
+        bank = _banks.get(folder)
+        if bank is None:
+            bank = _banks[folder] = QuizBank(folder)
+    return bank
@@ -0,0 +1,314 @@
+"""
+Report rendering service: PDF jobs run in a small process pool, off the
+Streamlit script threads.
+
+Pages ``submit`` a job (a module-level render function plus picklable
+arguments) and get a job id back, then poll ``status`` until it is done and
+fetch the bytes with ``result``. Jobs are deduplicated by key, so fifty
+students asking for the same report share one render, and finished results
+are kept in a small LRU. Results larger than ``SPOOL_THRESHOLD`` are written to
+a temporary file by the worker and served from disk, so neither the pool pipe
+nor the LRU holds them in memory. Each worker is a one-process pool, started
+once when the app starts; jobs with the same ``affinity`` (a chat session)
+always go to the same worker, so its per-session caches are reused, and other
+jobs go to the least busy worker. At most ``max_pending`` jobs may be queued or
+running; beyond that ``submit`` raises ``ServiceBusy`` so the page can ask the
+user to retry instead of piling work up. A job that has not finished ``job_timeout``
+seconds after submission is reported as timed out (and cancelled if it has
+not started yet).
+"""
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from tracing import current_page, get_tracer
+
+WORKERS = int(os.environ.get("PATHPILOT_REPORT_WORKERS", min(2, os.cpu_count() or 1)))
+MAX_PENDING = 32
+JOB_TIMEOUT = 60.0
+KEEP_RESULTS = 64
+SPOOL_THRESHOLD = 2 * 1024 * 1024  # results larger than this are written to a temporary file
+
+PENDING, RUNNING, DONE, FAILED, TIMEOUT = "pending", "running", "done", "failed", "timeout"
+
+
+# Guards every worker launch; spawn reads sys.modules["__main__"] while a process starts
+_launch_lock = threading.Lock()
+
+
+@contextmanager
+def _hidden_main():
+    """Spawn without re-running the Streamlit script in the child.
+
+    Streamlit installs the page script as ``__main__``, and spawn re-executes
+    ``__main__.__file__`` in every child, so it is replaced while workers start.
+    """
+    main = sys.modules.get("__main__")
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
+
+
+class ServiceBusy(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class _Spooled:
+    path: str
+    size: int
+
+
+def _render_job(spool_dir, spool_threshold, fn, *args):
+    """Run ``fn(*args)`` in the worker; large results go to a file in ``spool_dir`` instead of the pipe."""
+    data = fn(*args)
+    if len(data) <= spool_threshold:
+        return data
+    fd, path = tempfile.mkstemp(suffix=".pdf", dir=spool_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return _Spooled(path, len(data))
+
+
+@dataclass(frozen=True)
+class JobStatus:
+    job_id: str
+    state: str
+    position: int = 0      # jobs ahead of this one (pending only)
+    elapsed: float = 0.0
+    error: str = ""
+
+
+class _Job:
+    def __init__(self, job_id, key, worker, future):
+        self.job_id = job_id
+        self.key = key
+        self.worker = worker
+        self.future = future
+        self.submitted = time.monotonic()
+        self.page = current_page()
+        self.state = PENDING
+        self.error = ""
+        self.data = None       # bytes, or _Spooled for large results
+        self.finished = None
+
+    def discard(self):
+        if isinstance(self.data, _Spooled):
+            try:
+                os.remove(self.data.path)
+            except OSError:
+                pass
+        self.data = None
+
+
+class ReportService:
+    def __init__(self, workers=WORKERS, max_pending=MAX_PENDING, job_timeout=JOB_TIMEOUT, keep_results=KEEP_RESULTS,
+                 spool_threshold=SPOOL_THRESHOLD):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.job_timeout = job_timeout
+        self.keep_results = keep_results
+        self.spool_threshold = spool_threshold
+        self._spool_dir = tempfile.mkdtemp(prefix="pathpilot-reports-")
+        self._executors = [None] * self.workers
+        self._started = False
+        self._lock = threading.RLock()  # cancel() in _expire runs _finish synchronously
+        self._jobs = OrderedDict()     # job_id -> _Job, in submission order
+        self._by_key = {}              # key -> job_id of the live or finished job
+        self._metrics = {"submitted": 0, "deduplicated": 0, "rejected": 0, "done": 0, "failed": 0, "timeouts": 0,
+                         "restarts": 0, "total_render_s": 0.0}
+
+    def start(self):
+        """Launch every worker process now, in one go.
+
+        Called once at startup (``get_report_service``), never per request: while
+        workers start ``__main__`` is swapped out for the whole process. After that
+        it only runs to replace a worker whose process died.
+        """
+        spawn = multiprocessing.get_context("spawn")  # forking a process that runs Streamlit's threads is not safe
+        with _launch_lock, _hidden_main():
+            for i, executor in enumerate(self._executors):
+                if executor is None:
+                    executor = self._executors[i] = ProcessPoolExecutor(1, mp_context=spawn)
+                    executor.submit(os.getpid)  # the pool starts its process inside submit()
+        self._started = True
+
+    def _pool(self, worker):
+        if not self._started:
+            raise RuntimeError("ReportService.start() has not been called")
+        if self._executors[worker] is None:
+            self.start()
+        return self._executors[worker]
+
+    def _replace(self, worker, executor):
+        """Drop a broken pool (its process died: OOM, a crash in a render); the next job starts a new one."""
+        if self._executors[worker] is executor:
+            self._executors[worker] = None
+            self._metrics["restarts"] += 1
+            print(f"⚠️ Report worker {worker} stopped unexpectedly; starting a new one")
+
+    def _pick_worker(self, affinity):
+        if affinity is not None:
+            return zlib.crc32(str(affinity).encode()) % self.workers
+        load = [0] * self.workers
+        for job in self._jobs.values():
+            if job.state in (PENDING, RUNNING):
+                load[job.worker] += 1
+        return load.index(min(load))
+
+    # -----------------------------
+    # JOBS
+    # -----------------------------
+    def submit(self, key, fn, *args, affinity=None):
+        """Queue ``fn(*args)`` (returning bytes) and return a job id; raises ``ServiceBusy`` when full.
+
+        Jobs with the same ``affinity`` run on the same worker process.
+        """
+        with self._lock:
+            self._expire()
+            job_id = self._by_key.get(key)
+            if job_id is not None and self._jobs[job_id].state in (PENDING, RUNNING, DONE):
+                self._metrics["deduplicated"] += 1
+                return job_id
+            if self._active() >= self.max_pending:
+                self._metrics["rejected"] += 1
+                raise ServiceBusy(f"{self.max_pending} reports are already being prepared")
+            job_id = uuid.uuid4().hex
+            worker = self._pick_worker(affinity)
+            executor = self._pool(worker)
+            try:
+                future = executor.submit(_render_job, self._spool_dir, self.spool_threshold, fn, *args)
+            except BrokenProcessPool:
+                self._replace(worker, executor)
+                executor = self._pool(worker)
+                future = executor.submit(_render_job, self._spool_dir, self.spool_threshold, fn, *args)
+            job = _Job(job_id, key, worker, future)
+            self._jobs[job_id] = job
+            self._by_key[key] = job_id
+            self._metrics["submitted"] += 1
+        job.future.add_done_callback(lambda future: self._finish(job, executor))
+        return job_id
+
+    def status(self, job_id):
+        with self._lock:
+            self._expire()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return JobStatus(job_id, FAILED, error="Unknown or expired job")
+            if job.state == PENDING and job.future.running():
+                job.state = RUNNING
+            position = 0
+            if job.state == PENDING:
+                position = sum(1 for j in self._jobs.values() if j.worker == job.worker and j.submitted < job.submitted
+                               and j.state == PENDING and not j.future.running())
+            end = job.finished or time.monotonic()
+            return JobStatus(job_id, job.state, position, end - job.submitted, job.error)
+
+    def result(self, job_id):
+        """Rendered bytes of a finished job (an open binary file for spooled results), or None."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state != DONE:
+                return None
+            self._jobs.move_to_end(job_id)  # recently used results are evicted last
+            data = job.data
+            if isinstance(data, _Spooled):
+                # Opened under the lock so eviction cannot remove the file first; once open it stays readable
+                return open(data.path, "rb")
+        return data
+
+    def _finish(self, job, executor):
+        broken = False
+        try:
+            data = job.future.result()
+            state, error = DONE, ""
+        except CancelledError:
+            data, state, error = None, TIMEOUT, "Timed out"
+        except BrokenProcessPool:
+            data, state, error, broken = None, FAILED, "the report worker stopped unexpectedly", True
+        except Exception as e:
+            data, state, error = None, FAILED, f"{type(e).__name__}: {e}"
+        with self._lock:
+            if broken:
+                self._replace(job.worker, executor)
+            job.data = data
+            if job.state == TIMEOUT:
+                job.discard()  # already reported; drop the late result
+                return
+            job.state, job.error = state, error
+            job.finished = time.monotonic()
+            if state == DONE:
+                self._metrics["done"] += 1
+                self._metrics["total_render_s"] += job.finished - job.submitted
+                get_tracer().record("report.job", job.finished - job.submitted, job.page)
+            elif state == FAILED:
+                self._metrics["failed"] += 1
+            self._trim()
+
+    def _expire(self):
+        """Time out jobs that are still unfinished after ``job_timeout`` (call with the lock held)."""
+        now = time.monotonic()
+        for job in self._jobs.values():
+            if job.state in (PENDING, RUNNING) and now - job.submitted > self.job_timeout:
+                job.state, job.error, job.finished = TIMEOUT, f"Timed out after {self.job_timeout:.0f}s", now
+                job.future.cancel()  # only succeeds if it never started
+                self._metrics["timeouts"] += 1
+
+    def _trim(self):
+        finished = [j for j in self._jobs.values() if j.state not in (PENDING, RUNNING)]
+        for job in finished[:max(0, len(finished) - self.keep_results)]:
+            job.discard()
+            del self._jobs[job.job_id]
+            if self._by_key.get(job.key) == job.job_id:
+                del self._by_key[job.key]
+
+    def _active(self):
+        # A timed-out job that already started still holds a worker until it returns
+        return sum(1 for j in self._jobs.values()
+                   if j.state in (PENDING, RUNNING) or (j.state == TIMEOUT and not j.future.done()))
+
+    # -----------------------------
+    # LIFECYCLE & METRICS
+    # -----------------------------
+    def metrics(self):
+        with self._lock:
+            m = dict(self._metrics)
+            m["active"] = self._active()
+            m["kept_results"] = sum(1 for j in self._jobs.values() if j.state == DONE)
+        m["avg_render_s"] = m["total_render_s"] / m["done"] if m["done"] else 0.0
+        return m
+
+    def shutdown(self, wait=True):
+        for i, executor in enumerate(self._executors):
+            if executor is not None:
+                executor.shutdown(wait=wait, cancel_futures=True)
+                self._executors[i] = None
+        shutil.rmtree(self._spool_dir, ignore_errors=True)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_report_service():
+    """Process-wide service; its worker processes are started by the first call (app startup)."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ReportService()
+            _service.start()
+    return _service
@@ -0,0 +1,242 @@
+"""
+Storage for quiz results and predictions.
+
+``SqliteResultsBackend`` (the default) keeps one indexed row per user, upserted
+by user id / email / name, plus an append-only history of every attempt. The
+database runs in WAL mode with one connection per thread, so many Streamlit
+sessions can save at once and a save costs the same with ten users or ten
+million. ``CsvResultsBackend`` keeps the original ``user_results.csv``
+behaviour, and the SQLite store can export that same CSV for compatibility.
+
+    python results_store.py export user_results.csv
+    python results_store.py import user_results.csv
+"""
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+DB_PATH = "user_results.db"
+CSV_PATH = "user_results.csv"
+BACKEND_ENV = "PATHPILOT_RESULTS_BACKEND"
+
+INFO_COLUMNS = [
+    ("Full Name", "name"), ("Age", "age"), ("Gender", "gender"), ("City", "city"), ("State", "state"),
+    ("Country", "country"), ("Career Goal", "goal"), ("Hobbies", "hobbies"), ("Email", "email"), ("CGPA", "cgpa"),
+]
+
+
+def build_record(user_info, scores, predicted_career):
+    """One flat row: timestamp, user info, prediction, then the quiz section scores."""
+    record = {"Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+    for column, key in INFO_COLUMNS:
+        record[column] = user_info.get(key, "")
+    record["Predicted Career"] = predicted_career.item() if hasattr(predicted_career, "item") else predicted_career
+
+    # Add quiz section scores
+    for key, val in scores.items():
+        record[key] = val if val is not None else ""
+    return record
+
+
+def user_key(user_info):
+    """Stable identity for upserts: explicit user id, then email, then name."""
+    if user_info.get("user_id"):
+        return f"id:{user_info['user_id']}"
+    if str(user_info.get("email", "")).strip():
+        return f"email:{user_info['email'].strip().lower()}"
+    if str(user_info.get("name", "")).strip():
+        return f"name:{user_info['name'].strip().lower()}"
+    return f"anon:{uuid.uuid4().hex}"
+
+
+class ResultsBackend(ABC):
+    def save(self, user_info, scores, predicted_career):
+        return self.save_record(user_key(user_info), build_record(user_info, scores, predicted_career))
+
+    @abstractmethod
+    def save_record(self, key, record):
+        """Upsert one record under ``key``."""
+
+    def save_many(self, items):
+        """Save several (key, record) pairs; backends override this to batch."""
+        for key, record in items:
+            self.save_record(key, record)
+
+
+class CsvResultsBackend(ResultsBackend):
+    """The original read-modify-write CSV store (one row per Full Name)."""
+
+    def __init__(self, file_path=CSV_PATH):
+        self.file_path = file_path
+        self._lock = threading.Lock()  # serializes writers within this process only
+        import pandas  # noqa: F401 - import now, not in a writer thread during interpreter shutdown
+
+    def save_record(self, key, record):
+        with self._lock:
+            self._save_record(record)
+
+    def _save_record(self, record):
+        import pandas as pd
+
+        new_entry = pd.DataFrame([record])
+
+        # Append to CSV (create if not exists)
+        if os.path.exists(self.file_path):
+            existing = pd.read_csv(self.file_path)
+            # Update if same name already exists (overwrite old record)
+            if record["Full Name"] in existing["Full Name"].values:
+                existing.loc[existing["Full Name"] == record["Full Name"], :] = new_entry.values[0]
+                existing.to_csv(self.file_path, index=False)
+            else:
+                new_entry.to_csv(self.file_path, mode="a", header=False, index=False)
+        else:
+            new_entry.to_csv(self.file_path, index=False)
+
+
+class SqliteResultsBackend(ResultsBackend):
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS results (
+        user_key    TEXT PRIMARY KEY,
+        first_seen  TEXT NOT NULL,
+        updated_at  TEXT NOT NULL,
+        attempts    INTEGER NOT NULL DEFAULT 1,
+        record      TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS attempts (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_key    TEXT NOT NULL,
+        created_at  TEXT NOT NULL,
+        record      TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS attempts_by_user ON attempts (user_key, id);
+    """
+
+    def __init__(self, db_path=DB_PATH, legacy_csv=CSV_PATH, busy_timeout_ms=10000):
+        self.db_path = db_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        is_new = not os.path.exists(db_path)
+        conn = self._connection()
+        conn.executescript(self.SCHEMA)
+        if is_new and legacy_csv and os.path.exists(legacy_csv):
+            # First run next to a legacy CSV: carry the existing users over
+            self.import_csv(legacy_csv)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # One connection per thread; sqlite3 connections must not be shared across threads
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+        return conn
+
+    def save_record(self, key, record):
+        self.save_many([(key, record)])
+
+    def save_many(self, items):
+        conn = self._connection()
+        # IMMEDIATE takes the write lock up front, so concurrent writers queue
+        # on busy_timeout instead of failing on a read->write lock upgrade
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for key, record in items:
+                payload = json.dumps(record, default=str)
+                now = record.get("Timestamp") or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                conn.execute("INSERT INTO attempts (user_key, created_at, record) VALUES (?, ?, ?)", (key, now, payload))
+                conn.execute(
+                    """
+                    INSERT INTO results (user_key, first_seen, updated_at, attempts, record) VALUES (?, ?, ?, 1, ?)
+                    ON CONFLICT (user_key) DO UPDATE SET
+                        updated_at = excluded.updated_at,
+                        attempts = results.attempts + 1,
+                        record = excluded.record
+                    """,
+                    (key, now, now, payload),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def latest(self, key):
+        row = self._connection().execute("SELECT record FROM results WHERE user_key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def history(self, key):
+        rows = self._connection().execute(
+            "SELECT record FROM attempts WHERE user_key = ? ORDER BY id", (key,)).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def count(self):
+        return self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def export_csv(self, path=CSV_PATH):
+        """Write the latest record per user in the legacy ``user_results.csv`` layout.
+
+        Streams in two passes (header, then rows) so millions of users never sit in memory.
+        """
+        conn = self._connection()
+        columns = {}
+        for (payload,) in conn.execute("SELECT record FROM results ORDER BY rowid"):
+            columns.update(dict.fromkeys(json.loads(payload)))
+        rows = 0
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(columns))
+            writer.writeheader()
+            for (payload,) in conn.execute("SELECT record FROM results ORDER BY rowid"):
+                writer.writerow(json.loads(payload))
+                rows += 1
+        return rows
+
+    def import_csv(self, path=CSV_PATH):
+        with open(path, newline="", encoding="utf-8") as fh:
+            items = []
+            for row in csv.DictReader(fh):
+                info = {"email": row.get("Email", ""), "name": row.get("Full Name", "")}
+                items.append((user_key(info), row))
+        self.save_many(items)
+        return len(items)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_results_store():
+    """Process-wide results backend; ``PATHPILOT_RESULTS_BACKEND=csv`` keeps the legacy CSV store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            if os.environ.get(BACKEND_ENV, "sqlite").lower() == "csv":
+                _store = CsvResultsBackend()
+            else:
+                _store = SqliteResultsBackend()
+    return _store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export or import PathPilot results.")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("csv_path", nargs="?", default=CSV_PATH)
+    parser.add_argument("--db", default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    store = SqliteResultsBackend(args.db, legacy_csv=None)
+    if args.command == "export":
+        print(f"✅ Exported {store.export_csv(args.csv_path):,} users to {args.csv_path}")
+    else:
+        print(f"✅ Imported {store.import_csv(args.csv_path):,} rows from {args.csv_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+# The app is a flat set of top-level modules run from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from forest_eval import ForestEvaluator  # noqa: E402
+from lookup_table import LEVELS  # noqa: E402
+from model_registry import CATEGORY_FEATURES  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def model():
+    """Seeded stand-in for the career forest (same recipe as bench_pages.train_fixture_model, smaller)."""
+    features = list(CATEGORY_FEATURES.values())
+    rng = np.random.default_rng(0)
+    X = rng.choice(LEVELS, size=(3000, len(features)))
+    y = np.argmax(X @ rng.normal(size=(len(features), 6)) + rng.normal(scale=8, size=(len(X), 6)), axis=1)
+    return RandomForestClassifier(n_estimators=30, max_depth=10, random_state=0).fit(pd.DataFrame(X, columns=features), y)
+
+
+@pytest.fixture(scope="session")
+def evaluator(model):
+    return ForestEvaluator.from_model(model)
@@ -0,0 +1,49 @@
+import re
+import zlib
+
+import chat_export
+from chat_export import TranscriptExporter
+
+
+def pdf_text(data):
+    """Text drawn in a PDF (fpdf2 deflates page content streams)."""
+    streams = re.findall(rb"stream\r?\n(.*?)\r?\nendstream", data, re.S)
+    text = []
+    for stream in streams:
+        try:
+            text.append(zlib.decompress(stream).decode("latin-1"))
+        except zlib.error:
+            text.append(stream.decode("latin-1"))
+    return "".join(text)
+
+
+def turns(*contents):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": c} for i, c in enumerate(contents)]
+
+
+def test_new_turns_extend_the_cached_layout():
+    exporter = TranscriptExporter("bio")
+    exporter.pdf(turns("alpha", "beta"))
+    layout = exporter._pdf
+    text = pdf_text(exporter.pdf(turns("alpha", "beta", "gamma")))
+    assert exporter._pdf is layout
+    assert all(word in text for word in ("alpha", "beta", "gamma"))
+
+
+def test_replaced_history_of_the_same_length_is_laid_out_again():
+    exporter = TranscriptExporter("bio")
+    exporter.pdf(turns("alpha", "beta"))
+    text = pdf_text(exporter.pdf(turns("delta", "epsilon")))
+    assert "delta" in text and "epsilon" in text
+    assert "alpha" not in text and "beta" not in text
+
+    text = pdf_text(exporter.pdf(turns("delta", "epsilon")))  # same history again: no stale copy either
+    assert "delta" in text and "alpha" not in text
+
+
+def test_long_transcripts_are_not_kept_laid_out(monkeypatch):
+    monkeypatch.setattr(chat_export, "CACHE_CHARS", 10)
+    exporter = TranscriptExporter("bio")
+    text = pdf_text(exporter.pdf(turns("a long first message", "and a reply")))
+    assert "a long first message" in text
+    assert exporter._pdf is None
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from forest_bounds import OPEN, SETTLED, SettledCheck
+from lookup_table import LEVELS
+from model_registry import CATEGORY_FEATURES
+
+FEATURES = list(CATEGORY_FEATURES.values())
+
+
+def completions(values):
+    """Every way of filling the ``None`` entries of ``values`` with quiz levels."""
+    unknown = [i for i, v in enumerate(values) if v is None]
+    X = np.tile(np.asarray([0 if v is None else v for v in values], dtype=np.float32), (4 ** len(unknown), 1))
+    grid = np.stack(np.meshgrid(*[LEVELS] * len(unknown), indexing="ij"), axis=-1).reshape(-1, len(unknown))
+    X[:, unknown] = grid
+    return X
+
+
+@pytest.mark.parametrize("enumerate_limit", [256, 1])  # 1 forces the per-tree bounds and branch splitting
+def test_settled_check_agrees_with_brute_force(model, evaluator, enumerate_limit):
+    check = SettledCheck(evaluator, enumerate_limit=enumerate_limit)
+    rng = np.random.default_rng(3)
+    states = set()
+    for _ in range(120):
+        values = [int(v) for v in rng.choice(LEVELS, size=len(FEATURES))]
+        for i in rng.choice(len(FEATURES), size=rng.integers(1, 6), replace=False):
+            values[i] = None
+        outcomes = set(model.predict(pd.DataFrame(completions(values), columns=FEATURES)))
+        decision = check.decide(values)
+        states.add(decision.state)
+        if decision.state == SETTLED:
+            assert outcomes == {decision.encoded}
+        elif decision.state == OPEN:
+            assert len(outcomes) > 1
+    assert SETTLED in states and OPEN in states
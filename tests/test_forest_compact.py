@@ -0,0 +1,67 @@
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import LabelEncoder
+
+from forest_bounds import SettledCheck
+from forest_compact import build_compact, compact_forest, open_compact, verify_lattice
+from forest_eval import ForestEvaluator, export_forest
+from lookup_table import LEVELS
+from model_registry import CATEGORY_FEATURES, ModelRegistry
+
+FEATURES = list(CATEGORY_FEATURES.values())
+
+
+@pytest.fixture(scope="module")
+def compact(model):
+    return compact_forest(export_forest(model))
+
+
+def test_compact_forest_matches_on_the_whole_lattice(model, compact):
+    original = export_forest(model)
+    regions, mismatched = verify_lattice(original, compact)
+    assert mismatched == 0 and regions > 0
+    assert compact.n_nodes < original.n_nodes
+    assert set(np.unique(compact.threshold[np.isfinite(compact.threshold)])) <= set(LEVELS[:-1])
+
+    rng = np.random.default_rng(4)
+    X = rng.choice(LEVELS, size=(5000, len(FEATURES)))
+    frame = pd.DataFrame(X, columns=FEATURES)
+    np.testing.assert_array_equal(ForestEvaluator(compact).predict_proba(X), model.predict_proba(frame))
+    np.testing.assert_array_equal(ForestEvaluator(compact).predict(X), model.predict(frame))
+
+
+def test_compact_forest_settles_like_the_original(evaluator, compact):
+    original, shared = SettledCheck(evaluator, enumerate_limit=1), SettledCheck(ForestEvaluator(compact), enumerate_limit=1)
+    rng = np.random.default_rng(5)
+    for _ in range(100):
+        values = [None if rng.random() < 0.3 else int(v) for v in rng.choice(LEVELS, size=len(FEATURES))]
+        a, b = original.decide(values), shared.decide(values)
+        assert (a.state, a.encoded) == (b.state, b.encoded)
+
+
+def test_registry_serves_the_compact_artifact(model, tmp_path):
+    paths = {name: str(tmp_path / name) for name in ("model.pkl", "encoder.pkl", "compact.npz")}
+    joblib.dump(model, paths["model.pkl"])
+    joblib.dump(LabelEncoder().fit([f"career {i}" for i in range(6)]), paths["encoder.pkl"])
+    built = build_compact(paths["model.pkl"], paths["encoder.pkl"], paths["compact.npz"])
+    assert open_compact("some other version", paths["compact.npz"]) is None
+
+    handle = ModelRegistry(paths["model.pkl"], paths["encoder.pkl"], lookup_path=str(tmp_path / "none.bin"),
+                           compact_path=paths["compact.npz"]).handle()
+    assert handle.model is None and handle.version == built.version
+    assert handle.feature_names == FEATURES
+
+    rng = np.random.default_rng(6)
+    X = rng.choice(LEVELS, size=(200, len(FEATURES))).astype(float)
+    frame = pd.DataFrame(X, columns=FEATURES)
+    expected = np.asarray([f"career {i}" for i in model.predict(frame)])
+    np.testing.assert_array_equal(handle.predict_batch(X), expected)
+    assert "full_evaluator" not in handle.__dict__
+
+    # Off the lattice the compact forest does not apply; the pickle is loaded on demand
+    X[0, 0] = 5.5
+    expected[0] = f"career {model.predict(frame.iloc[:1].assign(**{FEATURES[0]: 5.5}))[0]}"
+    np.testing.assert_array_equal(handle.predict_batch(X), expected)
+    assert "full_evaluator" in handle.__dict__
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from forest_eval import BLOCK_SIZE
+from lookup_table import LEVELS
+from model_registry import CATEGORY_FEATURES
+
+FEATURES = list(CATEGORY_FEATURES.values())
+
+
+def sklearn_predict(model, X):
+    frame = pd.DataFrame(np.atleast_2d(X), columns=FEATURES)
+    return model.predict(frame), model.predict_proba(frame)
+
+
+def test_single_vector_matches_sklearn_exactly(model, evaluator):
+    rng = np.random.default_rng(1)
+    for values in rng.choice(LEVELS, size=(50, len(FEATURES))):
+        labels, proba = sklearn_predict(model, values)
+        np.testing.assert_array_equal(evaluator.predict_proba(values.tolist()), proba)
+        np.testing.assert_array_equal(evaluator.predict(values.tolist()), labels)
+
+
+def test_batch_matches_sklearn_exactly(model, evaluator):
+    # More rows than one block, and scores off the lattice as well
+    rng = np.random.default_rng(2)
+    X = np.vstack([rng.choice(LEVELS, size=(BLOCK_SIZE + 300, len(FEATURES))),
+                   rng.uniform(0, 11, size=(500, len(FEATURES)))])
+    labels, proba = sklearn_predict(model, X)
+    np.testing.assert_array_equal(evaluator.predict_proba(X), proba)
+    np.testing.assert_array_equal(evaluator.predict(X), labels)
+
+
+def test_wrong_width_is_rejected(evaluator):
+    with pytest.raises(ValueError):
+        evaluator.predict([4] * (len(FEATURES) - 1))
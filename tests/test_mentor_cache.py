@@ -0,0 +1,47 @@
+from mentor_cache import MentorCache
+from mentor_context import ConversationContext, build_system_prompt, shared_opening
+
+COLUMNS = ["Programming Skills", "Openness", "Hedonism"]
+STUDENTS = [
+    {"name": "Aarav Mehta", "email": "aarav@example.com", "college": "Pune Institute", "city": "Pune",
+     "goal": "Join a robotics startup", "hobbies": "Chess", "country": "India", "scores": [10, 7, 4]},
+    {"name": "Riya Shah", "email": "riya@example.com", "college": "Delhi College", "city": "Delhi",
+     "goal": "Work abroad", "hobbies": "Dance", "country": "India", "scores": [9, 8, 5]},
+]
+PERSONAL = ("name", "email", "college", "city", "goal", "hobbies")
+
+
+def bio(student):
+    return "\n".join(f"{field}: {student[field]}" for field in PERSONAL)
+
+
+def echoing_mentor(messages):
+    """Worst case for privacy: a model that quotes its whole prompt back."""
+    return "\n".join(message["content"] for message in messages)
+
+
+def ask_first_question(cache, student, question):
+    """What the Chatbot page does for a conversation's first question (cache on, no "ask fresh")."""
+    history = [{"role": "user", "content": question}]
+    personal = build_system_prompt("Data Scientist", "", bio(student))  # used for follow-up questions only
+    key, prompt = shared_opening("Data Scientist", COLUMNS, student["scores"], question, student["country"])
+    assert prompt != personal
+    cached = cache.get(key)
+    if cached is not None:
+        return key, cached
+    reply = echoing_mentor(ConversationContext(prompt).build(history)[0])
+    cache.put(key, reply)
+    return key, reply
+
+
+def test_cached_opening_answer_never_carries_another_students_details(tmp_path):
+    cache = MentorCache(str(tmp_path / "mentor.db"))
+    first_key, first = ask_first_question(cache, STUDENTS[0], "Hi! What certifications should I do?")
+    second_key, second = ask_first_question(cache, STUDENTS[1], "what certifications should I do")
+
+    assert first_key == second_key and second == first  # same career, bucketed profile, country, question
+    assert cache.stats()["memory_hits"] == 1
+    for student in STUDENTS:
+        for field in PERSONAL:
+            assert student[field] not in second
+    assert "- Programming Skills: high" in second and "India" in second
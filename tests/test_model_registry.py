@@ -0,0 +1,47 @@
+import os
+
+import joblib
+import pytest
+from sklearn.preprocessing import LabelEncoder
+
+import model_registry
+from model_registry import ModelRegistry
+
+
+@pytest.fixture
+def registry(model, tmp_path):
+    joblib.dump(model, tmp_path / "model.pkl")
+    joblib.dump(LabelEncoder().fit([f"career {i}" for i in range(6)]), tmp_path / "encoder.pkl")
+    return ModelRegistry(str(tmp_path / "model.pkl"), str(tmp_path / "encoder.pkl"),
+                         lookup_path=str(tmp_path / "none.bin"), compact_path=str(tmp_path / "none.npz"))
+
+
+def touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_file_vanishing_while_hashed_keeps_the_previous_model(registry, monkeypatch):
+    assert registry.reload()
+    handle = registry.handle()
+
+    def vanished(*paths):
+        raise FileNotFoundError(paths[0])
+
+    monkeypatch.setattr(model_registry, "model_version", vanished)
+    touch(registry.model_path)
+    assert registry.reload() is False
+    assert registry.handle() is handle and isinstance(registry.last_error, FileNotFoundError)
+
+
+def test_failed_load_is_retried_without_the_files_changing(registry, monkeypatch):
+    def broken(handle):
+        raise EOFError("half-written pickle")
+
+    monkeypatch.setattr(model_registry, "warm_up", broken)
+    assert registry.reload() is False
+    assert registry._handle is None
+
+    monkeypatch.undo()
+    assert registry.reload() is True
+    assert registry._handle is not None and registry.last_error is None
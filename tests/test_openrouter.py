@@ -0,0 +1,77 @@
+import pytest
+
+from mock_openrouter import REPLY, start_mock_server
+from openrouter import OpenRouterClient, OpenRouterError, iter_content, iter_sse_data, stream_chat
+
+MESSAGES = [{"role": "user", "content": "How do I become a data scientist?"}]
+
+
+@pytest.fixture
+def mock():
+    servers = []
+
+    def start(**kwargs):
+        server, url = start_mock_server(**kwargs)
+        servers.append(server)
+        return server, url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def client_for(url, keys=("key-1",)):
+    return OpenRouterClient(list(keys), url=url, backoff_base=0.01, backoff_cap=0.05)
+
+
+def test_events_split_across_reads_are_reassembled(mock):
+    server, url = mock(chunk_bytes=7, delay=0.001)
+    stats = {}
+    pieces = list(stream_chat("key", MESSAGES, url=url, stats=stats))
+    assert "".join(pieces) == REPLY
+    assert len(pieces) == stats["chunks"] > 1
+    assert stats["ttft_ms"] <= stats["total_ms"]
+
+
+def test_stream_stops_at_done():
+    lines = ["data: {\"choices\": [{\"delta\": {\"content\": \"Hi\"}}]}", "", ": keep-alive", "",
+             "data: [DONE]", "", "data: {\"choices\": [{\"delta\": {\"content\": \"late\"}}]}", ""]
+    assert list(iter_content(iter_sse_data(lines))) == ["Hi"]
+
+
+def test_rate_limit_and_server_errors_are_retried(mock):
+    server, url = mock()
+    client = client_for(url)
+    server.fail_with = [429, 503, 502]
+    assert "".join(client.stream_chat(MESSAGES)) == REPLY
+    m = client.metrics()
+    assert (m["requests"], m["attempts"], m["retries"], m["errors"]) == (1, 4, 3, 0)
+
+    server.fail_with = [503] * 10
+    with pytest.raises(OpenRouterError) as error:
+        "".join(client.stream_chat(MESSAGES))
+    assert error.value.status_code == 503
+
+
+def test_rejected_key_fails_over_to_the_next(mock):
+    server, url = mock()
+    server.rejected_keys = {"key-1"}
+    client = client_for(url, keys=("key-1", "key-2"))
+    assert "".join(client.stream_chat(MESSAGES)) == REPLY
+    m = client.metrics()
+    assert (m["failovers"], m["key_errors"], m["keys_cooling"]) == (1, [1, 0], 1)
+
+    # key-1 is parked, so the next request goes straight to key-2
+    assert "".join(client.stream_chat(MESSAGES)) == REPLY
+    assert client.metrics()["attempts"] == m["attempts"] + 1
+
+
+def test_connections_are_reused(mock):
+    server, url = mock()
+    client = client_for(url)
+    for _ in range(5):
+        assert "".join(client.stream_chat(MESSAGES)) == REPLY
+    m = client.metrics()
+    assert (m["connections_opened"], m["connections_reused"]) == (1, 4)
+    assert server.connections == 1
@@ -0,0 +1,54 @@
+import os
+
+import quiz_bank
+from quiz_bank import QuizBank
+
+CSV = "question,option1,option2,option3,answer\n{q},a,b,c,d\n"
+
+
+def write(folder, stem, question):
+    (folder / f"{stem}.csv").write_text(CSV.format(q=question))
+
+
+def test_file_replaced_during_refresh_keeps_previous_bank(tmp_path, monkeypatch):
+    write(tmp_path, "openness", "Old?")
+    write(tmp_path, "hedonism", "Fun?")
+    bank = QuizBank(str(tmp_path), check_interval=0)
+    version, categories = bank.snapshot()
+    assert categories["openness"].questions == ("Old?",)
+
+    # The file is gone between the glob and the stat, as when an editor replaces it
+    write(tmp_path, "openness", "New?")
+    real_stat = os.stat
+    vanished = str(tmp_path / "openness.csv")
+
+    def stat(path, *args, **kwargs):
+        if str(path) == vanished:
+            raise FileNotFoundError(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(quiz_bank.os, "stat", stat)
+    assert bank.snapshot() == (version, categories)
+
+    monkeypatch.setattr(quiz_bank.os, "stat", real_stat)
+    new_version, categories = bank.snapshot()
+    assert new_version != version
+    assert categories["openness"].questions == ("New?",)
+    assert categories["hedonism"].questions == ("Fun?",)
+
+
+def test_unreadable_file_on_first_load_is_skipped(tmp_path, monkeypatch):
+    write(tmp_path, "openness", "Q?")
+    write(tmp_path, "hedonism", "Fun?")
+    real_open = open
+    broken = str(tmp_path / "openness.csv")
+
+    def flaky_open(path, *args, **kwargs):
+        if str(path) == broken:
+            raise PermissionError(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", flaky_open)
+    bank = QuizBank(str(tmp_path), check_interval=0)
+    assert bank.get("Openness") is None
+    assert bank.get("Hedonism").questions == ("Fun?",)
@@ -0,0 +1,85 @@
+import os
+import time
+
+import pytest
+
+from chat_export import render_transcript
+from report_service import DONE, ReportService
+
+
+def pid_bytes():
+    return str(os.getpid()).encode()
+
+
+def payload(size):
+    return b"x" * size
+
+
+def wait(service, job_id):
+    status = service.status(job_id)
+    while status.state in ("pending", "running"):
+        time.sleep(0.01)
+        status = service.status(job_id)
+    assert status.state == DONE, status.error
+    return service.result(job_id)
+
+
+@pytest.fixture
+def service():
+    service = ReportService(workers=2, spool_threshold=1000)
+    service.start()
+    yield service
+    service.shutdown()
+
+
+def test_jobs_with_the_same_affinity_run_on_one_worker(service):
+    pids = {wait(service, service.submit(f"job-{i}", pid_bytes, affinity="session-a")) for i in range(6)}
+    assert len(pids) == 1
+
+
+def test_transcript_exports_extend_the_session_layout(service):
+    service.spool_threshold = 10 ** 6
+    history = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]
+    first = wait(service, service.submit("t-2", render_transcript, "s", "bio", history, affinity="s"))
+    history += [{"role": "user", "content": "More"}]
+    second = wait(service, service.submit("t-3", render_transcript, "s", "bio", history, affinity="s"))
+    assert first.startswith(b"%PDF") and second.startswith(b"%PDF") and len(second) > len(first)
+
+
+def test_large_results_are_served_from_disk(service):
+    with wait(service, service.submit("big", payload, 5000)) as data:
+        assert data.read() == b"x" * 5000
+        assert os.path.dirname(data.name) == service._spool_dir
+    assert wait(service, service.submit("small", payload, 10)) == b"x" * 10
+
+    service.keep_results = 0
+    service._trim()
+    assert os.listdir(service._spool_dir) == []
+
+
+def crash():
+    os._exit(1)
+
+
+def test_a_dead_worker_is_replaced(service):
+    job_id = service.submit("crash", crash, affinity="session-a")
+    status = service.status(job_id)
+    while status.state in ("pending", "running"):
+        time.sleep(0.01)
+        status = service.status(job_id)
+    assert status.state == "failed" and "stopped unexpectedly" in status.error
+
+    # The session's exports are pinned to the dead worker; they run on its replacement
+    assert wait(service, service.submit("after", payload, 10, affinity="session-a")) == b"x" * 10
+    assert wait(service, service.submit("crash", payload, 20, affinity="session-a")) == b"x" * 20
+    assert service.metrics()["restarts"] == 1
+
+
+def test_submit_to_a_pool_that_broke_before_its_callback_ran(service):
+    worker = service._pick_worker("session-b")
+    executor = service._executors[worker]
+    executor.submit(crash)
+    while not executor._broken:
+        time.sleep(0.01)
+    assert wait(service, service.submit("after", payload, 10, affinity="session-b")) == b"x" * 10
+    assert service.metrics()["restarts"] == 1
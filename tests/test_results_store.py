@@ -0,0 +1,77 @@
+import csv
+import threading
+
+import pytest
+
+from results_store import ResultsBackend, SqliteResultsBackend, user_key
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SqliteResultsBackend(str(tmp_path / "results.db"), legacy_csv=None)
+
+
+def save(store, email, career, name="Student", **scores):
+    store.save({"email": email, "name": name}, scores, career)
+
+
+def test_results_backend_is_abstract():
+    with pytest.raises(TypeError):
+        ResultsBackend()
+
+
+def test_user_key_prefers_id_then_email_then_name():
+    assert user_key({"user_id": 7, "email": "a@x", "name": "A"}) == "id:7"
+    assert user_key({"email": " A@X.com ", "name": "A"}) == "email:a@x.com"
+    assert user_key({"email": "", "name": " Ann "}) == "name:ann"
+    assert user_key({}).startswith("anon:")
+
+
+def test_saves_upsert_by_email_and_keep_the_history(store):
+    save(store, "a@x.com", "Data Scientist", Openness=4)
+    save(store, "A@X.com ", "Web Developer", Openness=7)
+    save(store, "b@x.com", "Tester")
+
+    assert store.count() == 2
+    assert store.latest("email:a@x.com")["Predicted Career"] == "Web Developer"
+    assert [r["Openness"] for r in store.history("email:a@x.com")] == [4, 7]
+    attempts = store._connection().execute("SELECT attempts FROM results WHERE user_key = ?",
+                                           ("email:a@x.com",)).fetchone()[0]
+    assert attempts == 2
+
+
+def test_concurrent_writers_lose_nothing(tmp_path):
+    path = str(tmp_path / "results.db")
+    stores = [SqliteResultsBackend(path, legacy_csv=None) for _ in range(2)]  # separate connections, like two processes
+
+    def writer(n):
+        for i in range(50):
+            save(stores[n % 2], f"user{i % 10}@x.com", f"career {n}-{i}")
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert stores[0]._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert stores[0].count() == 10
+    assert sum(len(stores[1].history(f"email:user{i}@x.com")) for i in range(10)) == 300
+
+
+def test_csv_export_round_trips(store, tmp_path):
+    save(store, "a@x.com", "Data Scientist", name="Ann", Openness=4)
+    save(store, "b@x.com", "Tester", name="Ben", Extraversion=10)
+    save(store, "a@x.com", "Web Developer", name="Ann", Openness=7)
+
+    path = tmp_path / "export.csv"
+    assert store.export_csv(str(path)) == 2
+    with open(path, newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert [(r["Full Name"], r["Predicted Career"]) for r in rows] == [("Ann", "Web Developer"), ("Ben", "Tester")]
+    assert rows[0]["Openness"] == "7" and rows[0]["Extraversion"] == "" and rows[1]["Extraversion"] == "10"
+
+    # A fresh database next to a legacy CSV imports it on first run
+    imported = SqliteResultsBackend(str(tmp_path / "new.db"), legacy_csv=str(path))
+    assert imported.count() == 2
+    assert imported.latest("email:a@x.com")["Predicted Career"] == "Web Developer"
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from university_index import UNIVERSITIES_CSV, InstitutionIndex, load_institutions
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def index():
+    return InstitutionIndex(load_institutions(os.path.join(ROOT, UNIVERSITIES_CSV)))
+
+
+@pytest.mark.parametrize("query, expected", [
+    # partial
+    ("savitribai", "Savitribai Phule Pune University"),
+    ("jawahar nehru", "Jawaharlal Nehru University"),
+    ("univ mumbai", "Mumbai University"),
+    ("Banaras Hindu", "Banaras Hindu University"),
+    ("osmania", "Osmania University"),
+    # misspelt
+    ("Savitribai Phule Pune Univrsity", "Savitribai Phule Pune University"),
+    ("Banars Hindu Univ", "Banaras Hindu University"),
+    ("Anna Univeristy", "Anna University"),
+    ("osmnia university", "Osmania University"),
+])
+def test_intended_university_ranks_first(index, query, expected):
+    assert index.search(query)[0] == expected
+
+
+def test_results_are_limited_and_memoized(index):
+    first = index.search("university", limit=5)
+    assert len(first) == 5
+    assert index.search("  UNIVERSITY ", limit=5) is first  # same folded query hits the cache
+    assert index.search("") == index.names[:10]
+
+
+def test_loader_cleans_the_ugc_csv(tmp_path):
+    path = tmp_path / "ugc.csv"
+    path.write_text(",Name,,,\n"
+                    "1,  Anna   University ,,,\n"
+                    "2,anna university,,,\n"
+                    "3,Osmania University,,\n"
+                    "4\n", encoding="utf-8")
+    assert load_institutions(str(path)) == ["Anna University", "Osmania University"]
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import LabelEncoder
+
+from lookup_table import LEVELS
+from model_registry import CATEGORY_FEATURES, ModelHandle
+from what_if import cached_what_if, what_if
+
+
+@pytest.fixture(scope="module")
+def handle(model, evaluator):
+    return ModelHandle(model, LabelEncoder().fit([f"career {i}" for i in range(6)]), "v1", evaluator=evaluator)
+
+
+def sklearn_careers(model, answer_sets):
+    frame = pd.DataFrame(answer_sets).rename(columns=CATEGORY_FEATURES)[list(model.feature_names_in_)]
+    return [f"career {encoded}" for encoded in model.predict(frame)]
+
+
+def test_each_suggested_change_flips_the_prediction(model, handle):
+    rng = np.random.default_rng(7)
+    flipped = 0
+    for _ in range(25):
+        scores = dict(zip(CATEGORY_FEATURES, rng.choice(LEVELS, size=len(CATEGORY_FEATURES)).tolist()))
+        result = what_if(handle, scores)
+        assert result.career == sklearn_careers(model, [scores])[0]
+
+        changes = [(category, level) for category in CATEGORY_FEATURES for level in LEVELS]
+        careers = dict(zip(changes, sklearn_careers(model, [dict(scores, **{c: level}) for c, level in changes])))
+        for flip in result.flips:
+            assert flip.score == scores[flip.category]
+            assert careers[flip.category, flip.level] == flip.career != result.career
+        # Every other change, including every level of a stable category, keeps the career
+        flips = {(flip.category, flip.level) for flip in result.flips}
+        assert all(career == result.career for change, career in careers.items() if change not in flips)
+        assert set(result.stable) == set(CATEGORY_FEATURES) - {category for category, _ in flips}
+        flipped += len(result.flips)
+    assert flipped > 0
+
+
+def test_session_cache_returns_the_same_report(handle):
+    state = {}
+    scores = dict.fromkeys(CATEGORY_FEATURES, 4)
+    first = cached_what_if(state, handle, scores)
+    assert cached_what_if(state, handle, dict(scores)) is first
+    fresh = what_if(handle, scores)
+    assert (fresh.career, fresh.probability, fresh.flips) == (first.career, first.probability, first.flips)
+
+    changed = cached_what_if(state, handle, dict(scores, Openness=10))
+    assert changed is not first
+    reloaded = ModelHandle(handle.model, handle.label_encoder, "v2", evaluator=handle.evaluator)
+    assert cached_what_if(state, reloaded, scores) is not first
@@ -0,0 +1,94 @@
+import threading
+import time
+
+import write_behind
+from results_store import ResultsBackend
+from write_behind import WriteBehindQueue
+
+
+class MemoryBackend(ResultsBackend):
+    """Latest record per user, in write order; ``gate`` holds the worker mid-write."""
+
+    def __init__(self):
+        self.latest = {}
+        self.writes = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.bad = set()
+
+    def save_record(self, key, record):
+        self.save_many([(key, record)])
+
+    def save_many(self, items):
+        self.gate.wait()
+        if any(record.get("Predicted Career") in self.bad for _, record in items):
+            raise ValueError("bad row")
+        for key, record in items:
+            key = key.split(":", 1)[1]  # "email:a@x" -> "a@x"
+            self.latest[key] = record["Predicted Career"]
+            self.writes.append((key, record["Predicted Career"]))
+
+
+def submit(writer, email, career):
+    writer.submit({"email": email}, {}, career)
+
+
+def test_full_queue_never_overwrites_a_newer_result_with_an_older_one():
+    backend = MemoryBackend()
+    writer = WriteBehindQueue(backend, max_queue=1, batch_size=1, flush_interval=0.01)
+    backend.gate.clear()                   # worker stuck on the first write
+    submit(writer, "a@x", "first")
+    time.sleep(0.05)
+    submit(writer, "a@x", "older")         # queue is now full
+
+    # Nothing is pending for c, so it is written directly once the worker's write finishes. "older" is
+    # still queued for a, so "newest" has to wait for room in the queue instead
+    direct = threading.Thread(target=submit, args=(writer, "c@x", "c"))
+    newer = threading.Thread(target=submit, args=(writer, "a@x", "newest"))
+    direct.start()
+    newer.start()
+    time.sleep(0.05)
+    assert direct.is_alive() and newer.is_alive()
+    backend.gate.set()
+    direct.join(2)
+    newer.join(2)
+    writer.close()
+
+    assert backend.latest == {"a@x": "newest", "c@x": "c"}
+    assert [career for key, career in backend.writes if key == "a@x"] == ["first", "older", "newest"]
+    assert writer.metrics()["sync_writes"] >= 1
+
+
+def test_failed_batch_is_retried_row_by_row(monkeypatch):
+    monkeypatch.setattr(write_behind, "RETRY_DELAY", 0)
+    backend = MemoryBackend()
+    backend.bad.add("broken")
+    writer = WriteBehindQueue(backend, batch_size=10, flush_interval=0.01)
+    for i, career in enumerate(["x", "broken", "y"]):
+        submit(writer, f"{i}@x", career)
+    writer.close()
+
+    assert backend.latest == {"0@x": "x", "2@x": "y"}
+    m = writer.metrics()
+    assert (m["written"], m["failed"], m["retried"]) == (2, 1, 3)
+
+
+def test_submit_after_close_is_written():
+    backend = MemoryBackend()
+    writer = WriteBehindQueue(backend)
+    writer.close()
+    submit(writer, "late@x", "late")
+    assert backend.latest == {"late@x": "late"}
+
+
+def test_close_does_not_hang_on_a_full_queue():
+    backend = MemoryBackend()
+    backend.gate.clear()
+    writer = WriteBehindQueue(backend, max_queue=1, batch_size=1, sync_when_full=False)
+    submit(writer, "a@x", "a")
+    time.sleep(0.05)
+    submit(writer, "b@x", "b")
+    started = time.monotonic()
+    writer.close(timeout=0.2)
+    assert time.monotonic() - started < 1
+    backend.gate.set()
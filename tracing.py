@@ -0,0 +1,244 @@
+"""
+Timing spans for page reruns, aggregated into histograms and exported in the
+Prometheus text format.
+
+Each rerun opens a trace tagged with its page and session. ``span("name")``
+blocks inside it (quiz CSV parsing, model load and predict, saving results,
+PDF jobs, OpenRouter calls) are timed and kept on the trace, so the debug
+panel can show where the last rerun's time went. Every span also lands in a
+histogram labelled by span name and page; sessions stay off the labels, since
+one series per visitor would grow without bound. Spans that run outside a
+rerun (the model preload thread, the result writer) are recorded under page
+"-".
+
+Metrics are written to ``metrics.prom`` at most every ``WRITE_INTERVAL``
+seconds (``PATHPILOT_METRICS_FILE``, empty to disable). When
+``PATHPILOT_METRICS_PORT`` is set they are also served on
+``http://127.0.0.1:<port>/metrics``.
+"""
+import contextvars
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_PATH = os.environ.get("PATHPILOT_METRICS_FILE", "metrics.prom")
+METRICS_PORT = os.environ.get("PATHPILOT_METRICS_PORT")
+WRITE_INTERVAL = 10.0
+KEEP_TRACES = 256       # last finished trace per session, for the debug panel
+NO_PAGE = "-"
+
+_current = contextvars.ContextVar("pathpilot_trace", default=None)
+
+
+@dataclass
+class Span:
+    name: str
+    start: float       # seconds after the trace started
+    duration: float
+    depth: int
+
+
+@dataclass
+class Trace:
+    page: str
+    session: str
+    started: float = field(default_factory=time.perf_counter)
+    duration: float = None
+    spans: list = field(default_factory=list)
+    depth: int = 0
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            i = len(self.buckets)
+        self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Tracer:
+    def __init__(self, buckets=BUCKETS, metrics_path=METRICS_PATH, write_interval=WRITE_INTERVAL,
+                 keep_traces=KEEP_TRACES):
+        self.buckets = buckets
+        self.metrics_path = metrics_path
+        self.write_interval = write_interval
+        self.keep_traces = keep_traces
+        self._histograms = {}          # (span, page) -> Histogram
+        self._last = OrderedDict()     # session -> last finished Trace
+        self._written_at = 0.0
+        self._lock = threading.Lock()
+
+    # -----------------------------
+    # TRACES & SPANS
+    # -----------------------------
+    def start(self, page, session):
+        """Open the trace for one rerun on this thread; ``page=None`` reuses the session's last page."""
+        if page is None:
+            last = self._last.get(session)
+            page = last.page if last is not None else NO_PAGE
+        trace = Trace(page, session)
+        _current.set(trace)
+        return trace
+
+    def finish(self, trace):
+        trace.duration = time.perf_counter() - trace.started
+        if _current.get() is trace:
+            _current.set(None)
+        self.record("rerun", trace.duration, trace.page)
+        with self._lock:
+            self._last[trace.session] = trace
+            self._last.move_to_end(trace.session)
+            while len(self._last) > self.keep_traces:
+                self._last.popitem(last=False)
+        self._maybe_write()
+        return trace
+
+    @contextmanager
+    def trace(self, page, session):
+        trace = self.start(page, session)
+        try:
+            yield trace
+        finally:
+            self.finish(trace)
+
+    @contextmanager
+    def span(self, name):
+        trace = _current.get()
+        started = time.perf_counter()
+        if trace is not None:
+            trace.depth += 1
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            if trace is not None:
+                trace.depth -= 1
+                trace.spans.append(Span(name, started - trace.started, duration, trace.depth))
+            self.record(name, duration, trace.page if trace is not None else NO_PAGE)
+
+    def record(self, name, seconds, page=None):
+        """Count a duration measured elsewhere (e.g. a report job finishing in a callback)."""
+        key = (name, page or NO_PAGE)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def last_trace(self, session):
+        with self._lock:
+            return self._last.get(session)
+
+    # -----------------------------
+    # EXPORT
+    # -----------------------------
+    def prometheus(self):
+        lines = ["# HELP pathpilot_span_seconds Time spent in instrumented code paths.",
+                 "# TYPE pathpilot_span_seconds histogram"]
+        with self._lock:
+            items = sorted((key, list(h.counts), h.sum, h.count) for key, h in self._histograms.items())
+        for (name, page), counts, total, count in items:
+            labels = f'span="{_label(name)}",page="{_label(page)}"'
+            cumulative = 0
+            for bound, n in zip((*self.buckets, "+Inf"), counts):
+                cumulative += n
+                lines.append(f'pathpilot_span_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"pathpilot_span_seconds_sum{{{labels}}} {total:.6f}")
+            lines.append(f"pathpilot_span_seconds_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path=None):
+        path = path or self.metrics_path
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(self.prometheus())
+        os.replace(tmp, path)
+
+    def _maybe_write(self):
+        if not self.metrics_path or time.monotonic() - self._written_at < self.write_interval:
+            return
+        self._written_at = time.monotonic()
+        try:
+            self.write()
+        except OSError as e:
+            print(f"⚠️ Could not write {self.metrics_path}: {e}")
+
+
+def active():
+    """Trace open on this thread, or None."""
+    return _current.get()
+
+
+def current_page():
+    """Page of the trace running on this thread, or "-"."""
+    trace = _current.get()
+    return trace.page if trace is not None else NO_PAGE
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    tracer = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.tracer.prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(tracer, port):
+    """Serve ``/metrics`` on 127.0.0.1 from a daemon thread; returns the server."""
+    handler = type("Handler", (_MetricsHandler,), {"tracer": tracer})
+    server = ThreadingHTTPServer(("127.0.0.1", int(port)), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer():
+    """Process-wide tracer; also starts the metrics endpoint when ``PATHPILOT_METRICS_PORT`` is set."""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer()
+            if METRICS_PORT:
+                try:
+                    start_metrics_server(_tracer, METRICS_PORT)
+                except OSError as e:
+                    print(f"⚠️ Metrics endpoint on port {METRICS_PORT} unavailable: {e}")
+    return _tracer
+
+
+def span(name):
+    """``with span("model.predict"):`` - time a block on the current rerun's trace."""
+    return get_tracer().span(name)
@@ -0,0 +1,199 @@
+"""
+Search index for the college / university picker.
+
+The institution list is loaded and normalized once per process (the UGC CSV
+has a malformed header, stray whitespace, trailing commas and duplicates) and
+indexed two ways:
+
+* a token prefix index over a sorted vocabulary, so "ind inst tech" finds
+  "Indian Institute of Technology ..." by walking the rarest token's postings;
+* a character trigram index, used as a typo-tolerant fallback
+  ("Savitribai Phule Pune Univrsity") ranked by shared rare trigrams.
+
+Ids are assigned in display-rank order (shortest name first) and postings are
+sorted, so the first matches found are the best ones and scans stop early.
+Query results are memoized for incremental typing.
+"""
+import bisect
+import csv
+import heapq
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+UNIVERSITIES_CSV = "csv_files/UGC Universities.csv"
+RESULT_LIMIT = 10
+CACHE_SIZE = 4096
+SHORT_PREFIX = 3            # whole-name prefixes up to this length are precomputed
+SHORT_PREFIX_KEEP = 25      # ... keeping this many best ids each
+FUZZY_PROBE_GRAMS = 12      # rarest query trigrams used to find typo matches
+MIN_SIMILARITY = 0.5        # share of probe trigrams a fuzzy match must contain
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def clean_name(raw):
+    """Display form: single spaces, no stray leading/trailing punctuation."""
+    return " ".join(str(raw).split()).strip(" ,;")
+
+
+def fold(text):
+    """Search form: lowercase alphanumerics separated by single spaces."""
+    return _NON_ALNUM.sub(" ", str(text).lower()).strip()
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def load_institutions(path=UNIVERSITIES_CSV):
+    """Unique institution names from the UGC CSV (header row is ",Name,,,,...")."""
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        rows = csv.reader(fh)
+        header = next(rows, [])
+        column = next((i for i, cell in enumerate(header) if cell.strip().lower() == "name"), 1)
+        names, seen = [], set()
+        for row in rows:
+            if len(row) <= column:
+                continue
+            name = clean_name(row[column])
+            key = fold(name)
+            if key and key not in seen:
+                seen.add(key)
+                names.append(name)
+    return names
+
+
+class InstitutionIndex:
+    def __init__(self, names, cache_size=CACHE_SIZE):
+        # Rank order = id order: shorter (more canonical) names first, then alphabetical
+        ranked = sorted({fold(n): n for n in names}.items(), key=lambda kv: (len(kv[0]), kv[0]))
+        self.keys = [k for k, _ in ranked]
+        self.names = [n for _, n in ranked]
+        self.key_tokens = [tuple(k.split()) for k in self.keys]
+
+        postings = {}
+        grams = {}
+        starts = {}
+        for i, key in enumerate(self.keys):
+            for token in set(self.key_tokens[i]):
+                postings.setdefault(token, []).append(i)
+            for gram in trigrams(key):
+                grams.setdefault(gram, []).append(i)
+            # Best ids for very short whole-name prefixes, whose ranges would otherwise be huge
+            for n in range(1, SHORT_PREFIX + 1):
+                best = starts.setdefault(key[:n], [])
+                if len(best) < SHORT_PREFIX_KEEP:
+                    best.append(i)
+
+        self.vocab = sorted(postings)
+        self.postings = [postings[t] for t in self.vocab]
+        self.posting_offsets = [0]
+        for posting in self.postings:
+            self.posting_offsets.append(self.posting_offsets[-1] + len(posting))
+        self.grams = {g: np.asarray(ids, dtype=np.int32) for g, ids in grams.items()}
+        self.short_starts = starts
+        self.sorted_keys = sorted((k, i) for i, k in enumerate(self.keys))
+
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, query, limit=RESULT_LIMIT):
+        """Best ``limit`` display names for ``query`` (whole-name prefix, then token prefix, then fuzzy)."""
+        q = fold(query)
+        if not q:
+            return self.names[:limit]
+        cache_key = (q, limit)
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+
+        ids = self._starts_with(q, limit)
+        for more in (self._token_prefix_matches, self._fuzzy_matches):
+            if len(ids) >= limit:
+                break
+            seen = set(ids)
+            ids += [i for i in more(q, limit + len(ids)) if i not in seen][:limit - len(ids)]
+        result = [self.names[i] for i in ids]
+
+        with self._lock:
+            self._cache[cache_key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    # -----------------------------
+    # PREFIX SEARCH
+    # -----------------------------
+    def _starts_with(self, q, limit):
+        """Best ids whose whole name starts with ``q``."""
+        if len(q) <= SHORT_PREFIX and limit <= SHORT_PREFIX_KEEP:
+            return self.short_starts.get(q, [])[:limit]
+        lo = bisect.bisect_left(self.sorted_keys, (q,))
+        hi = bisect.bisect_left(self.sorted_keys, (q + "\x7f",))
+        return heapq.nsmallest(limit, (i for _, i in self.sorted_keys[lo:hi]))
+
+    def _token_range(self, token):
+        lo = bisect.bisect_left(self.vocab, token)
+        return lo, bisect.bisect_left(self.vocab, token + "\x7f")
+
+    def _token_prefix_matches(self, q, limit):
+        """Best ids where every query token prefixes some token of the name (in any order)."""
+        tokens = set(q.split())
+        ranges = {t: self._token_range(t) for t in tokens}
+        # Drive from the token with the fewest postings; verify the rest per candidate
+        driver = min(tokens, key=lambda t: self.posting_offsets[ranges[t][1]] - self.posting_offsets[ranges[t][0]])
+        lo, hi = ranges[driver]
+        if lo == hi:
+            return []
+        others = [t for t in tokens if t != driver]
+        candidates = self.postings[lo] if hi - lo == 1 else heapq.merge(*self.postings[lo:hi])
+
+        # Postings are sorted by id (= rank), so the first matches found are the best ones
+        matches, last = [], -1
+        for i in candidates:
+            if i == last:
+                continue  # the same name can sit in several merged postings
+            last = i
+            if all(any(kt.startswith(t) for kt in self.key_tokens[i]) for t in others):
+                matches.append(i)
+                if len(matches) == limit:
+                    break
+        return matches
+
+    # -----------------------------
+    # FUZZY (TYPO-TOLERANT) SEARCH
+    # -----------------------------
+    def _fuzzy_matches(self, q, limit):
+        """Rank names by how many of the query's rarest trigrams they share."""
+        known = sorted((g for g in trigrams(q) if g in self.grams), key=lambda g: len(self.grams[g]))
+        probe = known[:FUZZY_PROBE_GRAMS]
+        if not probe:
+            return []
+        counts = np.bincount(np.concatenate([self.grams[g] for g in probe]), minlength=len(self.keys))
+        needed = max(2, MIN_SIMILARITY * len(probe))
+        ids = np.flatnonzero(counts >= needed)
+        # Most shared trigrams first, ties broken by rank (id)
+        order = np.lexsort((ids, -counts[ids]))[:limit]
+        return ids[order].tolist()
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_institution_index(path=UNIVERSITIES_CSV):
+    """Process-wide index over the UGC list, built on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = InstitutionIndex(load_institutions(path))
+    return _index
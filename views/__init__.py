@@ -0,0 +1,5 @@
+"""
+One module per page. app.py imports only the selected page's module and calls
+its ``render(assets)``, so a page's dependencies (the model, PDF rendering,
+the OpenRouter client) are loaded the first time someone opens that page.
+"""
@@ -0,0 +1,200 @@
+"""Chatbot page: the countdown notice, the streaming mentor chat and transcript exports."""
+import time as t
+from datetime import datetime
+
+import requests
+import streamlit as st
+
+from chat_export import jsonl_getter, markdown_getter, render_transcript
+from mentor_cache import get_mentor_cache
+from mentor_context import ConversationContext, build_system_prompt, shared_opening
+from openrouter import OpenRouterError, get_openrouter_client
+from tracing import get_tracer, span
+from views.downloads import report_download
+
+
+def render(assets):
+    # === State Control ===
+    if "warning_acknowledged" not in st.session_state:
+        st.session_state.warning_acknowledged = False
+
+    # === Modal Overlay with Countdown ===
+    if not st.session_state.warning_acknowledged:
+        assets.style("chat_notice")  # sent once; each tick only re-sends the notice markup
+        countdown_container = st.empty()
+
+        for remaining in range(10, 0, -1):
+            assets.html(f"""
+            <div class="warning-overlay">
+                <div class="warning-box">
+                    <div class="warning-title"><span>⚠️</span> Important Notice</div>
+                    <p class="warning-text">
+                        This AI Career Mentor is designed to <b>guide students</b> by providing
+                        <b>career insights and options</b> based on your skills and goals.<br><br>
+                        However, before making <b>any major life decisions</b> or taking adverse steps,
+                        please consult a <b>qualified professional</b> or academic advisor.
+                    </p>
+                    <p class="timer">Auto-closing in {remaining} second{'s' if remaining != 1 else ''}...</p>
+                </div>
+            </div>
+            """, countdown_container)
+            t.sleep(1)
+
+        countdown_container.empty()
+        st.session_state.warning_acknowledged = True
+
+
+        st.toast("Notice acknowledged automatically. Let’s get you career-ready")
+        st.rerun()
+
+
+    # ========== PAGE STYLE ==========
+    assets.style("chat")
+
+    # ========== MAIN UI ==========
+    st.title("PathPilot Mentor")
+    st.info("Welcome to the PathPilot Mentor! Ask me anything about career paths, skills, or job market trends.")
+    st.toast("🚀 Welcome aboard! Your PathPilot Mentor is ready to assist you.", icon="🤖")
+    # === QUIZ VALIDATION ===
+    if "predicted_career" not in st.session_state or st.session_state.predicted_career is None:
+        st.warning("⚠️ Please complete the quiz first!")
+    else:
+        car = st.session_state.get("career_path", st.session_state.get("predicted_career"))
+        user_data = st.session_state.get("user_data")
+        if user_data is None:
+            st.error("User data missing. Please retake the quiz.")
+            st.stop()
+
+        skill_summary = "\n".join([f"- {col}: {val}/10" for col, val in user_data.iloc[0].dropna().items()])
+        user_info = st.session_state.get("user_info", {})
+        user_bio = (
+            f"👤 User Info\n"
+            f"Name: {user_info.get('name', 'Unknown')}\n"
+            f"Age: {user_info.get('age', 'N/A')}\n"
+            f"Location: {user_info.get('city', '')}, {user_info.get('state', '')}, {user_info.get('country', '')}\n"
+            f"Hobbies: {user_info.get('hobbies', 'Not provided')}\n"
+            f"Goal: {user_info.get('goal', 'Not provided')}\n"
+            f"Email: {user_info.get('email', 'Not provided')}\n"
+            f"CGPA: {user_info.get('cgpa', 'Not provided')}\n"
+            f"College: {user_info.get('college', 'Not provided')}\n"
+        )
+
+        st.info(f"🎯 You’ve been matched with: **{car}**")
+        st.caption("Ask anything about your skills, roadmap, certifications, or how to excel in this field.")
+
+        if "chat_history" not in st.session_state:
+            st.session_state.chat_history = []
+
+        # === DISPLAY CHAT ===
+        for msg in st.session_state.chat_history:
+            with st.chat_message(msg["role"]):
+                st.markdown(msg["content"])
+
+        # === CHAT INPUT ===
+        skip_cache = st.toggle("🔄 Always ask the mentor fresh (skip saved answers)", key="mentor_skip_cache")
+        user_input = st.chat_input("Ask your AI career mentor something...")
+
+        if user_input:
+            st.session_state.chat_history.append({"role": "user", "content": user_input})
+
+            # Stable system prefix + rolling summary + recent turns, kept under the token budget
+            system_prompt = build_system_prompt(car, skill_summary, user_bio)
+            context = st.session_state.get("mentor_context")
+            if context is None or context.system_prompt != system_prompt:
+                context = st.session_state.mentor_context = ConversationContext(system_prompt)
+
+            # Opening questions are shared across students with the same career and profile. A shared
+            # answer is written from a prompt without the bio, so it never carries one student's details
+            # to another; with "ask fresh" on, the reply is personal and not cached
+            answer_key, shared = None, False
+            if len(st.session_state.chat_history) == 1:
+                scores = user_data.iloc[0]
+                answer_key, shared_prompt = shared_opening(car, scores.index, scores.tolist(), user_input,
+                                                           user_info.get("country", ""))
+                shared = not skip_cache
+            with span("mentor.context"):
+                messages, context_report = (ConversationContext(shared_prompt) if shared else context).build(
+                    st.session_state.chat_history)
+
+            # Get your API keys from secrets.toml; the client fails over to the second key on errors
+            mentor_client = get_openrouter_client([
+                st.secrets["OPENROUTER_API_KEY"],
+                st.secrets.get("OPENROUTER_API_KEY_2"),
+            ])
+
+            with st.chat_message("user"):
+                st.markdown(user_input)
+
+            started = t.perf_counter()
+            with span("mentor.cache"):
+                cached = get_mentor_cache().get(answer_key, bypass=skip_cache) if answer_key else None
+
+            # Tokens are rendered into the bubble as they arrive
+            stats = dict(context_report)
+            with st.chat_message("assistant"):
+                if cached is not None:
+                    st.markdown(cached)
+                    reply = cached
+                    stats.update(cache="hit", total_ms=(t.perf_counter() - started) * 1000)
+                else:
+                    try:
+                        with span("mentor.stream"):
+                            reply = st.write_stream(mentor_client.stream_chat(messages, stats=stats))
+                    except OpenRouterError as e:
+                        st.error(f"❌ API Error {e.status_code}: {e.body}")
+                        st.stop()
+                    except requests.RequestException as e:
+                        st.error(f"🚨 Network error: {e}")
+                        st.stop()
+
+            reply = (reply if isinstance(reply, str) else "".join(map(str, reply))).strip()
+            if "total_ms" in stats:
+                st.session_state.setdefault("mentor_request_stats", []).append(stats)
+            if "ttft_ms" in stats:
+                get_tracer().record("mentor.first_token", stats["ttft_ms"] / 1000, "Chatbot")
+
+            if not reply:
+                st.warning("⚠️ The mentor didn’t reply. Please try again.")
+            else:
+                st.session_state.chat_history.append({"role": "assistant", "content": reply})
+                if shared and cached is None:
+                    get_mentor_cache().put(answer_key, reply)
+                st.toast("✨ Mentor replied!", icon="💡")
+
+        # === 📄 PDF EXPORT BUTTON ===
+        if st.session_state.chat_history:
+            st.markdown("---")
+
+            # ✅ Mint-styled download button
+            assets.style("chat_download")
+
+            # === PDF renders in the report service (only new turns are laid out); text exports on click ===
+            history = list(st.session_state.chat_history)
+            session_token = st.session_state.session_token
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+            pdf_col, md_col, jsonl_col = st.columns(3)
+            with pdf_col:
+                report_download(
+                    "Chat PDF",
+                    f"AI_Career_Mentor_Chat_{stamp}.pdf",
+                    f"transcript-{session_token}-{len(history)}-{hash(user_bio) & 0xffffffff:x}",
+                    render_transcript, session_token, user_bio, history,
+                    affinity=session_token,  # same worker as the last export: reuses its laid-out transcript
+                )
+            with md_col:
+                st.download_button(
+                    label="📝 Markdown",
+                    data=markdown_getter(history, user_bio),
+                    file_name=f"AI_Career_Mentor_Chat_{stamp}.md",
+                    mime="text/markdown",
+                    on_click="ignore",
+                )
+            with jsonl_col:
+                st.download_button(
+                    label="🧾 JSONL",
+                    data=jsonl_getter(history),
+                    file_name=f"AI_Career_Mentor_Chat_{stamp}.jsonl",
+                    mime="application/jsonl",
+                    on_click="ignore",
+                )
@@ -0,0 +1,60 @@
+"""PDF downloads rendered by the report service (report_service.py), shared by the Quiz and Chatbot pages."""
+import time
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+
+import streamlit as st
+
+from report_service import DONE, PENDING, RUNNING, ServiceBusy, get_report_service
+from tracing import active, get_tracer, span
+
+REPORT_POLL_INTERVAL = 0.3
+
+
+@st.fragment
+def report_download(label, file_name, job_key, render, *args, affinity=None):
+    """Prepare button -> queued render in a worker process -> download button.
+
+    Runs as a fragment so clicking "Prepare" only reruns this panel; while the
+    job renders the script thread just sleeps between status polls. Jobs with the
+    same ``affinity`` render on the same worker (see ``ReportService.submit``).
+    """
+    # A click reruns only this fragment: trace it on its own, under the page of the last full rerun
+    with (nullcontext() if active() else get_tracer().trace(None, st.session_state.session_token)):
+        _report_download(label, file_name, job_key, render, *args, affinity=affinity)
+
+
+def _report_download(label, file_name, job_key, render, *args, affinity=None):
+    service = get_report_service()
+    jobs = st.session_state.setdefault("report_jobs", {})
+    job_id = jobs.get(job_key)
+    if job_id is None:
+        if not st.button(f"📄 Prepare {label}", key=f"prepare_{job_key}"):
+            return
+        try:
+            job_id = jobs[job_key] = service.submit(job_key, render, *args, affinity=affinity)
+        except ServiceBusy:
+            st.warning("⏳ Lots of reports are being prepared right now. Please try again in a few seconds.")
+            return
+        except BrokenProcessPool:  # the replacement worker died on start-up too
+            st.error(f"❌ Could not prepare the {label.lower()}: the report worker is unavailable. Please try again.")
+            return
+
+    progress = st.empty()
+    with span("report.wait"):
+        status = service.status(job_id)
+        while status.state in (PENDING, RUNNING):
+            ahead = f" ({status.position} ahead of you)" if status.position else ""
+            progress.info(f"⏳ Preparing your {label.lower()}...{ahead}")
+            time.sleep(REPORT_POLL_INTERVAL)
+            status = service.status(job_id)
+    progress.empty()
+
+    data = service.result(job_id) if status.state == DONE else None
+    if data is None:
+        del jobs[job_key]  # the next click submits a fresh job
+        st.error(f"❌ Could not prepare the {label.lower()}: {status.error or 'the result expired'}. Please try again.")
+        return
+    with data if hasattr(data, "read") else nullcontext(data) as data:  # large results come as an open file
+        st.download_button(f"⬇️ Download {label}", data=data, file_name=file_name, mime="application/pdf",
+                           on_click="ignore")
@@ -0,0 +1,105 @@
+"""Home page: title, animation and the feature overview."""
+import streamlit as st
+from streamlit_lottie import st_lottie
+
+from asset_cache import get_asset_cache
+
+
+def render(assets):
+    # -------------------------
+    # Config
+    # -------------------------
+    st.set_page_config(page_title="PathPilot", page_icon="🎯", layout="wide")
+
+    # -------------------------
+    # UI
+    # -------------------------
+    assets.style("home")
+
+
+    # -------------------------
+    # Title & Animation
+    # -------------------------
+    assets.html('<p class="big-title">PathPilot – Navigate Your Future with AI</p>')
+    assets.html('<p class="sub-text">Discover your perfect tech career through AI-powered insights</p>')
+
+    # Load the “Wonder Things” animation (memory -> disk cache -> bundled copy; refreshed in the background)
+    lottie_wonder = get_asset_cache().get("wonder_things")
+
+    # -------------------------
+    # Layout section
+    # -------------------------
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        if lottie_wonder:
+            st_lottie(
+                lottie_wonder,
+                speed=1,
+                reverse=False,
+                loop=True,
+                quality="high",
+                height=350,
+                key="wonder_things"
+            )
+        else:
+            st.warning("Animation unavailable 😔")
+
+    with col2:
+        st.markdown("""
+            ### Welcome to **PathPilot – Your AI Career Mentor**
+
+            Discover where **your potential** can take you with **PathPilot**.
+            Using intelligent, data-driven analysis, we help you uncover the career path that fits you best.
+
+            #### What you can do here:
+            - Take a quick **Skill & Personality Quiz**
+            - Get your **AI-Predicted Career Path**
+            - Chat with your **Personal AI Career Mentor**
+            - Explore **Insights, Salaries, and Growth Opportunities**
+
+            No endless forms. No generic advice.  
+            Just your skills, your potential and **AI that actually gets you.**
+            """)
+
+    st.markdown("---")
+
+    # -------------------------
+    # Features Section
+    # -------------------------
+    st.subheader("Why Choose PathPilot?")
+    assets.style("home_features")
+
+    assets.html("""
+    <div class='feature-row'>
+        <div class='feature-box'>
+            <h4>Skill Evaluation</h4>
+            <p>Answer concise, real-world questions and see your technical and soft skills scored instantly on a 1–10 scale.</p>
+        </div>
+        <div class='feature-box'>
+            <h4>AI Career Prediction</h4>
+            <p>PathPilot’s AI model analyzes your strengths to recommend ideal roles — from Data Scientist to Cybersecurity Specialist.</p>
+        </div>
+        <div class='feature-box'>
+            <h4>Smart Career Mentor</h4>
+            <p>Chat with an AI mentor trained on your quiz results — get personalized learning paths, tools, and career insights.</p>
+        </div>
+    </div>
+    """)
+
+    st.markdown("---")
+
+    # -------------------------
+    # Navigation Hint
+    # -------------------------
+    st.info("""
+    ### Getting Started with PathPilot
+    1. Head to the **Quiz** tab and complete the 3-question skill test in each section.  
+    2. Hit **Predict My Career** to see your AI-powered career suggestion.  
+    3. Jump into the **Chatbot** tab to explore advice, learning resources, and your personalized roadmap.  
+
+    **Pro Tip:** All your progress is saved automatically — no resets, no re-entry.
+    """)
+
+    st.markdown("---")
+    st.caption("By **Students**, For **Students**, Driven By **PathPilot**.")
\ No newline at end of file
@@ -0,0 +1,356 @@
+"""Quiz page: profile form, 14 quiz categories, the prediction and the career report."""
+import glob
+import os
+import random
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from career_catalog import get_career_catalog
+from career_report import render_report, report_key
+from model_registry import get_registry
+from page_assets import icon
+from quiz_bank import category_key, get_quiz_bank
+from tracing import span
+from university_index import get_institution_index
+from views.downloads import report_download
+from what_if import cached_what_if
+from write_behind import get_write_behind
+
+
+def save_user_to_csv(user_info, scores, predicted_career):
+    # Queued for a background writer (write_behind.py) that batches upserts into
+    # user_results.db; `python results_store.py export` regenerates user_results.csv
+    with span("results.save"):
+        get_write_behind().submit(user_info, scores, predicted_career)
+
+
+# -----------------------------
+# DATA CLEANING
+# -----------------------------
+def clean_csv_files(folder_path="quiz_data"):
+    for file_path in glob.glob(os.path.join(folder_path, "*.csv")):
+        try:
+            df = pd.read_csv(file_path)
+            # Drop completely empty rows
+            df.dropna(how="all", inplace=True)
+
+            # Trim whitespace and normalize text
+            df = df.applymap(lambda x: str(x).strip() if pd.notna(x) else "")
+
+            # Replace "nan" strings or empty placeholders with actual blanks
+            df.replace(["nan", "NaN", "None", " "], "", inplace=True)
+
+            # Drop rows missing core fields
+            df = df[df["question"].str.len() > 0]
+            df = df[df["answer"].str.len() > 0]
+
+            # Replace missing options with "-"
+            for col in ["option1", "option2", "option3"]:
+                df[col] = df[col].apply(lambda x: x if len(str(x)) > 0 else "—")
+
+            df.to_csv(file_path, index=False)
+            print(f"✅ Cleaned: {file_path}")
+        except Exception as e:
+            print(f"⚠️ Error cleaning {file_path}: {e}")
+
+
+# -----------------------------
+# SCORING
+# -----------------------------
+def calculate_score(correct_answers, user_answers):
+    correct_count = sum([1 for i, ans in enumerate(user_answers) if ans == correct_answers[i]])
+    return [1, 4, 7, 10][correct_count]
+
+# -----------------------------
+# QUESTION HANDLER
+# -----------------------------
+def ask_questions(assets, category, icon_name, quiz, csv_file, bank_version=None):
+    # Category title with its inline SVG icon (built once in page_assets.py)
+    icon_svg = icon(icon_name)
+    assets.html(f"<h3 style='text-align:center;'>{icon_svg} {category}</h3>")
+
+
+    if quiz is None:
+        st.warning(f"⚠️ Missing CSV file: {csv_file}")
+        return None
+
+    # Shuffle & sample (indices into the shared, pre-compiled quiz bank). Samples, shuffles and answers are
+    # keyed on the bank version: after a reload the old indices point at different questions
+    version = (bank_version or "")[:12]
+    sampled_version, sampled = st.session_state.get(f"{category}_sampled", (None, None))
+    if sampled is None or sampled_version != version or any(i >= len(quiz) for i in sampled):
+        sampled = random.sample(range(len(quiz)), k=min(3, len(quiz)))  # true random each session
+        st.session_state[f"{category}_sampled"] = (version, sampled)
+
+    user_answers, correct_answers = [], []
+
+    for i in sampled:
+        question = quiz.questions[i]
+
+        # Keep shuffle consistent using session state
+        unique_key = f"{category}_{i}_options"
+        options_version, options = st.session_state.get(unique_key, (None, None))
+        if options is None or options_version != version:
+            options = list(quiz.options[i])
+            random.shuffle(options)
+            st.session_state[unique_key] = (version, options)
+
+        assets.html(f"<div class='question-box'><b>{question}</b></div>")
+
+        user_ans = st.radio("", options, key=f"{category}_{i}_{version}", index=None)
+        user_answers.append(user_ans)
+        correct_answers.append(quiz.answers[i])
+
+    # If user answered all questions
+    if all(ans is not None for ans in user_answers):
+        return calculate_score(correct_answers, user_answers)
+    return None
+
+
+# -----------------------------
+# WHAT-IF PANEL
+# -----------------------------
+def render_what_if(result):
+    catalog = get_career_catalog()
+    with st.expander("🔀 How settled is this match?", expanded=True):
+        st.caption(f"The model gives **{catalog[result.career].name}** {result.probability:.0%}; the runner-up, "
+                   f"**{catalog[result.runner_up].name}**, gets {result.runner_up_probability:.0%}.")
+        if not result.flips:
+            st.markdown("No change to a single category would give you a different career: this match is robust.")
+            return
+        by_category = {}
+        for flip in result.flips:
+            by_category.setdefault(flip.category, []).append(flip)
+        lines = [f"- **{category}** (you scored {flips[0].score:g}): "
+                 + ", ".join(f"{flip.level} → {catalog[flip.career].name}" for flip in flips)
+                 for category, flips in by_category.items()]
+        st.markdown("Scoring differently in one of these categories would change your match:\n" + "\n".join(lines))
+        st.caption(f"The other {len(result.stable)} categories cannot change it on their own.")
+
+
+def render(assets):
+    # Model and label encoder load in the background while the quiz renders
+    get_registry().preload()
+
+    # -----------------------------
+    # PAGE SETUP
+    # -----------------------------
+    st.set_page_config(page_title="PathPilot | AI Career Path Skill Quiz", page_icon="🎯", layout="wide")
+
+    assets.html("""
+    <script>
+        window.scrollTo({top: 0, behavior: 'smooth'});
+    </script>
+    """)
+
+    st.title("Discover Your AI-Driven Career Path")
+    assets.html("""
+    <p style='text-align:center; font-size:18px; color:#555;'>
+    Answer 3 quick questions per category.<br>
+    Your answers will be automatically scored <b>(1–10)</b> based on accuracy!
+    </p>
+    """)
+
+    assets.style("divider")
+    assets.html('<div class="divider"></div>')
+
+    # -----------------------------
+    # CSS
+    # -----------------------------
+    assets.style("quiz")
+
+    # -----------------------------
+    # USER INFO
+    # -----------------------------
+
+    st.title("Tell Us About Yourself")
+    assets.html("""
+    <p style='text-align:center; font-size:17px; color:#444; line-height:1.6;'>
+    Provide a few quick details so PathPilot can personalize your career insights. <br>
+    Your information is processed locally and never shared externally.
+    </p>
+    """)
+
+    if "user_info" not in st.session_state:
+        st.session_state["user_info"] = {}
+
+
+    # College picker sits outside the form so each search reruns and only the top matches are sent
+    college_query = st.text_input(
+        "Search your College / University",
+        placeholder="e.g., Savitribai Phule Pune University",
+        key="college_query",
+    )
+    college_matches = get_institution_index().search(college_query, limit=10)
+    picked_college = st.selectbox(
+        "Current College / University",
+        options=college_matches,
+        index=0 if college_query and college_matches else None,
+        help="Closest matches to your search (typos are okay)",
+    )
+
+    with st.form("user_info_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            name = st.text_input("Full Name", placeholder="Advait Samant")
+            age = st.number_input("Age", min_value=10, max_value=100, step=1)
+            email = st.text_input("Email Address", placeholder="name@example.com")
+            goal = st.text_input("Career Goal", placeholder="e.g., Become a Data Scientist")
+            college = picked_college or ""
+
+            # If you want to allow "other" entry as well:
+            if st.checkbox("My college is not listed"):
+                college = st.text_input("Enter your College / University manually", placeholder="e.g., XYZ University")
+        with col2:
+            city = st.text_input("City", placeholder="Pune")
+            state = st.text_input("State", placeholder="Maharashtra")
+            country = st.text_input("Country", placeholder="India", value="India")
+            hobbies = st.text_area("Hobbies / Interests", placeholder="e.g., Coding, Gaming, Reading, Traveling")
+            cgpa = st.text_input("CGPA / Academic Score", placeholder="e.g., 7.8 / 9.0")
+
+        submitted = st.form_submit_button("💾 Save My Info")
+        if submitted:
+            st.session_state["user_info"] = {
+                "name": name.strip(),
+                "age": age,
+                "college": college.strip(),
+                "city": city.strip(),
+                "state": state.strip(),
+                "country": country.strip(),
+                "hobbies": hobbies.strip(),
+                "goal": goal.strip(),
+                "email": email.strip(),
+                "cgpa": cgpa.strip()
+            }
+            st.success("✅ Info saved successfully!")
+            st.balloons()
+    assets.style("divider")
+    assets.html('<div class="divider"></div>')
+    # -----------------------------
+    # QUIZ CATEGORIES
+    # -----------------------------
+
+    categories = [
+        ("Computer Architecture", "memory"),     
+        ("Programming Skills", "code"),              
+        ("Project Management", "calendar_check"),       
+        ("Communication Skills", "message_square"),     
+        ("Openness", "globe_2"),                        
+        ("Conscientiousness", "target"),              
+        ("Extraversion", "party_popper"),            
+        ("Agreeableness", "handshake"),                
+        ("Emotional Range", "heart_pulse"),          
+        ("Conversational Skills", "mic"),               
+        ("Openness to Change", "refresh_cw"),           
+        ("Hedonism", "trophy"),                          
+        ("Self-enhancement", "trending_up"),            
+        ("Self-transcendence", "sun"),                  
+    ]
+
+    quiz_folder = "quiz_data"
+    bank_version, quiz_bank = get_quiz_bank(quiz_folder).snapshot()
+    scores = {}
+    finish_slot = st.empty()  # filled in below, once the answers so far settle the prediction
+
+    for name, emoji in categories:
+        csv_path = f"{quiz_folder}/{name.lower().replace(' ', '_')}.csv"
+        scores[name] = ask_questions(assets, name, emoji, quiz_bank.get(category_key(name)), csv_path, bank_version)
+        assets.style("divider")
+        assets.html('<div class="divider"></div>')
+
+    # -----------------------------
+    # PREDICTION
+    # -----------------------------
+    # Shared model + label encoder (loaded once, hot-reloaded when the pickle changes)
+    model_handle = get_registry().handle()
+    if model_handle is None:
+        st.warning("⚠️ Model files not found. Please upload 'career_model.pkl' and 'label_encoder.pkl'.")
+
+    # -----------------------------
+    # EARLY FINISH
+    # -----------------------------
+    # Once no way of answering the remaining categories can change the prediction (forest_bounds.py),
+    # offer to stop here instead of answering every question
+    unanswered = [name for name, score in scores.items() if score is None]
+    settled_career, finish_now = None, False
+    if model_handle is not None and 0 < len(unanswered) < len(scores):
+        with span("quiz.settle"):
+            settled_career = model_handle.settled(scores)
+    if settled_career is not None:
+        with finish_slot.container():
+            st.success(f"🏁 Your answers so far already decide your career match: the remaining "
+                       f"{len(unanswered)} categories can no longer change it.")
+            finish_now = st.button("🏁 Finish now", key="finish_now")
+
+    if st.button("🔮 Predict My Career") or finish_now:
+        if model_handle is None:
+            st.error("Model not loaded. Upload the model files first.")
+        elif finish_now or all(score is not None for score in scores.values()):
+            st.balloons()
+            user_data = pd.DataFrame([{
+                'Computer Architecture': scores["Computer Architecture"],
+                'Programming Skills': scores["Programming Skills"],
+                'Project Management': scores["Project Management"],
+                'Communication skills': scores["Communication Skills"],
+                'Openness': scores["Openness"],
+                'Conscientiousness': scores["Conscientiousness"],
+                'Extraversion': scores["Extraversion"],
+                'Agreeableness': scores["Agreeableness"],
+                'Emotional_Range': scores["Emotional Range"],
+                'Conversation': scores["Conversational Skills"],
+                'Openness to Change': scores["Openness to Change"],
+                'Hedonism': scores["Hedonism"],
+                'Self-enhancement': scores["Self-enhancement"],
+                'Self-transcendence': scores["Self-transcendence"]
+            }])
+
+            st.success("✅ Quiz Completed Successfully!")
+            if finish_now:
+                st.caption(f"Skipped: {', '.join(unanswered)}. They are left out of your scores and report.")
+            st.dataframe(user_data)
+
+            user_data = model_handle.align(user_data)
+            with span("model.predict"):
+                predicted_career = settled_career if finish_now else model_handle.predict_scores(scores)
+            st.session_state.predicted_career = predicted_career
+            st.session_state.user_data = user_data
+            # Save all user info + results to CSV
+            user_info = st.session_state.get("user_info", {})
+            save_user_to_csv(user_info, scores, predicted_career)
+
+            career = get_career_catalog()[predicted_career]
+            career_path = career.name
+            st.session_state.career_path = career_path
+            st.success(f"🎯 Based on your responses, your ideal career path is **{career.name}**!")
+            st.markdown("---")
+            st.info(career.markdown)
+
+            # ==========================
+            # WHAT-IF (every single-category change in one batched predict; what_if.py)
+            # ==========================
+            if not finish_now:  # skipped categories have no score to vary
+                render_what_if(cached_what_if(st.session_state, model_handle, scores))
+
+            # ==========================
+            # PDF REPORT (rendered on click, cached per report)
+            # ==========================
+            if st.session_state.get("predicted_career") is not None:
+                user_info = st.session_state.get("user_info", {})
+                career = get_career_catalog()[st.session_state.predicted_career]
+                user_data = st.session_state.user_data
+
+                assets.style("report_download")
+
+                st.success("✅ Your personalized AI Career Report is ready!")
+                report_scores = list(user_data.iloc[0].dropna().items())  # without skipped categories
+                report_download(
+                    "Career Report",
+                    f"Career_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                    report_key(user_info, report_scores, career),
+                    render_report, dict(user_info), report_scores, career,
+                )
+
+            else:
+                st.warning("⚠️ Unable to determine a suitable career path based on the provided responses. Please ensure all questions are answered accurately.")
@@ -0,0 +1,151 @@
+"""
+What-if sensitivity of a prediction: which single category changes would
+give a different career?
+
+A prediction's score vector is copied once per (category, level) pair, with
+that one category set to 1, 4, 7 or 10, and the copies (plus the vector
+itself) go through the forest in one ``predict_proba`` call: 14 x 4 + 1 = 57
+rows, a couple of milliseconds with the NumPy evaluator. The result lists the
+model's confidence in the career and every single-category change that
+flips it. ``cached_what_if`` keeps the last report in a session's state, so
+reruns with the same answers and model reuse it.
+
+    python what_if.py bench [--model career_model_main.pkl] [--calls 2000] [--threads 4]
+"""
+import argparse
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from lookup_table import LEVELS
+from tracing import span
+
+
+@dataclass(frozen=True)
+class Flip:
+    category: str
+    score: object        # what the student scored
+    level: int           # the score that changes the career
+    career: object       # decoded label it changes to
+    probability: float
+
+
+@dataclass(frozen=True)
+class WhatIf:
+    career: object       # decoded label for the answers as given
+    probability: float
+    runner_up: object
+    runner_up_probability: float
+    flips: tuple         # Flip for every single-category change that changes the career
+    categories: tuple    # every category that was varied, in model feature order
+    seconds: float
+
+    @property
+    def stable(self):
+        """Categories that cannot change the career on their own."""
+        moving = {flip.category for flip in self.flips}
+        return tuple(category for category in self.categories if category not in moving)
+
+
+def variants(base):
+    """(1 + n * len(LEVELS), n) matrix: ``base``, then ``base`` with each feature set to each level."""
+    base = np.asarray(base, dtype=np.float32)
+    n = len(base)
+    X = np.repeat(base[np.newaxis, :], 1 + n * len(LEVELS), axis=0)
+    X[1 + np.arange(n * len(LEVELS)), np.repeat(np.arange(n), len(LEVELS))] = np.tile(LEVELS, n)
+    return X
+
+
+def what_if(handle, scores):
+    """Sensitivity of ``handle``'s prediction for the quiz ``scores`` dict (every category answered)."""
+    from model_registry import CATEGORY_FEATURES
+
+    started = time.perf_counter()
+    base = handle.vector(scores)
+    X = variants(base)
+    if handle.evaluator is not None:
+        proba = handle.evaluator.predict_proba(X)
+    else:
+        import pandas as pd
+
+        proba = handle.model.predict_proba(pd.DataFrame(X, columns=handle.feature_names))
+    winners = np.argmax(proba, axis=1)
+    labels = [handle.decode(encoded) for encoded in np.asarray(handle.classes)[winners]]
+
+    by_feature = {feature: category for category, feature in CATEGORY_FEATURES.items()}
+    categories = tuple(by_feature.get(col, col) for col in handle.feature_names)
+    order = np.argsort(proba[0])[::-1]
+    flips = []
+    for row in np.flatnonzero(winners[1:] != winners[0]) + 1:
+        feature, level = divmod(row - 1, len(LEVELS))
+        flips.append(Flip(categories[feature], base[feature], LEVELS[level], labels[row],
+                          float(proba[row, winners[row]])))
+    return WhatIf(labels[0], float(proba[0, order[0]]), handle.decode(handle.classes[order[1]]),
+                  float(proba[0, order[1]]), tuple(flips), categories, time.perf_counter() - started)
+
+
+def cached_what_if(state, handle, scores):
+    """``what_if`` memoized in ``state`` (a session's state) for the current model version and scores."""
+    key = (handle.version, tuple(handle.vector(scores)))
+    cached = state.get("what_if")
+    if cached is None or cached[0] != key:
+        with span("model.what_if"):
+            cached = state["what_if"] = (key, what_if(handle, scores))
+    return cached[1]
+
+
+# -----------------------------
+# BENCHMARK
+# -----------------------------
+def bench(handle, calls=2000, threads=4, seed=0):
+    """Per-call latency (ms) of ``what_if`` on random answer sets, ``threads`` callers at once."""
+    from model_registry import CATEGORY_FEATURES
+
+    rng = np.random.default_rng(seed)
+    answers = rng.choice(np.asarray(LEVELS), size=(calls, len(CATEGORY_FEATURES)))
+    samples = [[] for _ in range(threads)]
+
+    def worker(index):
+        for row in answers[index::threads]:
+            result = what_if(handle, dict(zip(CATEGORY_FEATURES, row.tolist())))
+            samples[index].append(result.seconds * 1000)
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sorted(ms for chunk in samples for ms in chunk), time.perf_counter() - started
+
+
+def main(argv=None):
+    import joblib
+
+    from forest_eval import ForestEvaluator
+    from model_registry import ENCODER_PATH, ModelHandle
+
+    parser = argparse.ArgumentParser(description="Benchmark the what-if sensitivity report.")
+    parser.add_argument("command", choices=["bench"])
+    parser.add_argument("--model", default="career_model_main.pkl")
+    parser.add_argument("--encoder", default=ENCODER_PATH)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=4, help="concurrent callers")
+    args = parser.parse_args(argv)
+
+    model = joblib.load(args.model)
+    handle = ModelHandle(model, joblib.load(args.encoder), "bench", evaluator=ForestEvaluator.from_model(model))
+    ms, wall = bench(handle, args.calls, args.threads)
+    flips = what_if(handle, dict.fromkeys(handle.feature_names, 4))
+    print(f"{len(ms):,} reports on {args.threads} threads: p50 {statistics.median(ms):.2f} ms, "
+          f"p95 {ms[round(0.95 * (len(ms) - 1))]:.2f} ms, max {ms[-1]:.2f} ms, {len(ms) / wall:,.0f} reports/s")
+    print(f"All-4s profile: {len(flips.flips)} single-category changes flip the career, "
+          f"{len(flips.stable)} of {len(flips.categories)} categories cannot change it alone")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,199 @@
+"""
+Write-behind queue for persisting predictions off the request path.
+
+``submit`` builds the result row and puts it on a bounded in-process queue; a
+single worker thread drains it, batching records into one ``save_many`` call
+whenever ``batch_size`` rows are waiting or ``flush_interval`` seconds have
+passed. Pending rows are flushed on interpreter shutdown. When the queue is
+full the caller writes synchronously (default) if no older record for the same
+user is still waiting, so a stale result can never land on top of a newer one;
+otherwise it waits for space. A batch that fails is retried once and then
+written row by row, so one bad row does not lose the rest.
+"""
+import atexit
+import queue
+import threading
+import time
+from collections import Counter
+
+from results_store import build_record, get_results_store, user_key
+from tracing import get_tracer
+
+MAX_QUEUE = 1000
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 0.5
+RETRY_DELAY = 0.2
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    def __init__(self, backend, max_queue=MAX_QUEUE, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL,
+                 sync_when_full=True):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sync_when_full = sync_when_full
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._pending = Counter()  # user key -> records submitted but not yet written
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.RLock()  # one backend write at a time, worker or caller
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "enqueued": 0, "written": 0, "flushes": 0, "sync_writes": 0, "retried": 0, "failed": 0,
+            "last_flush_ms": 0.0, "max_flush_ms": 0.0, "total_flush_ms": 0.0,
+        }
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="results-write-behind", daemon=True)
+        self._worker.start()
+
+    # -----------------------------
+    # REQUEST PATH
+    # -----------------------------
+    def submit(self, user_info, scores, predicted_career):
+        """Queue one result; returns immediately unless the queue is full."""
+        item = (user_key(user_info), build_record(user_info, scores, predicted_career))
+        with self._pending_lock:
+            self._pending[item[0]] += 1
+        if self._closed:  # the worker is gone (interpreter exit)
+            self._write([item])
+            self._count("sync_writes")
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if self.sync_when_full and self._write_now(item):
+                self._count("sync_writes")
+                return
+            self._queue.put(item)  # wait for the worker to make room
+        self._count("enqueued")
+
+    def _write_now(self, item):
+        """Write ``item`` directly unless an older record for the same user is still waiting for the worker.
+
+        The worker writes under the same lock, so nothing queued after this check can be written first.
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                if self._pending[item[0]] > 1:
+                    return False
+            self._write([item])
+            return True
+
+    # -----------------------------
+    # WORKER
+    # -----------------------------
+    def _run(self):
+        batch, deadline = [], None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                if batch:
+                    self._write(batch)
+                return
+            if item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch, deadline = [], None
+
+    def _write(self, batch):
+        with self._write_lock:
+            try:
+                self._save(batch)
+            finally:
+                with self._pending_lock:
+                    for key, _ in batch:
+                        self._pending[key] -= 1
+                        if self._pending[key] <= 0:
+                            del self._pending[key]
+
+    def _save(self, batch):
+        started = time.perf_counter()
+        lost = 0
+        try:
+            self.backend.save_many(batch)
+        except Exception as e:
+            # Usually transient (a locked database); otherwise one bad row should not take the batch with it
+            print(f"⚠️ Failed to save {len(batch)} result(s), retrying: {e}")
+            self._count("retried", len(batch))
+            time.sleep(RETRY_DELAY)
+            try:
+                self.backend.save_many(batch)
+            except Exception:
+                for item in batch:
+                    try:
+                        self.backend.save_many([item])
+                    except Exception as e:
+                        print(f"⚠️ Dropping result for {item[0]}: {e}")
+                        lost += 1
+                self._count("failed", lost)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        get_tracer().record("results.write", elapsed_ms / 1000)
+        with self._metrics_lock:
+            m = self._metrics
+            m["written"] += len(batch) - lost
+            m["flushes"] += 1
+            m["last_flush_ms"] = elapsed_ms
+            m["max_flush_ms"] = max(m["max_flush_ms"], elapsed_ms)
+            m["total_flush_ms"] += elapsed_ms
+
+    def _count(self, name, n=1):
+        with self._metrics_lock:
+            self._metrics[name] += n
+
+    # -----------------------------
+    # LIFECYCLE & METRICS
+    # -----------------------------
+    def close(self, timeout=10.0):
+        """Flush everything still queued and stop the worker (waits at most about ``timeout`` seconds)."""
+        if self._closed:
+            return
+        self._closed = True
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            print(f"⚠️ Results writer did not drain in {timeout:.0f}s; {self._queue.qsize()} result(s) not saved")
+            return
+        self._worker.join(max(0.0, deadline - time.monotonic()))
+        if self._worker.is_alive():
+            return
+        # Submits that were waiting for room when close() started land behind the stop marker
+        leftover = []
+        while True:
+            try:
+                leftover.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if leftover:
+            self._write(leftover)
+
+    def metrics(self):
+        with self._metrics_lock:
+            m = dict(self._metrics)
+        m["queue_depth"] = self._queue.qsize()
+        m["avg_flush_ms"] = m["total_flush_ms"] / m["flushes"] if m["flushes"] else 0.0
+        return m
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_write_behind():
+    """Process-wide writer in front of ``get_results_store()``; drained at interpreter exit."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = WriteBehindQueue(get_results_store())
+            atexit.register(_writer.close)
+    return _writer